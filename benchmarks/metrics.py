@@ -0,0 +1,86 @@
+"""
+Замер стоимости регистрации одного запроса в статистике Locust: событие events.request на каждый запрос
+против буфера метрик (LOCUST_USER.BUFFERED_METRICS).
+
+Для буфера отдельно выводится стоимость записи (на пути запроса) и стоимость сброса в пересчёте
+на один запрос, а также стоимость записи из другого потока (record_threadsafe) вместе с её разбором при сбросе. В конце проверяется, что оба способа дают одинаковую статистику.
+
+Запуск: python -m benchmarks.metrics
+"""
+import random
+import time
+
+from locust.env import Environment
+
+from tools.locust.metrics import MetricsBuffer
+
+ITERATIONS = 200_000
+
+# Имена запросов, по которым распределяются замеры
+ROUTES = [("GET", "/api/v1/users/{user_id}"), ("GET", "/api/v1/accounts"), ("POST", "/api/v1/operations")]
+
+
+def build_environment() -> Environment:
+    environment = Environment()
+    environment.create_local_runner()
+    return environment
+
+
+def main():
+    samples = [
+        (random.choice(ROUTES), random.lognormvariate(3, 1), random.randint(100, 5000))
+        for _ in range(ITERATIONS)
+    ]
+
+    fire_environment = build_environment()
+    start = time.perf_counter_ns()
+    for (method, route), response_time, response_length in samples:
+        fire_environment.events.request.fire(
+            name=f"{method} {route}",
+            context=None,
+            response=None,
+            exception=None,
+            request_type="HTTP",
+            response_time=response_time,
+            response_length=response_length,
+        )
+    fire_cost = (time.perf_counter_ns() - start) / ITERATIONS / 1000
+
+    buffer_environment = build_environment()
+    buffer = MetricsBuffer(buffer_environment, flush_interval=3600)
+    start = time.perf_counter_ns()
+    for (method, route), response_time, response_length in samples:
+        buffer.record(("HTTP", method, route), response_time, response_length)
+    record_cost = (time.perf_counter_ns() - start) / ITERATIONS / 1000
+
+    start = time.perf_counter_ns()
+    buffer.flush()
+    flush_cost = (time.perf_counter_ns() - start) / ITERATIONS / 1000
+
+    threadsafe_environment = build_environment()
+    threadsafe_buffer = MetricsBuffer(threadsafe_environment, flush_interval=3600)
+    start = time.perf_counter_ns()
+    for (method, route), response_time, response_length in samples:
+        threadsafe_buffer.record_threadsafe(("HTTP", method, route), response_time, response_length)
+    threadsafe_cost = (time.perf_counter_ns() - start) / ITERATIONS / 1000
+
+    start = time.perf_counter_ns()
+    threadsafe_buffer.flush()
+    threadsafe_flush_cost = (time.perf_counter_ns() - start) / ITERATIONS / 1000
+
+    print(f"{'events.request.fire':<32}{fire_cost:>8.2f} µs per request")
+    print(f"{'MetricsBuffer.record':<32}{record_cost:>8.2f} µs per request")
+    print(f"{'MetricsBuffer.flush':<32}{flush_cost:>8.2f} µs per request")
+    print(f"{'MetricsBuffer.record_threadsafe':<32}{threadsafe_cost:>8.2f} µs per request")
+    print(f"{'  + flush':<32}{threadsafe_flush_cost:>8.2f} µs per request")
+
+    fire_total, buffer_total = fire_environment.stats.total, buffer_environment.stats.total
+    assert fire_total.num_requests == buffer_total.num_requests
+    assert fire_total.total_content_length == buffer_total.total_content_length
+    assert fire_total.response_times == buffer_total.response_times
+    assert threadsafe_environment.stats.total.response_times == buffer_total.response_times
+    print("statistics match")
+
+
+if __name__ == '__main__':
+    main()
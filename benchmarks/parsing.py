@@ -0,0 +1,102 @@
+"""
+Замер CPU-стоимости разбора ответов http-gateway в разных режимах GATEWAY_HTTP_CLIENT.PARSING_MODE.
+
+Для каждого типового ответа выполняется разбор и чтение тех полей, которые используют сценарии,
+и выводится процессорное время на один запрос в микросекундах. Режим none действует только на вызовы,
+результат которых отбрасывается, поэтому в его колонке ответ не читается.
+
+Запуск: python -m benchmarks.parsing
+"""
+import base64
+import json
+import os
+import time
+from typing import Any, Callable
+
+from httpx import Response
+
+from clients.http.gateway.accounts.schema import OpenDebitCardAccountResponseSchema
+from clients.http.gateway.documents.schema import GetTariffDocumentResponseSchema
+from clients.http.gateway.operations.schema import GetOperationsResponseSchema
+from clients.http.parsing import parse_response
+from tools.config.http import HTTPResponseParsingMode
+
+ITERATIONS = 2000
+
+
+def build_card(index: int) -> dict:
+    return {
+        "id": f"card-{index}",
+        "pin": "1234",
+        "cvv": "123",
+        "type": "PHYSICAL",
+        "status": "ACTIVE",
+        "accountId": "account-1",
+        "cardNumber": "4111111111111111",
+        "cardHolder": "John Doe",
+        "expiryDate": "2030-01-01",
+        "paymentSystem": "VISA",
+    }
+
+
+def build_operation(index: int) -> dict:
+    return {
+        "id": f"operation-{index}",
+        "type": "PURCHASE",
+        "status": "COMPLETED",
+        "amount": 100.5,
+        "cardId": "card-1",
+        "category": "taxi",
+        "createdAt": "2025-01-01T00:00:00",
+        "accountId": "account-1",
+    }
+
+
+# Ответ, тело ответа в JSON и функция, которая читает поля так же, как сценарии и сидинг
+CASES: list[tuple[str, type, dict, Callable[[Any], Any]]] = [
+    (
+        "open_debit_card_account",
+        OpenDebitCardAccountResponseSchema,
+        {"account": {
+            "id": "account-1", "type": "DEBIT_CARD", "status": "ACTIVE", "balance": 0.0,
+            "cards": [build_card(index) for index in range(2)]
+        }},
+        lambda response: response.account.cards[0].id,
+    ),
+    (
+        "get_operations (100 operations)",
+        GetOperationsResponseSchema,
+        {"operations": [build_operation(index) for index in range(100)]},
+        lambda response: [operation.id for operation in response.operations],
+    ),
+    (
+        "get_tariff_document (256 KB)",
+        GetTariffDocumentResponseSchema,
+        {"tariff": {"url": "http://localhost/tariff.pdf", "document": base64.b64encode(os.urandom(192 * 1024)).decode()}},
+        lambda response: response.tariff.url,
+    ),
+]
+
+
+def measure(response: Response, schema: type, read: Callable[[Any], Any], mode: HTTPResponseParsingMode) -> float:
+    """
+    Возвращает процессорное время на один разбор ответа в микросекундах.
+    """
+    start = time.process_time_ns()
+    for _ in range(ITERATIONS):
+        result = parse_response(response, schema, mode, discard=mode == HTTPResponseParsingMode.NONE)
+        if result is not None:
+            read(result)
+    return (time.process_time_ns() - start) / ITERATIONS / 1000
+
+
+def main():
+    modes = list(HTTPResponseParsingMode)
+    print(f"{'response':<36}" + "".join(f"{mode:>12}" for mode in modes) + "   (CPU µs per request)")
+    for name, schema, payload, read in CASES:
+        response = Response(200, content=json.dumps(payload).encode())
+        print(f"{name:<36}" + "".join(f"{measure(response, schema, read, mode):>12.1f}" for mode in modes))
+
+
+if __name__ == '__main__':
+    main()
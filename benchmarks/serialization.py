@@ -0,0 +1,90 @@
+"""
+Сравнение пропускной способности бэкендов сериализации HTTP-клиентов (GATEWAY_HTTP_CLIENT.SERIALIZER).
+
+Для каждой схемы http-gateway замеряется кодирование тела (model_dump + dumps, как в API-клиентах;
+даты и URL приводятся к строкам, чтобы схемы ответов тоже можно было закодировать),
+полный разбор ответа с валидацией (режим full) и разбор JSON без валидации (режим lazy).
+Выводится количество операций в секунду процессорного времени.
+
+Запуск: python -m benchmarks.serialization
+"""
+import time
+from typing import Callable
+
+from pydantic import BaseModel
+
+from benchmarks.parsing import build_card, build_operation
+from clients.http.gateway.accounts.schema import OpenDebitCardAccountResponseSchema
+from clients.http.gateway.operations.schema import GetOperationsResponseSchema, MakePurchaseOperationRequestSchema
+from clients.http.serializers import get_json_serializer
+from tools.config.http import HTTPSerializer
+
+# Минимальное процессорное время замера одного значения в секундах
+MEASURE_TIME = 0.5
+
+# Название схемы, схема и данные в виде, в котором они передаются по сети
+CASES: list[tuple[str, type[BaseModel], dict]] = [
+    (
+        "MakePurchaseOperationRequestSchema",
+        MakePurchaseOperationRequestSchema,
+        {"status": "COMPLETED", "amount": 100.5, "cardId": "card-1", "accountId": "account-1", "category": "taxi"},
+    ),
+    (
+        "OpenDebitCardAccountResponseSchema",
+        OpenDebitCardAccountResponseSchema,
+        {"account": {
+            "id": "account-1", "type": "DEBIT_CARD", "status": "ACTIVE", "balance": 0.0,
+            "cards": [build_card(index) for index in range(2)]
+        }},
+    ),
+    *[
+        (
+            f"GetOperationsResponseSchema ({count} operations)",
+            GetOperationsResponseSchema,
+            {"operations": [build_operation(index) for index in range(count)]},
+        )
+        for count in (10, 100, 500)
+    ],
+]
+
+
+def measure(function: Callable[[], object]) -> float:
+    """
+    Возвращает количество вызовов функции в секунду процессорного времени.
+    """
+    iterations, elapsed = 0, 0
+    start = time.process_time_ns()
+    while elapsed < MEASURE_TIME * 1_000_000_000:
+        for _ in range(10):
+            function()
+        iterations += 10
+        elapsed = time.process_time_ns() - start
+    return iterations / elapsed * 1_000_000_000
+
+
+def main():
+    backends = list(HTTPSerializer)
+    columns = [f"{operation} {backend}" for operation in ("encode", "full", "lazy") for backend in backends]
+
+    print(f"{'schema':<46}" + "".join(f"{column:>18}" for column in columns) + "   (ops/s)")
+    for name, schema, payload in CASES:
+        model = schema.model_validate(payload)
+        content = get_json_serializer(HTTPSerializer.PYDANTIC).dumps(payload)
+
+        results = []
+        for operation in ("encode", "full", "lazy"):
+            for backend in backends:
+                serializer = get_json_serializer(backend)
+                match operation:
+                    case "encode":
+                        results.append(measure(lambda: serializer.dumps(model.model_dump(by_alias=True, mode="json"))))
+                    case "full":
+                        results.append(measure(lambda: serializer.validate(content, schema)))
+                    case _:
+                        results.append(measure(lambda: serializer.loads(content)))
+
+        print(f"{name:<46}" + "".join(f"{result:>18,.0f}" for result in results))
+
+
+if __name__ == '__main__':
+    main()
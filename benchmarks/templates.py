@@ -0,0 +1,64 @@
+"""
+Замер CPU-стоимости подготовки тела запроса на создание операции с шаблонами и без них
+(GATEWAY_HTTP_CLIENT.REQUEST_TEMPLATES).
+
+Без шаблонов тело собирается так же, как в API-клиенте: создание схемы с фейковыми данными,
+model_dump и сериализация в JSON (её в обычном пути выполняет httpx).
+
+Запуск: python -m benchmarks.templates
+"""
+import json
+import time
+import uuid
+
+from pydantic import BaseModel
+
+from clients.http.gateway.operations.schema import (
+    MakeFeeOperationRequestSchema,
+    MakeTopUpOperationRequestSchema,
+    MakePurchaseOperationRequestSchema,
+    MakeTransferOperationRequestSchema
+)
+from clients.http.templates import get_request_body_template
+
+ITERATIONS = 10000
+
+SCHEMAS: list[type[BaseModel]] = [
+    MakeFeeOperationRequestSchema,
+    MakeTopUpOperationRequestSchema,
+    MakePurchaseOperationRequestSchema,
+    MakeTransferOperationRequestSchema,
+]
+
+
+def measure_schema(schema: type[BaseModel], card_id: str, account_id: str) -> float:
+    start = time.process_time_ns()
+    for _ in range(ITERATIONS):
+        request = schema(card_id=card_id, account_id=account_id)
+        json.dumps(request.model_dump(by_alias=True)).encode()
+    return (time.process_time_ns() - start) / ITERATIONS / 1000
+
+
+def measure_template(schema: type[BaseModel], card_id: str, account_id: str) -> float:
+    template = get_request_body_template(schema, ("card_id", "account_id"), 1024)
+
+    start = time.process_time_ns()
+    for _ in range(ITERATIONS):
+        template.render(card_id=card_id, account_id=account_id)
+    return (time.process_time_ns() - start) / ITERATIONS / 1000
+
+
+def main():
+    card_id, account_id = str(uuid.uuid4()), str(uuid.uuid4())
+
+    print(f"{'request':<40}{'schema':>12}{'template':>12}   (CPU µs per request)")
+    for schema in SCHEMAS:
+        print(
+            f"{schema.__name__:<40}"
+            f"{measure_schema(schema, card_id, account_id):>12.1f}"
+            f"{measure_template(schema, card_id, account_id):>12.1f}"
+        )
+
+
+if __name__ == '__main__':
+    main()
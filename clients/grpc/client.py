@@ -2,7 +2,7 @@
 import grpc.experimental.gevent as grpc_gevent
 
 # Импортируем тип канала связи (channel), через который будем общаться с сервером
-from grpc import Channel
+from grpc import Channel, aio
 
 # Инициализируем поддержку gevent в gRPC.
 # Это обязательно, если вы используете gevent-базированный фреймворк (например, Locust).
@@ -29,3 +29,19 @@ class GRPCClient:
                         Обычно создаётся один раз и переиспользуется.
         """
         self.channel = channel  # Сохраняем канал внутри объекта для последующего использования
+
+
+class AsyncGRPCClient(GRPCClient):
+    """
+    Базовый класс асинхронного gRPC-клиента на основе grpc.aio.
+
+    Хранит aio-канал, через который все наследники выполняют вызовы в event loop'е.
+    """
+
+    channel: aio.Channel
+
+    async def close(self) -> None:
+        """
+        Закрывает aio-канал. Повторный вызов безопасен.
+        """
+        await self.channel.close()
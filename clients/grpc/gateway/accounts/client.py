@@ -1,10 +1,12 @@
-from grpc import Channel
+from grpc import Channel, aio
 from locust.env import Environment
 
-from clients.grpc.client import GRPCClient
+from clients.grpc.client import GRPCClient, AsyncGRPCClient
 from clients.grpc.gateway.client import (
     build_gateway_grpc_client,
-    build_gateway_locust_grpc_client
+    build_gateway_async_grpc_client,
+    build_gateway_locust_grpc_client,
+    build_gateway_async_locust_grpc_client
 )
 from contracts.services.gateway.accounts.accounts_gateway_service_pb2_grpc import AccountsGatewayServiceStub
 from contracts.services.gateway.accounts.rpc_get_accounts_pb2 import GetAccountsRequest, GetAccountsResponse
@@ -26,17 +28,20 @@ from contracts.services.gateway.accounts.rpc_open_savings_account_pb2 import (
 )
 
 
-class AccountsGatewayGRPCClient(GRPCClient):
+class BaseAccountsGatewayGRPCClient(GRPCClient):
     """
-    gRPC-клиент для взаимодействия с AccountsGatewayService.
-    Предоставляет высокоуровневые методы для работы со счетами.
+    Общая часть синхронного и асинхронного gRPC-клиентов AccountsGatewayService:
+    стаб, низкоуровневые вызовы и сборка запросов.
+
+    Методы *_api возвращают результат вызова стаба: ответ в AccountsGatewayGRPCClient
+    и awaitable-вызов grpc.aio в AsyncAccountsGatewayGRPCClient.
     """
 
-    def __init__(self, channel: Channel):
+    def __init__(self, channel: Channel | aio.Channel):
         """
         Инициализация клиента с указанным gRPC-каналом.
 
-        :param channel: gRPC-канал для подключения к AccountsGatewayService.
+        :param channel: gRPC-канал (синхронный или grpc.aio) для подключения к AccountsGatewayService.
         """
         super().__init__(channel)
 
@@ -87,6 +92,13 @@ class AccountsGatewayGRPCClient(GRPCClient):
         """
         return self.stub.OpenCreditCardAccount(request)
 
+
+class AccountsGatewayGRPCClient(BaseAccountsGatewayGRPCClient):
+    """
+    gRPC-клиент для взаимодействия с AccountsGatewayService.
+    Предоставляет высокоуровневые методы для работы со счетами.
+    """
+
     def get_accounts(self, user_id: str) -> GetAccountsResponse:
         request = GetAccountsRequest(user_id=user_id)
         return self.get_accounts_api(request)
@@ -108,16 +120,47 @@ class AccountsGatewayGRPCClient(GRPCClient):
         return self.open_credit_card_account_api(request)
 
 
-def build_accounts_gateway_grpc_client() -> AccountsGatewayGRPCClient:
+class AsyncAccountsGatewayGRPCClient(BaseAccountsGatewayGRPCClient, AsyncGRPCClient):
+    """
+    Асинхронный gRPC-клиент для взаимодействия с AccountsGatewayService.
+    Предоставляет высокоуровневые методы для работы со счетами.
+    """
+
+    async def get_accounts(self, user_id: str) -> GetAccountsResponse:
+        request = GetAccountsRequest(user_id=user_id)
+        return await self.get_accounts_api(request)
+
+    async def open_deposit_account(self, user_id: str) -> OpenDepositAccountResponse:
+        request = OpenDepositAccountRequest(user_id=user_id)
+        return await self.open_deposit_account_api(request)
+
+    async def open_savings_account(self, user_id: str) -> OpenSavingsAccountResponse:
+        request = OpenSavingsAccountRequest(user_id=user_id)
+        return await self.open_savings_account_api(request)
+
+    async def open_debit_card_account(self, user_id: str) -> OpenDebitCardAccountResponse:
+        request = OpenDebitCardAccountRequest(user_id=user_id)
+        return await self.open_debit_card_account_api(request)
+
+    async def open_credit_card_account(self, user_id: str) -> OpenCreditCardAccountResponse:
+        request = OpenCreditCardAccountRequest(user_id=user_id)
+        return await self.open_credit_card_account_api(request)
+
+
+def build_accounts_gateway_grpc_client(channel: Channel | None = None) -> AccountsGatewayGRPCClient:
     """
     Фабрика для создания экземпляра AccountsGatewayGRPCClient.
 
+    :param channel: общий gRPC-канал; если не передан, будет создан новый.
     :return: Инициализированный клиент для AccountsGatewayService.
     """
-    return AccountsGatewayGRPCClient(channel=build_gateway_grpc_client())
+    return AccountsGatewayGRPCClient(channel=channel or build_gateway_grpc_client())
 
 
-def build_accounts_gateway_locust_grpc_client(environment: Environment) -> AccountsGatewayGRPCClient:
+def build_accounts_gateway_locust_grpc_client(
+        environment: Environment,
+        channel: Channel | None = None
+) -> AccountsGatewayGRPCClient:
     """
     Функция создаёт экземпляр AccountsGatewayGRPCClient адаптированного под Locust.
 
@@ -125,6 +168,38 @@ def build_accounts_gateway_locust_grpc_client(environment: Environment) -> Accou
     Используется исключительно в нагрузочных тестах.
 
     :param environment: объект окружения Locust.
+    :param channel: общий gRPC-канал с интерцептором Locust; если не передан, будет получен новый
+        (см. build_gateway_locust_grpc_client).
     :return: экземпляр AccountsGatewayGRPCClient с хуками сбора метрик.
     """
-    return AccountsGatewayGRPCClient(channel=build_gateway_locust_grpc_client(environment))
+    return AccountsGatewayGRPCClient(channel=channel or build_gateway_locust_grpc_client(environment))
+
+
+def build_accounts_gateway_async_grpc_client(channel: aio.Channel | None = None) -> AsyncAccountsGatewayGRPCClient:
+    """
+    Фабрика для создания экземпляра AsyncAccountsGatewayGRPCClient.
+
+    Вызывать нужно внутри работающего event loop'а.
+
+    :param channel: общий grpc.aio-канал; если не передан, будет создан новый.
+    :return: Инициализированный асинхронный клиент для AccountsGatewayService.
+    """
+    return AsyncAccountsGatewayGRPCClient(channel=channel or build_gateway_async_grpc_client())
+
+
+def build_accounts_gateway_async_locust_grpc_client(
+        environment: Environment,
+        channel: aio.Channel | None = None
+) -> AsyncAccountsGatewayGRPCClient:
+    """
+    Функция создаёт экземпляр AsyncAccountsGatewayGRPCClient адаптированного под Locust.
+
+    Клиент выполняется в event loop'е процесса (см. tools.locust.loop) и передаёт метрики в Locust
+    через интерцептор AsyncLocustInterceptor. Вызывать нужно из гринлета, например в on_start.
+
+    :param environment: объект окружения Locust.
+    :param channel: общий grpc.aio-канал с интерцептором Locust; если не передан, будет получен новый
+        (см. build_gateway_async_locust_grpc_client).
+    :return: экземпляр AsyncAccountsGatewayGRPCClient с интерцептором сбора метрик.
+    """
+    return AsyncAccountsGatewayGRPCClient(channel=channel or build_gateway_async_locust_grpc_client(environment))
@@ -1,10 +1,12 @@
-from grpc import Channel
+from grpc import Channel, aio
 from locust.env import Environment
 
-from clients.grpc.client import GRPCClient
+from clients.grpc.client import GRPCClient, AsyncGRPCClient
 from clients.grpc.gateway.client import (
     build_gateway_grpc_client,
-    build_gateway_locust_grpc_client
+    build_gateway_async_grpc_client,
+    build_gateway_locust_grpc_client,
+    build_gateway_async_locust_grpc_client
 )
 from contracts.services.gateway.cards.cards_gateway_service_pb2_grpc import CardsGatewayServiceStub
 from contracts.services.gateway.cards.rpc_issue_virtual_card_pb2 import (
@@ -17,12 +19,20 @@ from contracts.services.gateway.cards.rpc_issue_physical_card_pb2 import (
 )
 
 
-class CardsGatewayGRPCClient(GRPCClient):
-    def __init__(self, channel: Channel):
+class BaseCardsGatewayGRPCClient(GRPCClient):
+    """
+    Общая часть синхронного и асинхронного gRPC-клиентов CardsGatewayService:
+    стаб, низкоуровневые вызовы и сборка запросов.
+
+    Методы *_api возвращают результат вызова стаба: ответ в CardsGatewayGRPCClient
+    и awaitable-вызов grpc.aio в AsyncCardsGatewayGRPCClient.
+    """
+
+    def __init__(self, channel: Channel | aio.Channel):
         """
         Инициализация клиента с указанным gRPC-каналом.
 
-        :param channel: gRPC-канал для подключения к CardsGatewayService.
+        :param channel: gRPC-канал (синхронный или grpc.aio) для подключения к CardsGatewayService.
         """
         super().__init__(channel)
 
@@ -46,6 +56,8 @@ class CardsGatewayGRPCClient(GRPCClient):
         """
         return self.stub.IssuePhysicalCard(request)
 
+
+class CardsGatewayGRPCClient(BaseCardsGatewayGRPCClient):
     def issue_virtual_card(self, user_id: str, account_id: str) -> IssueVirtualCardResponse:
         """
         Получение данных пользователя по его ID.
@@ -69,15 +81,35 @@ class CardsGatewayGRPCClient(GRPCClient):
         return self.issue_physical_card_api(request)
 
 
-def build_cards_gateway_grpc_client() -> CardsGatewayGRPCClient:
+class AsyncCardsGatewayGRPCClient(BaseCardsGatewayGRPCClient, AsyncGRPCClient):
+    async def issue_virtual_card(self, user_id: str, account_id: str) -> IssueVirtualCardResponse:
+        """
+        Асинхронный вариант CardsGatewayGRPCClient.issue_virtual_card.
+        """
+        request = IssueVirtualCardRequest(user_id=user_id, account_id=account_id)
+        return await self.issue_virtual_card_api(request)
+
+    async def issue_physical_card(self, user_id: str, account_id: str) -> IssuePhysicalCardResponse:
+        """
+        Асинхронный вариант CardsGatewayGRPCClient.issue_physical_card.
+        """
+        request = IssuePhysicalCardRequest(user_id=user_id, account_id=account_id)
+        return await self.issue_physical_card_api(request)
+
+
+def build_cards_gateway_grpc_client(channel: Channel | None = None) -> CardsGatewayGRPCClient:
     """
     Фабрика для создания экземпляра CardsGatewayGRPCClient.
 
+    :param channel: общий gRPC-канал; если не передан, будет создан новый.
     :return: Инициализированный клиент для CardsGatewayService.
     """
-    return CardsGatewayGRPCClient(channel=build_gateway_grpc_client())
+    return CardsGatewayGRPCClient(channel=channel or build_gateway_grpc_client())
 
-def build_cards_gateway_locust_grpc_client(environment: Environment) -> CardsGatewayGRPCClient:
+def build_cards_gateway_locust_grpc_client(
+        environment: Environment,
+        channel: Channel | None = None
+) -> CardsGatewayGRPCClient:
     """
     Функция создаёт экземпляр CardsGatewayGRPCClient адаптированного под Locust.
 
@@ -85,6 +117,38 @@ def build_cards_gateway_locust_grpc_client(environment: Environment) -> CardsGat
     Используется исключительно в нагрузочных тестах.
 
     :param environment: объект окружения Locust.
+    :param channel: общий gRPC-канал с интерцептором Locust; если не передан, будет получен новый
+        (см. build_gateway_locust_grpc_client).
     :return: экземпляр CardsGatewayGRPCClient с хуками сбора метрик.
     """
-    return CardsGatewayGRPCClient(channel=build_gateway_locust_grpc_client(environment))
+    return CardsGatewayGRPCClient(channel=channel or build_gateway_locust_grpc_client(environment))
+
+
+def build_cards_gateway_async_grpc_client(channel: aio.Channel | None = None) -> AsyncCardsGatewayGRPCClient:
+    """
+    Фабрика для создания экземпляра AsyncCardsGatewayGRPCClient.
+
+    Вызывать нужно внутри работающего event loop'а.
+
+    :param channel: общий grpc.aio-канал; если не передан, будет создан новый.
+    :return: Инициализированный асинхронный клиент для CardsGatewayService.
+    """
+    return AsyncCardsGatewayGRPCClient(channel=channel or build_gateway_async_grpc_client())
+
+
+def build_cards_gateway_async_locust_grpc_client(
+        environment: Environment,
+        channel: aio.Channel | None = None
+) -> AsyncCardsGatewayGRPCClient:
+    """
+    Функция создаёт экземпляр AsyncCardsGatewayGRPCClient адаптированного под Locust.
+
+    Клиент выполняется в event loop'е процесса (см. tools.locust.loop) и передаёт метрики в Locust
+    через интерцептор AsyncLocustInterceptor. Вызывать нужно из гринлета, например в on_start.
+
+    :param environment: объект окружения Locust.
+    :param channel: общий grpc.aio-канал с интерцептором Locust; если не передан, будет получен новый
+        (см. build_gateway_async_locust_grpc_client).
+    :return: экземпляр AsyncCardsGatewayGRPCClient с интерцептором сбора метрик.
+    """
+    return AsyncCardsGatewayGRPCClient(channel=channel or build_gateway_async_locust_grpc_client(environment))
@@ -1,33 +1,321 @@
-from grpc import Channel, insecure_channel, intercept_channel
+import asyncio
+from functools import cache
+from itertools import count
+
+from gevent import monkey
+from grpc import Channel, Compression, insecure_channel, intercept_channel, aio
 from locust.env import Environment
 from config import settings
-from clients.grpc.interceptors.locust_interceptor import LocustInterceptor
+from clients.grpc.interceptors.deadline_interceptor import DeadlineInterceptor, build_async_deadline_interceptors
+from clients.grpc.interceptors.locust_interceptor import (
+    LocustInterceptor,
+    AsyncLocustInterceptor,
+    ResponseSizeChannel
+)
+from tools.config.grpc import GRPCCompression
+from tools.locust.loop import get_locust_event_loop
+
+# Соответствие настройки GATEWAY_GRPC_CLIENT.COMPRESSION алгоритмам сжатия gRPC
+GRPC_COMPRESSION: dict[GRPCCompression, Compression] = {
+    GRPCCompression.NONE: Compression.NoCompression,
+    GRPCCompression.GZIP: Compression.Gzip,
+    GRPCCompression.DEFLATE: Compression.Deflate,
+}
+
+
+class GRPCChannelPool:
+    """
+    Пул gRPC-каналов с выдачей по кругу (round-robin).
+
+    Каждый канал создаётся с локальным пулом подканалов (grpc.use_local_subchannel_pool),
+    иначе каналы с одинаковыми адресом и параметрами делили бы одно соединение из глобального
+    пула подканалов gRPC. Так пул держит ровно size HTTP/2-соединений, по которым
+    мультиплексируются вызовы всех клиентов, получивших из него канал.
+
+    :param channels: Каналы пула.
+    """
+
+    def __init__(self, channels: list[Channel | aio.Channel]):
+        self.channels = channels
+        self.counter = count()
+
+    def get_channel(self) -> Channel | aio.Channel:
+        """
+        Возвращает следующий канал пула по кругу.
+        """
+        return self.channels[next(self.counter) % len(self.channels)]
+
+    def close(self) -> None:
+        """
+        Закрывает синхронные каналы пула (aio-каналы закрываются в event loop'е через await channel.close()).
+        """
+        for channel in self.channels:
+            channel.close()
+
+
+def build_gateway_grpc_channel_options(local_subchannel_pool: bool = False) -> list[tuple[str, int | str]]:
+    """
+    Возвращает параметры канала к grpc-gateway из настроек GATEWAY_GRPC_CLIENT
+    (keepalive, лимиты размера сообщений, политика балансировки, локальный пул подканалов).
+
+    :param local_subchannel_pool: Включить локальный пул подканалов независимо от настройки
+        (нужно каналам общего пула, иначе они делили бы одно соединение).
+    :return: Список options для insecure_channel().
+    """
+    options = settings.gateway_grpc_client.channel_options
+    if local_subchannel_pool and not settings.gateway_grpc_client.use_local_subchannel_pool:
+        options.append(("grpc.use_local_subchannel_pool", 1))
+
+    return options
+
+
+def build_gateway_grpc_compression() -> Compression:
+    """
+    Возвращает алгоритм сжатия сообщений канала по настройке GATEWAY_GRPC_CLIENT.COMPRESSION.
+    """
+    return GRPC_COMPRESSION[settings.gateway_grpc_client.compression]
+
+
+def build_gateway_grpc_deadline_interceptors() -> list[DeadlineInterceptor]:
+    """
+    Возвращает интерцептор дедлайнов по умолчанию (GATEWAY_GRPC_CLIENT.TIMEOUT и METHOD_TIMEOUTS)
+    или пустой список, если дедлайны не заданы, чтобы не добавлять лишний перехват в каждый вызов.
+    """
+    config = settings.gateway_grpc_client
+    if config.timeout is None and not config.method_timeouts:
+        return []
+
+    return [DeadlineInterceptor(config.method_timeouts, config.timeout)]
+
+
+def build_gateway_async_grpc_deadline_interceptors() -> list[aio.ClientInterceptor]:
+    """
+    То же, что build_gateway_grpc_deadline_interceptors, для канала grpc.aio.
+    """
+    config = settings.gateway_grpc_client
+    if config.timeout is None and not config.method_timeouts:
+        return []
+
+    return build_async_deadline_interceptors(config.method_timeouts, config.timeout)
 
 
 def build_gateway_grpc_client() -> Channel:
     """
     Фабричная функция (билдер) для создания gRPC-канала к сервису grpc-gateway.
 
-    :return: gRPC-канал (Channel), настроенный на адрес localhost:9003.
+    :return: gRPC-канал (Channel), настроенный на адрес и параметры из GATEWAY_GRPC_CLIENT.
+    """
+    # Создаём небезопасное (без TLS) соединение с gRPC-сервером (по умолчанию localhost:9003)
+    channel = insecure_channel(
+        settings.gateway_grpc_client.client_url,
+        options=build_gateway_grpc_channel_options(),
+        compression=build_gateway_grpc_compression()
+    )
+
+    # Без интерцепторов intercept_channel возвращает канал как есть
+    return intercept_channel(channel, *build_gateway_grpc_deadline_interceptors())
+
+
+def build_gateway_async_grpc_client() -> aio.Channel:
+    """
+    Фабричная функция для создания grpc.aio-канала к сервису grpc-gateway.
+
+    Канал нужно создавать внутри работающего event loop'а, в котором он будет использоваться.
+
+    :return: Асинхронный gRPC-канал (grpc.aio.Channel).
+    """
+    return aio.insecure_channel(
+        settings.gateway_grpc_client.client_url,
+        options=build_gateway_grpc_channel_options(),
+        compression=build_gateway_grpc_compression(),
+        interceptors=build_gateway_async_grpc_deadline_interceptors()
+    )
+
+
+@cache
+def build_gateway_locust_grpc_interceptor(environment: Environment) -> LocustInterceptor:
+    """
+    Возвращает один интерцептор LocustInterceptor на процесс: кроме размеров ещё не разобранных
+    ответов, он не хранит состояния вызовов, поэтому его делят все каналы и виртуальные пользователи.
+
+    :param environment: Среда выполнения Locust (необходима для отправки событий).
+    :return: Общий экземпляр LocustInterceptor.
+    """
+    return LocustInterceptor(environment=environment)
+
+
+@cache
+def build_gateway_locust_grpc_channel_pool(environment: Environment) -> GRPCChannelPool:
+    """
+    Возвращает общий для процесса пул каналов к grpc-gateway с интерцептором Locust.
+    Размер пула задаётся настройкой GATEWAY_GRPC_CLIENT.CHANNEL_POOL_SIZE.
+
+    :param environment: Среда выполнения Locust (необходима для отправки событий).
+    :return: Экземпляр GRPCChannelPool.
     """
-    # Создаём небезопасное (без TLS) соединение с gRPC-сервером по адресу localhost:9003
-    return insecure_channel(settings.gateway_grpc_client.client_url)
+    return GRPCChannelPool([
+        create_gateway_locust_grpc_channel(environment, local_subchannel_pool=True)
+        for _ in range(settings.gateway_grpc_client.channel_pool_size)
+    ])
 
 
 def build_gateway_locust_grpc_client(environment: Environment) -> Channel:
     """
-    Фабричная функция для создания gRPC-канала, адаптированного для Locust.
+    Фабричная функция для получения gRPC-канала, адаптированного для Locust.
     В канал автоматически встраивается интерцептор LocustInterceptor,
     который регистрирует вызовы в системе метрик Locust.
 
+    Если GATEWAY_GRPC_CLIENT.CHANNEL_POOL_SIZE больше нуля, канал берётся по кругу из общего
+    пула процесса, и тысячи виртуальных пользователей мультиплексируются по небольшому числу
+    соединений. Иначе создаётся новый канал.
+
     :param environment: Среда выполнения Locust (необходима для отправки событий).
     :return: gRPC-канал с интерцептором, пригодный для нагрузочного тестирования.
     """
-    # Создаём экземпляр интерцептора, передаём в него окружение Locust
-    locust_interceptor = LocustInterceptor(environment=environment)
+    if settings.gateway_grpc_client.channel_pool_size > 0:
+        return build_gateway_locust_grpc_channel_pool(environment).get_channel()
+
+    return create_gateway_locust_grpc_channel(environment)
+
+
+def create_gateway_locust_grpc_channel(environment: Environment, local_subchannel_pool: bool = False) -> Channel:
+    """
+    Создаёт новый gRPC-канал с интерцептором Locust и параметрами из GATEWAY_GRPC_CLIENT.
+
+    :param environment: Среда выполнения Locust.
+    :param local_subchannel_pool: Включить локальный пул подканалов (для каналов общего пула).
+    :return: gRPC-канал с интерцептором.
+    """
+    locust_interceptor = build_gateway_locust_grpc_interceptor(environment)
+
+    # Создаём обычный канал и оборачиваем его для учёта размера ответов на проводе
+    channel = ResponseSizeChannel(
+        insecure_channel(
+            settings.gateway_grpc_client.client_url,
+            options=build_gateway_grpc_channel_options(local_subchannel_pool),
+            compression=build_gateway_grpc_compression()
+        )
+    )
+
+    # Оборачиваем канал интерцепторами, чтобы все запросы проходили через них
+    return intercept_channel(channel, locust_interceptor, *build_gateway_grpc_deadline_interceptors())
+
+
+# grpc.aio-каналы, созданные в event loop'е процесса; закрываются при остановке теста
+async_locust_grpc_channels: list[aio.Channel] = []
+
+
+@cache
+def init_gateway_locust_grpc_aio(environment: Environment) -> None:
+    """
+    Один раз на процесс готовит запуск grpc.aio внутри Locust.
+
+    grpc.aio запускает поток-поллер через threading.Thread, а под gevent-патчем это гринлет, который
+    в потоке event loop'а никогда не запустится, и первый же вызов зависает. Поэтому сценарии на grpc.aio
+    запускаются в процессе Locust без monkey patching: LOCUST_SKIP_MONKEY_PATCH=1 locust ...
+    Runner'ы и виртуальные пользователи Locust работают на gevent напрямую, а все вызовы идут
+    через event loop, поэтому патч стандартной библиотеки им не нужен.
+
+    Каналы закрываются в event loop'е при остановке теста и выходе из Locust, пока интерпретатор
+    ещё работает: иначе они освобождались бы только при его завершении.
+
+    :param environment: Среда выполнения Locust.
+    :raises RuntimeError: Если процесс пропатчен gevent'ом.
+    """
+    if monkey.is_module_patched("threading"):
+        raise RuntimeError(
+            "grpc.aio scenarios require a Locust process without gevent monkey patching, "
+            "run them with LOCUST_SKIP_MONKEY_PATCH=1"
+        )
+
+    environment.events.test_stop.add_listener(lambda **kwargs: close_gateway_async_locust_grpc_channels())
+    environment.events.quitting.add_listener(lambda **kwargs: close_gateway_async_locust_grpc_channels())
+
+
+def close_gateway_async_locust_grpc_channels() -> None:
+    """
+    Закрывает в event loop'е процесса все созданные grpc.aio-каналы.
+    Следующий тест создаст каналы (и общий пул) заново.
+    """
+    channels = list(async_locust_grpc_channels)
+    async_locust_grpc_channels.clear()
+    build_gateway_async_locust_grpc_channel_pool.cache_clear()
+
+    async def close() -> None:
+        await asyncio.gather(*(channel.close() for channel in channels))
+
+    if channels:
+        get_locust_event_loop().run(close())
 
-    # Создаём обычный канал
-    channel = insecure_channel(settings.gateway_grpc_client.client_url)
 
-    # Оборачиваем канал интерцептором, чтобы все запросы проходили через него
-    return intercept_channel(channel, locust_interceptor)
+@cache
+def build_gateway_async_locust_grpc_interceptor(environment: Environment) -> AsyncLocustInterceptor:
+    """
+    Возвращает один интерцептор AsyncLocustInterceptor на процесс.
+
+    :param environment: Среда выполнения Locust (необходима для отправки событий).
+    :return: Общий экземпляр AsyncLocustInterceptor.
+    """
+    return AsyncLocustInterceptor(environment=environment)
+
+
+def build_gateway_async_locust_grpc_client(environment: Environment) -> aio.Channel:
+    """
+    Фабричная функция для создания grpc.aio-канала с интерцептором Locust.
+
+    Канал создаётся в event loop'е процесса (см. tools.locust.loop) и используется только в нём,
+    а вызывать функцию нужно из гринлета, например в on_start виртуального пользователя.
+    Один aio-канал мультиплексирует все вызовы event loop'а, поэтому при
+    GATEWAY_GRPC_CLIENT.CHANNEL_POOL_SIZE больше нуля канал берётся по кругу из общего пула процесса.
+
+    :param environment: Среда выполнения Locust (необходима для отправки событий).
+    :return: grpc.aio-канал с интерцептором, пригодный для нагрузочного тестирования.
+    """
+    if settings.gateway_grpc_client.channel_pool_size > 0:
+        return build_gateway_async_locust_grpc_channel_pool(environment).get_channel()
+
+    return create_gateway_async_locust_grpc_channel(environment)
+
+
+def create_gateway_async_locust_grpc_channel(
+        environment: Environment,
+        local_subchannel_pool: bool = False
+) -> aio.Channel:
+    """
+    Создаёт новый grpc.aio-канал с интерцептором Locust и параметрами из GATEWAY_GRPC_CLIENT
+    в event loop'е процесса.
+
+    :param environment: Среда выполнения Locust.
+    :param local_subchannel_pool: Включить локальный пул подканалов (для каналов общего пула).
+    :return: grpc.aio-канал.
+    """
+    init_gateway_locust_grpc_aio(environment)
+    locust_interceptor = build_gateway_async_locust_grpc_interceptor(environment)
+
+    async def create() -> aio.Channel:
+        channel = aio.insecure_channel(
+            settings.gateway_grpc_client.client_url,
+            options=build_gateway_grpc_channel_options(local_subchannel_pool),
+            compression=build_gateway_grpc_compression(),
+            interceptors=locust_interceptor.interceptors() + build_gateway_async_grpc_deadline_interceptors()
+        )
+        # Интерцепторы grpc.aio встроены в канал, поэтому обёртка для размера ответов снаружи
+        return ResponseSizeChannel(channel)
+
+    channel = get_locust_event_loop().run(create())
+    async_locust_grpc_channels.append(channel)
+    return channel
+
+
+@cache
+def build_gateway_async_locust_grpc_channel_pool(environment: Environment) -> GRPCChannelPool:
+    """
+    Возвращает общий для процесса пул grpc.aio-каналов с интерцептором Locust.
+
+    :param environment: Среда выполнения Locust.
+    :return: Экземпляр GRPCChannelPool с aio-каналами.
+    """
+    return GRPCChannelPool([
+        create_gateway_async_locust_grpc_channel(environment, local_subchannel_pool=True)
+        for _ in range(settings.gateway_grpc_client.channel_pool_size)
+    ])
@@ -1,11 +1,12 @@
-from grpc import Channel
+from grpc import Channel, aio
 from locust.env import Environment
 
-from clients.grpc.client import GRPCClient
+from clients.grpc.client import GRPCClient, AsyncGRPCClient
 from clients.grpc.gateway.client import (
     build_gateway_grpc_client,
-    build_gateway_locust_grpc_client
-
+    build_gateway_async_grpc_client,
+    build_gateway_locust_grpc_client,
+    build_gateway_async_locust_grpc_client
 )
 from contracts.services.gateway.documents.documents_gateway_service_pb2_grpc import DocumentsGatewayServiceStub
 from contracts.services.gateway.documents.rpc_get_contract_document_pb2 import (
@@ -18,17 +19,20 @@ from contracts.services.gateway.documents.rpc_get_tariff_document_pb2 import (
 )
 
 
-class DocumentsGatewayGRPCClient(GRPCClient):
+class BaseDocumentsGatewayGRPCClient(GRPCClient):
     """
-    gRPC-клиент для взаимодействия с DocumentsGatewayService.
-    Предоставляет высокоуровневые методы для работы с документами.
+    Общая часть синхронного и асинхронного gRPC-клиентов DocumentsGatewayService:
+    стаб, низкоуровневые вызовы и сборка запросов.
+
+    Методы *_api возвращают результат вызова стаба: ответ в DocumentsGatewayGRPCClient
+    и awaitable-вызов grpc.aio в AsyncDocumentsGatewayGRPCClient.
     """
 
-    def __init__(self, channel: Channel):
+    def __init__(self, channel: Channel | aio.Channel):
         """
         Инициализация клиента с указанным gRPC-каналом.
 
-        :param channel: gRPC-канал для подключения к DocumentsGatewayService.
+        :param channel: gRPC-канал (синхронный или grpc.aio) для подключения к DocumentsGatewayService.
         """
         super().__init__(channel)
 
@@ -52,6 +56,13 @@ class DocumentsGatewayGRPCClient(GRPCClient):
         """
         return self.stub.GetContractDocument(request)
 
+
+class DocumentsGatewayGRPCClient(BaseDocumentsGatewayGRPCClient):
+    """
+    gRPC-клиент для взаимодействия с DocumentsGatewayService.
+    Предоставляет высокоуровневые методы для работы с документами.
+    """
+
     def get_tariff_document(self, account_id: str) -> GetTariffDocumentResponse:
         request = GetTariffDocumentRequest(account_id=account_id)
         return self.get_tariff_document_api(request)
@@ -61,16 +72,35 @@ class DocumentsGatewayGRPCClient(GRPCClient):
         return self.get_contract_document_api(request)
 
 
-def build_documents_gateway_grpc_client() -> DocumentsGatewayGRPCClient:
+class AsyncDocumentsGatewayGRPCClient(BaseDocumentsGatewayGRPCClient, AsyncGRPCClient):
+    """
+    Асинхронный gRPC-клиент для взаимодействия с DocumentsGatewayService.
+    Предоставляет высокоуровневые методы для работы с документами.
+    """
+
+    async def get_tariff_document(self, account_id: str) -> GetTariffDocumentResponse:
+        request = GetTariffDocumentRequest(account_id=account_id)
+        return await self.get_tariff_document_api(request)
+
+    async def get_contract_document(self, account_id: str) -> GetContractDocumentResponse:
+        request = GetContractDocumentRequest(account_id=account_id)
+        return await self.get_contract_document_api(request)
+
+
+def build_documents_gateway_grpc_client(channel: Channel | None = None) -> DocumentsGatewayGRPCClient:
     """
     Фабрика для создания экземпляра DocumentsGatewayGRPCClient.
 
+    :param channel: общий gRPC-канал; если не передан, будет создан новый.
     :return: Инициализированный клиент для DocumentsGatewayService.
     """
-    return DocumentsGatewayGRPCClient(channel=build_gateway_grpc_client())
+    return DocumentsGatewayGRPCClient(channel=channel or build_gateway_grpc_client())
 
 
-def build_documents_gateway_locust_grpc_client(environment: Environment) -> DocumentsGatewayGRPCClient:
+def build_documents_gateway_locust_grpc_client(
+        environment: Environment,
+        channel: Channel | None = None
+) -> DocumentsGatewayGRPCClient:
     """
     Функция создаёт экземпляр DocumentsGatewayGRPCClient адаптированного под Locust.
 
@@ -78,6 +108,38 @@ def build_documents_gateway_locust_grpc_client(environment: Environment) -> Docu
     Используется исключительно в нагрузочных тестах.
 
     :param environment: объект окружения Locust.
+    :param channel: общий gRPC-канал с интерцептором Locust; если не передан, будет получен новый
+        (см. build_gateway_locust_grpc_client).
     :return: экземпляр DocumentsGatewayGRPCClient с хуками сбора метрик.
     """
-    return DocumentsGatewayGRPCClient(channel=build_gateway_locust_grpc_client(environment))
+    return DocumentsGatewayGRPCClient(channel=channel or build_gateway_locust_grpc_client(environment))
+
+
+def build_documents_gateway_async_grpc_client(channel: aio.Channel | None = None) -> AsyncDocumentsGatewayGRPCClient:
+    """
+    Фабрика для создания экземпляра AsyncDocumentsGatewayGRPCClient.
+
+    Вызывать нужно внутри работающего event loop'а.
+
+    :param channel: общий grpc.aio-канал; если не передан, будет создан новый.
+    :return: Инициализированный асинхронный клиент для DocumentsGatewayService.
+    """
+    return AsyncDocumentsGatewayGRPCClient(channel=channel or build_gateway_async_grpc_client())
+
+
+def build_documents_gateway_async_locust_grpc_client(
+        environment: Environment,
+        channel: aio.Channel | None = None
+) -> AsyncDocumentsGatewayGRPCClient:
+    """
+    Функция создаёт экземпляр AsyncDocumentsGatewayGRPCClient адаптированного под Locust.
+
+    Клиент выполняется в event loop'е процесса (см. tools.locust.loop) и передаёт метрики в Locust
+    через интерцептор AsyncLocustInterceptor. Вызывать нужно из гринлета, например в on_start.
+
+    :param environment: объект окружения Locust.
+    :param channel: общий grpc.aio-канал с интерцептором Locust; если не передан, будет получен новый
+        (см. build_gateway_async_locust_grpc_client).
+    :return: экземпляр AsyncDocumentsGatewayGRPCClient с интерцептором сбора метрик.
+    """
+    return AsyncDocumentsGatewayGRPCClient(channel=channel or build_gateway_async_locust_grpc_client(environment))
@@ -1,17 +1,40 @@
+import inspect
+
 from locust import TaskSet, SequentialTaskSet
 
 # Импортируем типы и билдеры для построения HTTP API клиентов
-from clients.grpc.gateway.accounts.client import AccountsGatewayGRPCClient, build_accounts_gateway_locust_grpc_client
-from clients.grpc.gateway.cards.client import CardsGatewayGRPCClient, build_cards_gateway_locust_grpc_client
+from clients.grpc.gateway.client import build_gateway_locust_grpc_client, build_gateway_async_locust_grpc_client
+from clients.grpc.gateway.accounts.client import (
+    AccountsGatewayGRPCClient,
+    AsyncAccountsGatewayGRPCClient,
+    build_accounts_gateway_locust_grpc_client,
+    build_accounts_gateway_async_locust_grpc_client
+)
+from clients.grpc.gateway.cards.client import (
+    CardsGatewayGRPCClient,
+    AsyncCardsGatewayGRPCClient,
+    build_cards_gateway_locust_grpc_client,
+    build_cards_gateway_async_locust_grpc_client
+)
 from clients.grpc.gateway.documents.client import (
     DocumentsGatewayGRPCClient,
-    build_documents_gateway_locust_grpc_client
+    AsyncDocumentsGatewayGRPCClient,
+    build_documents_gateway_locust_grpc_client,
+    build_documents_gateway_async_locust_grpc_client
 )
 from clients.grpc.gateway.operations.client import (
     OperationsGatewayGRPCClient,
-    build_operations_gateway_locust_grpc_client
+    AsyncOperationsGatewayGRPCClient,
+    build_operations_gateway_locust_grpc_client,
+    build_operations_gateway_async_locust_grpc_client
 )
-from clients.grpc.gateway.users.client import UsersGatewayGRPCClient, build_users_gateway_locust_grpc_client
+from clients.grpc.gateway.users.client import (
+    UsersGatewayGRPCClient,
+    AsyncUsersGatewayGRPCClient,
+    build_users_gateway_locust_grpc_client,
+    build_users_gateway_async_locust_grpc_client
+)
+from tools.locust.user import AsyncLocustBaseUser
 
 
 class GatewayGRPCTaskSet(TaskSet):
@@ -34,11 +57,14 @@ class GatewayGRPCTaskSet(TaskSet):
         Метод вызывается перед запуском задач TaskSet.
         Здесь создаются API клиенты с использованием контекста окружения Locust.
         """
-        self.users_gateway_client = build_users_gateway_locust_grpc_client(self.user.environment)
-        self.cards_gateway_client = build_cards_gateway_locust_grpc_client(self.user.environment)
-        self.accounts_gateway_client = build_accounts_gateway_locust_grpc_client(self.user.environment)
-        self.documents_gateway_client = build_documents_gateway_locust_grpc_client(self.user.environment)
-        self.operations_gateway_client = build_operations_gateway_locust_grpc_client(self.user.environment)
+        # Все клиенты виртуального пользователя работают через один канал (из общего пула процесса)
+        channel = build_gateway_locust_grpc_client(self.user.environment)
+
+        self.users_gateway_client = build_users_gateway_locust_grpc_client(self.user.environment, channel)
+        self.cards_gateway_client = build_cards_gateway_locust_grpc_client(self.user.environment, channel)
+        self.accounts_gateway_client = build_accounts_gateway_locust_grpc_client(self.user.environment, channel)
+        self.documents_gateway_client = build_documents_gateway_locust_grpc_client(self.user.environment, channel)
+        self.operations_gateway_client = build_operations_gateway_locust_grpc_client(self.user.environment, channel)
 
 
 class GatewayGRPCSequentialTaskSet(SequentialTaskSet):
@@ -58,8 +84,57 @@ class GatewayGRPCSequentialTaskSet(SequentialTaskSet):
         """
         Создание API клиентов для последовательного сценария.
         """
-        self.users_gateway_client = build_users_gateway_locust_grpc_client(self.user.environment)
-        self.cards_gateway_client = build_cards_gateway_locust_grpc_client(self.user.environment)
-        self.accounts_gateway_client = build_accounts_gateway_locust_grpc_client(self.user.environment)
-        self.documents_gateway_client = build_documents_gateway_locust_grpc_client(self.user.environment)
-        self.operations_gateway_client = build_operations_gateway_locust_grpc_client(self.user.environment)
+        # Все клиенты виртуального пользователя работают через один канал (из общего пула процесса)
+        channel = build_gateway_locust_grpc_client(self.user.environment)
+
+        self.users_gateway_client = build_users_gateway_locust_grpc_client(self.user.environment, channel)
+        self.cards_gateway_client = build_cards_gateway_locust_grpc_client(self.user.environment, channel)
+        self.accounts_gateway_client = build_accounts_gateway_locust_grpc_client(self.user.environment, channel)
+        self.documents_gateway_client = build_documents_gateway_locust_grpc_client(self.user.environment, channel)
+        self.operations_gateway_client = build_operations_gateway_locust_grpc_client(self.user.environment, channel)
+
+
+class AsyncGatewayGRPCTaskSet(TaskSet):
+    """
+    Базовый TaskSet для асинхронных gRPC-сценариев на grpc.aio, работающих с grpc-gateway.
+
+    Используется вместе с AsyncLocustBaseUser. Задачи объявляются как async def и выполняются
+    в event loop'е процесса, а все вызовы в полёте обслуживает один loop, а не гринлет на каждый вызов.
+    Синхронные задачи по-прежнему поддерживаются.
+
+    Процесс Locust должен быть запущен без monkey patching (LOCUST_SKIP_MONKEY_PATCH=1),
+    см. init_gateway_locust_grpc_aio.
+    """
+
+    user: AsyncLocustBaseUser
+
+    users_gateway_client: AsyncUsersGatewayGRPCClient
+    cards_gateway_client: AsyncCardsGatewayGRPCClient
+    accounts_gateway_client: AsyncAccountsGatewayGRPCClient
+    documents_gateway_client: AsyncDocumentsGatewayGRPCClient
+    operations_gateway_client: AsyncOperationsGatewayGRPCClient
+
+    def on_start(self) -> None:
+        """
+        Создание асинхронных API клиентов поверх одного aio-канала (из общего пула процесса).
+        """
+        channel = build_gateway_async_locust_grpc_client(self.user.environment)
+
+        self.users_gateway_client = build_users_gateway_async_locust_grpc_client(self.user.environment, channel)
+        self.cards_gateway_client = build_cards_gateway_async_locust_grpc_client(self.user.environment, channel)
+        self.accounts_gateway_client = build_accounts_gateway_async_locust_grpc_client(self.user.environment, channel)
+        self.documents_gateway_client = build_documents_gateway_async_locust_grpc_client(
+            self.user.environment, channel
+        )
+        self.operations_gateway_client = build_operations_gateway_async_locust_grpc_client(
+            self.user.environment, channel
+        )
+
+    def execute_task(self, task) -> None:
+        """
+        Выполняет задачу: корутины отправляются в event loop процесса, обычные функции — как в TaskSet.
+        """
+        if inspect.iscoroutinefunction(task):
+            self.user.run_coroutine(task(self))
+        else:
+            super().execute_task(task)
@@ -1,10 +1,12 @@
-from grpc import Channel
+from grpc import Channel, aio
 from locust.env import Environment
 
-from clients.grpc.client import GRPCClient
+from clients.grpc.client import GRPCClient, AsyncGRPCClient
 from clients.grpc.gateway.client import (
     build_gateway_grpc_client,
-    build_gateway_locust_grpc_client
+    build_gateway_async_grpc_client,
+    build_gateway_locust_grpc_client,
+    build_gateway_async_locust_grpc_client
 )
 
 from contracts.services.gateway.operations.operations_gateway_service_pb2_grpc import OperationsGatewayServiceStub
@@ -51,17 +53,20 @@ from contracts.services.operations.operation_pb2 import OperationStatus
 from tools.fakers import fake
 
 
-class OperationsGatewayGRPCClient(GRPCClient):
+class BaseOperationsGatewayGRPCClient(GRPCClient):
     """
-    gRPC-клиент для взаимодействия с OperationsGatewayService.
-    Предоставляет высокоуровневые методы для работы с документами.
+    Общая часть синхронного и асинхронного gRPC-клиентов OperationsGatewayService:
+    стаб, низкоуровневые вызовы и сборка запросов.
+
+    Методы *_api возвращают результат вызова стаба: ответ в OperationsGatewayGRPCClient
+    и awaitable-вызов grpc.aio в AsyncOperationsGatewayGRPCClient.
     """
 
-    def __init__(self, channel: Channel):
+    def __init__(self, channel: Channel | aio.Channel):
         """
         Инициализация клиента с указанным gRPC-каналом.
 
-        :param channel: gRPC-канал для подключения к OperationsGatewayService.
+        :param channel: gRPC-канал (синхронный или grpc.aio) для подключения к OperationsGatewayService.
         """
         super().__init__(channel)
 
@@ -168,6 +173,99 @@ class OperationsGatewayGRPCClient(GRPCClient):
         """
         return self.stub.MakeCashWithdrawalOperation(request)
 
+    def build_make_fee_operation_request(self, card_id: str, account_id: str) -> MakeFeeOperationRequest:
+        """
+        Создаёт запрос MakeFeeOperationRequest со сгенерированными данными.
+        """
+        return MakeFeeOperationRequest(
+            status=fake.proto_enum(OperationStatus),
+            amount=fake.amount(),
+            card_id=card_id,
+            account_id=account_id
+        )
+
+    def build_make_top_up_operation_request(self, card_id: str, account_id: str) -> MakeTopUpOperationRequest:
+        """
+        Создаёт запрос MakeTopUpOperationRequest со сгенерированными данными.
+        """
+        return MakeTopUpOperationRequest(
+            status=fake.proto_enum(OperationStatus),
+            amount=fake.amount(),
+            card_id=card_id,
+            account_id=account_id
+        )
+
+    def build_make_cashback_operation_request(self, card_id: str, account_id: str) -> MakeCashbackOperationRequest:
+        """
+        Создаёт запрос MakeCashbackOperationRequest со сгенерированными данными.
+        """
+        return MakeCashbackOperationRequest(
+            status=fake.proto_enum(OperationStatus),
+            amount=fake.amount(),
+            card_id=card_id,
+            account_id=account_id
+        )
+
+    def build_make_transfer_operation_request(self, card_id: str, account_id: str) -> MakeTransferOperationRequest:
+        """
+        Создаёт запрос MakeTransferOperationRequest со сгенерированными данными.
+        """
+        return MakeTransferOperationRequest(
+            status=fake.proto_enum(OperationStatus),
+            amount=fake.amount(),
+            card_id=card_id,
+            account_id=account_id
+        )
+
+    def build_make_purchase_operation_request(self, card_id: str, account_id: str) -> MakePurchaseOperationRequest:
+        """
+        Создаёт запрос MakePurchaseOperationRequest со сгенерированными данными.
+        """
+        return MakePurchaseOperationRequest(
+            status=fake.proto_enum(OperationStatus),
+            amount=fake.amount(),
+            card_id=card_id,
+            account_id=account_id,
+            category=fake.category()
+        )
+
+    def build_make_bill_payment_operation_request(
+            self,
+            card_id: str,
+            account_id: str
+    ) -> MakeBillPaymentOperationRequest:
+        """
+        Создаёт запрос MakeBillPaymentOperationRequest со сгенерированными данными.
+        """
+        return MakeBillPaymentOperationRequest(
+            status=fake.proto_enum(OperationStatus),
+            amount=fake.amount(),
+            card_id=card_id,
+            account_id=account_id,
+        )
+
+    def build_make_cash_withdrawal_operation_request(
+            self,
+            card_id: str,
+            account_id: str
+    ) -> MakeCashWithdrawalOperationRequest:
+        """
+        Создаёт запрос MakeCashWithdrawalOperationRequest со сгенерированными данными.
+        """
+        return MakeCashWithdrawalOperationRequest(
+            status=fake.proto_enum(OperationStatus),
+            amount=fake.amount(),
+            card_id=card_id,
+            account_id=account_id,
+        )
+
+
+class OperationsGatewayGRPCClient(BaseOperationsGatewayGRPCClient):
+    """
+    gRPC-клиент для взаимодействия с OperationsGatewayService.
+    Предоставляет высокоуровневые методы для работы с документами.
+    """
+
     def get_operation(self, operation_id: str) -> GetOperationResponse:
         """
         Получение данных операции по её ID.
@@ -216,12 +314,7 @@ class OperationsGatewayGRPCClient(GRPCClient):
         :param account_id: Идентификатор счета.
         :return: Ответ с информацией по операции.
         """
-        request = MakeFeeOperationRequest(
-            status=fake.proto_enum(OperationStatus),
-            amount=fake.amount(),
-            card_id=card_id,
-            account_id=account_id
-        )
+        request = self.build_make_fee_operation_request(card_id=card_id, account_id=account_id)
         return self.make_fee_operation_api(request)
 
     def make_top_up_operation(self, card_id: str, account_id: str) -> MakeTopUpOperationResponse:
@@ -232,12 +325,7 @@ class OperationsGatewayGRPCClient(GRPCClient):
         :param account_id: Идентификатор счета.
         :return: Ответ с информацией по операции.
         """
-        request = MakeTopUpOperationRequest(
-            status=fake.proto_enum(OperationStatus),
-            amount=fake.amount(),
-            card_id=card_id,
-            account_id=account_id
-        )
+        request = self.build_make_top_up_operation_request(card_id=card_id, account_id=account_id)
         return self.make_top_up_operation_api(request)
 
     def make_cashback_operation(self, card_id: str, account_id: str) -> MakeCashbackOperationResponse:
@@ -248,12 +336,7 @@ class OperationsGatewayGRPCClient(GRPCClient):
         :param account_id: Идентификатор счета.
         :return: Ответ с информацией по операции.
         """
-        request = MakeCashbackOperationRequest(
-            status=fake.proto_enum(OperationStatus),
-            amount=fake.amount(),
-            card_id=card_id,
-            account_id=account_id
-        )
+        request = self.build_make_cashback_operation_request(card_id=card_id, account_id=account_id)
         return self.make_cashback_operation_api(request)
 
     def make_transfer_operation(self, card_id: str, account_id: str) -> MakeTransferOperationResponse:
@@ -264,12 +347,7 @@ class OperationsGatewayGRPCClient(GRPCClient):
         :param account_id: Идентификатор счета.
         :return: Ответ с информацией по операции.
         """
-        request = MakeTransferOperationRequest(
-            status=fake.proto_enum(OperationStatus),
-            amount=fake.amount(),
-            card_id=card_id,
-            account_id=account_id
-        )
+        request = self.build_make_transfer_operation_request(card_id=card_id, account_id=account_id)
         return self.make_transfer_operation_api(request)
 
     def make_purchase_operation(self, card_id: str, account_id: str) -> MakePurchaseOperationResponse:
@@ -280,13 +358,7 @@ class OperationsGatewayGRPCClient(GRPCClient):
         :param account_id: Идентификатор счета.
         :return: Ответ с информацией по операции.
         """
-        request = MakePurchaseOperationRequest(
-            status=fake.proto_enum(OperationStatus),
-            amount=fake.amount(),
-            card_id=card_id,
-            account_id=account_id,
-            category=fake.category()
-        )
+        request = self.build_make_purchase_operation_request(card_id=card_id, account_id=account_id)
         return self.make_purchase_operation_api(request)
 
     def make_bill_payment_operation(self, card_id: str, account_id: str) -> MakeBillPaymentOperationResponse:
@@ -297,12 +369,7 @@ class OperationsGatewayGRPCClient(GRPCClient):
         :param account_id: Идентификатор счета.
         :return: Ответ с информацией по операции.
         """
-        request = MakeBillPaymentOperationRequest(
-            status=fake.proto_enum(OperationStatus),
-            amount=fake.amount(),
-            card_id=card_id,
-            account_id=account_id,
-        )
+        request = self.build_make_bill_payment_operation_request(card_id=card_id, account_id=account_id)
         return self.make_bill_payment_operation_api(request)
 
     def make_cash_withdrawal_operation(self, card_id: str, account_id: str) -> MakeCashWithdrawalOperationResponse:
@@ -313,25 +380,108 @@ class OperationsGatewayGRPCClient(GRPCClient):
         :param account_id: Идентификатор счета.
         :return: Ответ с информацией по операции.
         """
-        request = MakeCashWithdrawalOperationRequest(
-            status=fake.proto_enum(OperationStatus),
-            amount=fake.amount(),
-            card_id=card_id,
-            account_id=account_id,
-        )
+        request = self.build_make_cash_withdrawal_operation_request(card_id=card_id, account_id=account_id)
         return self.make_cash_withdrawal_operation_api(request)
 
 
-def build_operations_gateway_grpc_client() -> OperationsGatewayGRPCClient:
+class AsyncOperationsGatewayGRPCClient(BaseOperationsGatewayGRPCClient, AsyncGRPCClient):
+    """
+    Асинхронный gRPC-клиент для взаимодействия с OperationsGatewayService.
+    Предоставляет высокоуровневые методы для работы с документами.
+    """
+
+    async def get_operation(self, operation_id: str) -> GetOperationResponse:
+        """
+        Асинхронный вариант OperationsGatewayGRPCClient.get_operation.
+        """
+        request = GetOperationRequest(id=operation_id)
+        return await self.get_operation_api(request)
+
+    async def get_operation_receipt(self, operation_id: str) -> GetOperationReceiptResponse:
+        """
+        Асинхронный вариант OperationsGatewayGRPCClient.get_operation_receipt.
+        """
+        request = GetOperationReceiptRequest(operation_id=operation_id)
+        return await self.get_operation_receipt_api(request)
+
+    async def get_operations(self, account_id: str) -> GetOperationsResponse:
+        """
+        Асинхронный вариант OperationsGatewayGRPCClient.get_operations.
+        """
+        request = GetOperationsRequest(account_id=account_id)
+        return await self.get_operations_api(request)
+
+    async def get_operations_summary(self, account_id: str) -> GetOperationsSummaryResponse:
+        """
+        Асинхронный вариант OperationsGatewayGRPCClient.get_operations_summary.
+        """
+        request = GetOperationsSummaryRequest(account_id=account_id)
+        return await self.get_operations_summary_api(request)
+
+    async def make_fee_operation(self, card_id: str, account_id: str) -> MakeFeeOperationResponse:
+        """
+        Асинхронный вариант OperationsGatewayGRPCClient.make_fee_operation.
+        """
+        request = self.build_make_fee_operation_request(card_id=card_id, account_id=account_id)
+        return await self.make_fee_operation_api(request)
+
+    async def make_top_up_operation(self, card_id: str, account_id: str) -> MakeTopUpOperationResponse:
+        """
+        Асинхронный вариант OperationsGatewayGRPCClient.make_top_up_operation.
+        """
+        request = self.build_make_top_up_operation_request(card_id=card_id, account_id=account_id)
+        return await self.make_top_up_operation_api(request)
+
+    async def make_cashback_operation(self, card_id: str, account_id: str) -> MakeCashbackOperationResponse:
+        """
+        Асинхронный вариант OperationsGatewayGRPCClient.make_cashback_operation.
+        """
+        request = self.build_make_cashback_operation_request(card_id=card_id, account_id=account_id)
+        return await self.make_cashback_operation_api(request)
+
+    async def make_transfer_operation(self, card_id: str, account_id: str) -> MakeTransferOperationResponse:
+        """
+        Асинхронный вариант OperationsGatewayGRPCClient.make_transfer_operation.
+        """
+        request = self.build_make_transfer_operation_request(card_id=card_id, account_id=account_id)
+        return await self.make_transfer_operation_api(request)
+
+    async def make_purchase_operation(self, card_id: str, account_id: str) -> MakePurchaseOperationResponse:
+        """
+        Асинхронный вариант OperationsGatewayGRPCClient.make_purchase_operation.
+        """
+        request = self.build_make_purchase_operation_request(card_id=card_id, account_id=account_id)
+        return await self.make_purchase_operation_api(request)
+
+    async def make_bill_payment_operation(self, card_id: str, account_id: str) -> MakeBillPaymentOperationResponse:
+        """
+        Асинхронный вариант OperationsGatewayGRPCClient.make_bill_payment_operation.
+        """
+        request = self.build_make_bill_payment_operation_request(card_id=card_id, account_id=account_id)
+        return await self.make_bill_payment_operation_api(request)
+
+    async def make_cash_withdrawal_operation(self, card_id: str, account_id: str) -> MakeCashWithdrawalOperationResponse:
+        """
+        Асинхронный вариант OperationsGatewayGRPCClient.make_cash_withdrawal_operation.
+        """
+        request = self.build_make_cash_withdrawal_operation_request(card_id=card_id, account_id=account_id)
+        return await self.make_cash_withdrawal_operation_api(request)
+
+
+def build_operations_gateway_grpc_client(channel: Channel | None = None) -> OperationsGatewayGRPCClient:
     """
     Фабрика для создания экземпляра OperationsGatewayGRPCClient.
 
+    :param channel: общий gRPC-канал; если не передан, будет создан новый.
     :return: Инициализированный клиент для OperationsGatewayService.
     """
-    return OperationsGatewayGRPCClient(channel=build_gateway_grpc_client())
+    return OperationsGatewayGRPCClient(channel=channel or build_gateway_grpc_client())
 
 
-def build_operations_gateway_locust_grpc_client(environment: Environment) -> OperationsGatewayGRPCClient:
+def build_operations_gateway_locust_grpc_client(
+        environment: Environment,
+        channel: Channel | None = None
+) -> OperationsGatewayGRPCClient:
     """
     Функция создаёт экземпляр OperationsGatewayGRPCClient адаптированного под Locust.
 
@@ -339,6 +489,38 @@ def build_operations_gateway_locust_grpc_client(environment: Environment) -> Ope
     Используется исключительно в нагрузочных тестах.
 
     :param environment: объект окружения Locust.
+    :param channel: общий gRPC-канал с интерцептором Locust; если не передан, будет получен новый
+        (см. build_gateway_locust_grpc_client).
     :return: экземпляр OperationsGatewayGRPCClient с хуками сбора метрик.
     """
-    return OperationsGatewayGRPCClient(channel=build_gateway_locust_grpc_client(environment))
+    return OperationsGatewayGRPCClient(channel=channel or build_gateway_locust_grpc_client(environment))
+
+
+def build_operations_gateway_async_grpc_client(channel: aio.Channel | None = None) -> AsyncOperationsGatewayGRPCClient:
+    """
+    Фабрика для создания экземпляра AsyncOperationsGatewayGRPCClient.
+
+    Вызывать нужно внутри работающего event loop'а.
+
+    :param channel: общий grpc.aio-канал; если не передан, будет создан новый.
+    :return: Инициализированный асинхронный клиент для OperationsGatewayService.
+    """
+    return AsyncOperationsGatewayGRPCClient(channel=channel or build_gateway_async_grpc_client())
+
+
+def build_operations_gateway_async_locust_grpc_client(
+        environment: Environment,
+        channel: aio.Channel | None = None
+) -> AsyncOperationsGatewayGRPCClient:
+    """
+    Функция создаёт экземпляр AsyncOperationsGatewayGRPCClient адаптированного под Locust.
+
+    Клиент выполняется в event loop'е процесса (см. tools.locust.loop) и передаёт метрики в Locust
+    через интерцептор AsyncLocustInterceptor. Вызывать нужно из гринлета, например в on_start.
+
+    :param environment: объект окружения Locust.
+    :param channel: общий grpc.aio-канал с интерцептором Locust; если не передан, будет получен новый
+        (см. build_gateway_async_locust_grpc_client).
+    :return: экземпляр AsyncOperationsGatewayGRPCClient с интерцептором сбора метрик.
+    """
+    return AsyncOperationsGatewayGRPCClient(channel=channel or build_gateway_async_locust_grpc_client(environment))
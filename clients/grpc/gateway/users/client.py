@@ -1,10 +1,12 @@
-from grpc import Channel
+from grpc import Channel, aio
 from locust.env import Environment
 
-from clients.grpc.client import GRPCClient
+from clients.grpc.client import GRPCClient, AsyncGRPCClient
 from clients.grpc.gateway.client import (
     build_gateway_grpc_client,
-    build_gateway_locust_grpc_client
+    build_gateway_async_grpc_client,
+    build_gateway_locust_grpc_client,
+    build_gateway_async_locust_grpc_client
 )
 from contracts.services.gateway.users.rpc_create_user_pb2 import CreateUserRequest, CreateUserResponse
 from contracts.services.gateway.users.rpc_get_user_pb2 import GetUserRequest, GetUserResponse
@@ -12,17 +14,20 @@ from contracts.services.gateway.users.users_gateway_service_pb2_grpc import User
 from tools.fakers import fake
 
 
-class UsersGatewayGRPCClient(GRPCClient):
+class BaseUsersGatewayGRPCClient(GRPCClient):
     """
-    gRPC-клиент для взаимодействия с UsersGatewayService.
-    Предоставляет высокоуровневые методы для получения и создания пользователей.
+    Общая часть синхронного и асинхронного gRPC-клиентов UsersGatewayService:
+    стаб, низкоуровневые вызовы и сборка запросов.
+
+    Методы *_api возвращают результат вызова стаба: ответ в UsersGatewayGRPCClient
+    и awaitable-вызов grpc.aio в AsyncUsersGatewayGRPCClient.
     """
 
-    def __init__(self, channel: Channel):
+    def __init__(self, channel: Channel | aio.Channel):
         """
         Инициализация клиента с указанным gRPC-каналом.
 
-        :param channel: gRPC-канал для подключения к UsersGatewayService.
+        :param channel: gRPC-канал (синхронный или grpc.aio) для подключения к UsersGatewayService.
         """
         super().__init__(channel)
 
@@ -46,6 +51,25 @@ class UsersGatewayGRPCClient(GRPCClient):
         """
         return self.stub.CreateUser(request)
 
+    def build_create_user_request(self) -> CreateUserRequest:
+        """
+        Создаёт запрос CreateUserRequest со сгенерированными данными.
+        """
+        return CreateUserRequest(
+            email=fake.email(),
+            last_name=fake.last_name(),
+            first_name=fake.first_name(),
+            middle_name=fake.middle_name(),
+            phone_number=fake.phone_number()
+        )
+
+
+class UsersGatewayGRPCClient(BaseUsersGatewayGRPCClient):
+    """
+    gRPC-клиент для взаимодействия с UsersGatewayService.
+    Предоставляет высокоуровневые методы для получения и создания пользователей.
+    """
+
     def get_user(self, user_id: str) -> GetUserResponse:
         """
         Получение данных пользователя по его ID.
@@ -62,26 +86,45 @@ class UsersGatewayGRPCClient(GRPCClient):
 
         :return: Ответ с информацией о созданном пользователе.
         """
-        request = CreateUserRequest(
-            email=fake.email(),
-            last_name=fake.last_name(),
-            first_name=fake.first_name(),
-            middle_name=fake.middle_name(),
-            phone_number=fake.phone_number()
-        )
+        request = self.build_create_user_request()
         return self.create_user_api(request)
 
 
-def build_users_gateway_grpc_client() -> UsersGatewayGRPCClient:
+class AsyncUsersGatewayGRPCClient(BaseUsersGatewayGRPCClient, AsyncGRPCClient):
+    """
+    Асинхронный gRPC-клиент для взаимодействия с UsersGatewayService.
+    Предоставляет высокоуровневые методы для получения и создания пользователей.
+    """
+
+    async def get_user(self, user_id: str) -> GetUserResponse:
+        """
+        Асинхронный вариант UsersGatewayGRPCClient.get_user.
+        """
+        request = GetUserRequest(id=user_id)
+        return await self.get_user_api(request)
+
+    async def create_user(self) -> CreateUserResponse:
+        """
+        Асинхронный вариант UsersGatewayGRPCClient.create_user.
+        """
+        request = self.build_create_user_request()
+        return await self.create_user_api(request)
+
+
+def build_users_gateway_grpc_client(channel: Channel | None = None) -> UsersGatewayGRPCClient:
     """
     Фабрика для создания экземпляра UsersGatewayGRPCClient.
 
+    :param channel: общий gRPC-канал; если не передан, будет создан новый.
     :return: Инициализированный клиент для UsersGatewayService.
     """
-    return UsersGatewayGRPCClient(channel=build_gateway_grpc_client())
+    return UsersGatewayGRPCClient(channel=channel or build_gateway_grpc_client())
 
 
-def build_users_gateway_locust_grpc_client(environment: Environment) -> UsersGatewayGRPCClient:
+def build_users_gateway_locust_grpc_client(
+        environment: Environment,
+        channel: Channel | None = None
+) -> UsersGatewayGRPCClient:
     """
     Функция создаёт экземпляр UsersGatewayGRPCClient адаптированного под Locust.
 
@@ -89,6 +132,38 @@ def build_users_gateway_locust_grpc_client(environment: Environment) -> UsersGat
     Используется исключительно в нагрузочных тестах.
 
     :param environment: объект окружения Locust.
+    :param channel: общий gRPC-канал с интерцептором Locust; если не передан, будет получен новый
+        (см. build_gateway_locust_grpc_client).
     :return: экземпляр UsersGatewayGRPCClient с хуками сбора метрик.
     """
-    return UsersGatewayGRPCClient(channel=build_gateway_locust_grpc_client(environment))
+    return UsersGatewayGRPCClient(channel=channel or build_gateway_locust_grpc_client(environment))
+
+
+def build_users_gateway_async_grpc_client(channel: aio.Channel | None = None) -> AsyncUsersGatewayGRPCClient:
+    """
+    Фабрика для создания экземпляра AsyncUsersGatewayGRPCClient.
+
+    Вызывать нужно внутри работающего event loop'а.
+
+    :param channel: общий grpc.aio-канал; если не передан, будет создан новый.
+    :return: Инициализированный асинхронный клиент для UsersGatewayService.
+    """
+    return AsyncUsersGatewayGRPCClient(channel=channel or build_gateway_async_grpc_client())
+
+
+def build_users_gateway_async_locust_grpc_client(
+        environment: Environment,
+        channel: aio.Channel | None = None
+) -> AsyncUsersGatewayGRPCClient:
+    """
+    Функция создаёт экземпляр AsyncUsersGatewayGRPCClient адаптированного под Locust.
+
+    Клиент выполняется в event loop'е процесса (см. tools.locust.loop) и передаёт метрики в Locust
+    через интерцептор AsyncLocustInterceptor. Вызывать нужно из гринлета, например в on_start.
+
+    :param environment: объект окружения Locust.
+    :param channel: общий grpc.aio-канал с интерцептором Locust; если не передан, будет получен новый
+        (см. build_gateway_async_locust_grpc_client).
+    :return: экземпляр AsyncUsersGatewayGRPCClient с интерцептором сбора метрик.
+    """
+    return AsyncUsersGatewayGRPCClient(channel=channel or build_gateway_async_locust_grpc_client(environment))
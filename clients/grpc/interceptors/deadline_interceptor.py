@@ -0,0 +1,106 @@
+from grpc import (
+    ClientCallDetails,
+    UnaryUnaryClientInterceptor,
+    UnaryStreamClientInterceptor,
+    StreamUnaryClientInterceptor,
+    StreamStreamClientInterceptor,
+    aio
+)
+
+
+class DeadlinePolicy:
+    """
+    Дедлайны по умолчанию для gRPC-вызовов, у которых timeout не задан явно.
+
+    :param timeouts: Дедлайны в секундах по полным именам методов
+        (например, "/contracts.services.gateway.users.UsersGatewayService/GetUser").
+    :param default_timeout: Дедлайн для остальных методов. None — без дедлайна.
+    """
+
+    def __init__(self, timeouts: dict[str, float], default_timeout: float | None = None):
+        self.timeouts = timeouts
+        self.default_timeout = default_timeout
+
+    def apply(self, client_call_details: ClientCallDetails) -> ClientCallDetails:
+        """
+        Возвращает детали вызова с дедлайном по умолчанию, если вызывающий не передал свой.
+        """
+        if client_call_details.timeout is not None:
+            return client_call_details
+
+        # В grpc.aio имя метода приходит в байтах
+        method = client_call_details.method
+        method = method.decode() if isinstance(method, bytes) else method
+
+        timeout = self.timeouts.get(method, self.default_timeout)
+        if timeout is None:
+            return client_call_details
+
+        # Детали вызова и в синхронном gRPC, и в grpc.aio — namedtuple
+        return client_call_details._replace(timeout=timeout)
+
+
+class DeadlineInterceptor(
+    DeadlinePolicy,
+    UnaryUnaryClientInterceptor,
+    UnaryStreamClientInterceptor,
+    StreamUnaryClientInterceptor,
+    StreamStreamClientInterceptor
+):
+    """
+    gRPC-интерцептор, подставляющий дедлайны по умолчанию во все виды вызовов синхронного канала.
+    """
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        return continuation(self.apply(client_call_details), request)
+
+    def intercept_unary_stream(self, continuation, client_call_details, request):
+        return continuation(self.apply(client_call_details), request)
+
+    def intercept_stream_unary(self, continuation, client_call_details, request_iterator):
+        return continuation(self.apply(client_call_details), request_iterator)
+
+    def intercept_stream_stream(self, continuation, client_call_details, request_iterator):
+        return continuation(self.apply(client_call_details), request_iterator)
+
+
+# Канал grpc.aio относит каждый интерцептор только к одному виду вызовов,
+# поэтому для него дедлайны подставляют четыре отдельных интерцептора
+
+
+class AsyncUnaryUnaryDeadlineInterceptor(DeadlinePolicy, aio.UnaryUnaryClientInterceptor):
+    async def intercept_unary_unary(self, continuation, client_call_details, request):
+        return await continuation(self.apply(client_call_details), request)
+
+
+class AsyncUnaryStreamDeadlineInterceptor(DeadlinePolicy, aio.UnaryStreamClientInterceptor):
+    async def intercept_unary_stream(self, continuation, client_call_details, request):
+        return await continuation(self.apply(client_call_details), request)
+
+
+class AsyncStreamUnaryDeadlineInterceptor(DeadlinePolicy, aio.StreamUnaryClientInterceptor):
+    async def intercept_stream_unary(self, continuation, client_call_details, request_iterator):
+        return await continuation(self.apply(client_call_details), request_iterator)
+
+
+class AsyncStreamStreamDeadlineInterceptor(DeadlinePolicy, aio.StreamStreamClientInterceptor):
+    async def intercept_stream_stream(self, continuation, client_call_details, request_iterator):
+        return await continuation(self.apply(client_call_details), request_iterator)
+
+
+def build_async_deadline_interceptors(
+        timeouts: dict[str, float],
+        default_timeout: float | None = None
+) -> list[aio.ClientInterceptor]:
+    """
+    Возвращает набор интерцепторов дедлайнов для всех видов вызовов канала grpc.aio.
+    """
+    return [
+        interceptor(timeouts, default_timeout)
+        for interceptor in (
+            AsyncUnaryUnaryDeadlineInterceptor,
+            AsyncUnaryStreamDeadlineInterceptor,
+            AsyncStreamUnaryDeadlineInterceptor,
+            AsyncStreamStreamDeadlineInterceptor,
+        )
+    ]
@@ -1,13 +1,102 @@
 import time
+from contextvars import ContextVar
+from functools import partial
+from typing import Any, Callable
 
-from grpc import RpcError, UnaryUnaryClientInterceptor
+from grpc import (
+    Channel,
+    RpcError,
+    UnaryUnaryClientInterceptor,
+    StreamUnaryClientInterceptor,
+    aio
+)
 from locust.env import Environment
 
+from tools.locust.loop import get_locust_event_loop
+from tools.locust.metrics import get_metrics_buffer
 
-class LocustInterceptor(UnaryUnaryClientInterceptor):
+
+# Размер ответа вызова, который сейчас выполняет интерцептор Locust (см. ResponseSizeChannel)
+response_size_context: ContextVar["ResponseSize | None"] = ContextVar("response_size", default=None)
+
+
+class ResponseSize:
+    """
+    Размер ответа одного gRPC-вызова на проводе.
+    Создаётся интерцептором на каждый вызов и живёт ровно столько, сколько сам вызов.
+    """
+    __slots__ = ("length",)
+
+    def __init__(self):
+        self.length = 0
+
+
+class ResponseSizeChannel:
+    """
+    Обёртка gRPC-канала (синхронного или grpc.aio), записывающая размер ответа на проводе
+    в ResponseSize текущего вызова.
+
+    Десериализатор ответа получает от транспорта байты сообщения, поэтому их длина известна
+    без повторного кодирования сообщения через ByteSize(). Интерцептор Locust перед вызовом
+    кладёт в response_size_context новый ResponseSize, а обёртка подменяет десериализатор так,
+    чтобы длина попала именно в него. Словарь по id() сообщения для этого не подходит: записи
+    ответов, которые интерцептор не забрал, копились бы, а id освобождённого сообщения достаётся
+    следующему. Слабые ссылки на protobuf-сообщения не поддерживаются.
+
+    - Синхронный канал под grpc.intercept_channel создаёт метод заново на каждый вызов внутри
+      continuation интерцептора, поэтому ResponseSize привязывается к десериализатору сразу:
+      сам ответ десериализуется уже в другом гринлете.
+    - Метод канала grpc.aio создаётся один раз на стаб, а ответ десериализуется в задаче вызова,
+      унаследовавшей контекст интерцептора, поэтому ResponseSize берётся из контекста.
+
+    Остальные атрибуты и методы делегируются исходному каналу.
+
+    :param channel: Исходный gRPC-канал.
+    """
+
+    def __init__(self, channel: Channel | aio.Channel):
+        self.channel = channel
+
+    def __getattr__(self, name: str):
+        return getattr(self.channel, name)
+
+    @staticmethod
+    def wrap_deserializer(deserializer: Callable[[bytes], Any] | None) -> Callable[[bytes], Any]:
+        bound_size = response_size_context.get()
+
+        def deserialize(data: bytes) -> Any:
+            message = deserializer(data) if deserializer is not None else data
+            size = bound_size if bound_size is not None else response_size_context.get()
+            if size is not None:
+                size.length = len(data)
+            return message
+
+        return deserialize
+
+    def unary_unary(self, method, request_serializer=None, response_deserializer=None, *args, **kwargs):
+        return self.channel.unary_unary(
+            method, request_serializer, self.wrap_deserializer(response_deserializer), *args, **kwargs
+        )
+
+    def stream_unary(self, method, request_serializer=None, response_deserializer=None, *args, **kwargs):
+        return self.channel.stream_unary(
+            method, request_serializer, self.wrap_deserializer(response_deserializer), *args, **kwargs
+        )
+
+
+class LocustInterceptor(UnaryUnaryClientInterceptor, StreamUnaryClientInterceptor):
     """
     gRPC-интерцептор для сбора метрик Locust.
     Используется для измерения времени выполнения вызовов и регистрации успехов/ошибок.
+    При включённой настройке LOCUST_USER.BUFFERED_METRICS успешные вызовы записываются
+    в буфер метрик процесса (см. tools.locust.metrics), а не отправляются событием.
+
+    Интерцептор не ждёт ответа: метрики регистрируются в add_done_callback, когда вызов завершится,
+    поэтому несколько вызовов .future() одного виртуального пользователя выполняются одновременно.
+    Размер ответа берётся из байтов транспорта, для этого канал оборачивается в ResponseSizeChannel.
+
+    Вызовы stream-unary регистрируются как unary-unary. Вызовы с потоком ответов (unary-stream,
+    stream-stream) не перехватываются: в стабах шлюза таких методов нет.
     """
 
     def __init__(self, environment: Environment):
@@ -15,6 +104,7 @@ class LocustInterceptor(UnaryUnaryClientInterceptor):
         :param environment: Экземпляр среды Locust, содержащий события сбора метрик.
         """
         self.environment = environment
+        self.buffer = get_metrics_buffer(environment)
 
     def intercept_unary_unary(self, continuation, client_call_details, request):
         """
@@ -25,31 +115,161 @@ class LocustInterceptor(UnaryUnaryClientInterceptor):
         :param request: Объект запроса, отправляемый на сервер.
         :return: gRPC response (future объект).
         """
-        response = None
-        exception: RpcError | None = None
         start_time = time.perf_counter()  # Засекаем время начала запроса
-        response_length = 0
 
+        # Выполняем gRPC вызов: для .future() продолжение сразу возвращает future, не дожидаясь ответа.
+        # Размер ответа десериализатор ResponseSizeChannel запишет в size этого вызова
+        size = ResponseSize()
+        token = response_size_context.set(size)
         try:
-            # Выполняем gRPC вызов и получаем response future
             response = continuation(client_call_details, request)
+        finally:
+            response_size_context.reset(token)
 
-            # Получаем размер ответа, если он уже доступен (для метрик)
-            response_length = response.result().ByteSize()
-        except RpcError as error:
-            # В случае ошибки сохраняем исключение для метрик
+        # Метрики регистрируем по завершении вызова (для уже завершённого вызова колбэк выполнится сразу)
+        response.add_done_callback(partial(self.on_done, client_call_details.method, start_time, size))
+
+        # Возвращаем результат вызова (future-объект)
+        return response
+
+    def intercept_stream_unary(self, continuation, client_call_details, request_iterator):
+        """
+        Метод-перехватчик для stream-unary gRPC вызовов: единственный ответ регистрируется как в unary-unary.
+        """
+        return self.intercept_unary_unary(continuation, client_call_details, request_iterator)
+
+    def on_done(self, method: str, start_time: float, size: ResponseSize, response) -> None:
+        """
+        Регистрирует завершённый вызов в метриках Locust.
+
+        :param method: Имя метода (например, "/users.UsersService/CreateUser").
+        :param start_time: Момент начала вызова (time.perf_counter).
+        :param size: Размер ответа, записанный десериализатором ResponseSizeChannel.
+        :param response: Завершённый future-объект вызова.
+        """
+        response_time = (time.perf_counter() - start_time) * 1000  # Время выполнения в миллисекундах
+        exception: Exception | None = None
+        response_length = 0
+
+        try:
+            response.result()
+            response_length = size.length
+        except Exception as error:
+            # RpcError или отмена вызова — сохраняем исключение для метрик
             exception = error
 
+        # Успешный вызов записываем в буфер метрик, если он включён
+        if self.buffer is not None and exception is None:
+            self.buffer.record(("gRPC", method), response_time, response_length)
+            return
+
         # Регистрируем вызов в системе метрик Locust
         self.environment.events.request.fire(
-            name=client_call_details.method,  # Имя метода (например, "/users.UsersService/CreateUser")
+            name=method,  # Имя метода (например, "/users.UsersService/CreateUser")
             context=None,  # Можно использовать для передачи кастомных данных
             response=response,  # Объект ответа (если нужен для контекста)
             exception=exception,  # Если произошла ошибка — передаём её сюда
             request_type="gRPC",  # Тип запроса (например, "HTTP", "gRPC")
-            response_time=(time.perf_counter() - start_time) * 1000,  # Время выполнения в миллисекундах
+            response_time=response_time,  # Время выполнения в миллисекундах
             response_length=response_length,  # Размер ответа в байтах
         )
 
-        # Возвращаем результат вызова (future-объект)
-        return response
+
+class AsyncLocustInterceptor(aio.UnaryUnaryClientInterceptor):
+    """
+    grpc.aio-интерцептор для сбора метрик Locust.
+
+    Выполняется в event loop'е процесса (см. tools.locust.loop), а статистика Locust не потокобезопасна,
+    поэтому метрики передаются в поток gevent hub: событием request или в буфер метрик.
+    Размер ответа, как и в LocustInterceptor, берётся из байтов транспорта через ResponseSizeChannel.
+
+    Канал grpc.aio относит каждый интерцептор только к одному виду вызовов, поэтому stream-unary
+    перехватывает отдельный адаптер AsyncLocustStreamUnaryInterceptor, делегирующий методам этого
+    интерцептора. Полный набор возвращает метод interceptors(). Вызовы с потоком ответов,
+    как и в LocustInterceptor, не перехватываются.
+    """
+
+    def __init__(self, environment: Environment):
+        """
+        :param environment: Экземпляр среды Locust, содержащий события сбора метрик.
+        """
+        self.environment = environment
+        self.loop = get_locust_event_loop()
+        self.buffer = get_metrics_buffer(environment)
+
+    async def intercept_unary_unary(self, continuation, client_call_details, request):
+        """
+        Метод-перехватчик для unary-unary вызовов grpc.aio.
+
+        :param continuation: Корутина, выполняющая фактический gRPC вызов.
+        :param client_call_details: Детали запроса (метод, метаданные, таймаут и т.д.).
+        :param request: Объект запроса, отправляемый на сервер.
+        :return: Объект вызова grpc.aio (его можно await'ить повторно).
+        """
+        exception: RpcError | None = None
+        start_time = time.perf_counter()
+        response_length = 0
+
+        # Задача вызова, в которой десериализуется ответ, наследует контекст с size этого вызова
+        size = ResponseSize()
+        token = response_size_context.set(size)
+        try:
+            call = await continuation(client_call_details, request)
+        finally:
+            response_size_context.reset(token)
+
+        try:
+            await call
+            response_length = size.length
+        except RpcError as error:
+            exception = error
+
+        response_time = (time.perf_counter() - start_time) * 1000
+        name = self.get_method_name(client_call_details)
+
+        if self.buffer is not None and exception is None:
+            self.buffer.record_threadsafe(("gRPC", name), response_time, response_length)
+            return call
+
+        self.loop.call_in_hub(
+            self.environment.events.request.fire,
+            name=name,
+            context=None,
+            response=call,
+            exception=exception,
+            request_type="gRPC",
+            response_time=response_time,
+            response_length=response_length,
+        )
+        return call
+
+    async def intercept_stream_unary(self, continuation, client_call_details, request_iterator):
+        """
+        Метод-перехватчик для stream-unary вызовов grpc.aio: единственный ответ регистрируется как в unary-unary.
+        """
+        return await self.intercept_unary_unary(continuation, client_call_details, request_iterator)
+
+    def interceptors(self) -> list[aio.ClientInterceptor]:
+        """
+        Возвращает этот интерцептор вместе с адаптером для stream-unary вызовов —
+        список для параметра interceptors канала grpc.aio.
+        """
+        return [self, AsyncLocustStreamUnaryInterceptor(self)]
+
+    @staticmethod
+    def get_method_name(client_call_details) -> str:
+        # В grpc.aio имя метода приходит в байтах
+        method = client_call_details.method
+        return method.decode() if isinstance(method, bytes) else method
+
+
+class AsyncLocustStreamUnaryInterceptor(aio.StreamUnaryClientInterceptor):
+    """
+    Адаптер AsyncLocustInterceptor для stream-unary вызовов grpc.aio.
+    """
+
+    def __init__(self, interceptor: AsyncLocustInterceptor):
+        self.interceptor = interceptor
+
+    async def intercept_stream_unary(self, continuation, client_call_details, request_iterator):
+        return await self.interceptor.intercept_stream_unary(continuation, client_call_details, request_iterator)
@@ -0,0 +1,83 @@
+import time
+from collections import OrderedDict
+from typing import NamedTuple
+
+from gevent.monkey import get_original
+from httpx import URL, Response, QueryParams
+
+# Блокировка ОС, а не её gevent-замена: кеш делят синхронные клиенты в потоке gevent hub'а
+# и асинхронные в потоке event loop'а (см. tools.locust.loop)
+allocate_lock = get_original("_thread", "allocate_lock")
+
+
+class HTTPCacheEntry(NamedTuple):
+    # Момент (time.monotonic), до которого ответ отдаётся без обращения к серверу
+    expires_at: float
+    response: Response
+    # ETag ответа для условного запроса (If-None-Match) после истечения TTL
+    etag: str | None
+
+
+class HTTPResponseCache:
+    """
+    Клиентский кеш ответов идемпотентных GET-запросов с TTL и вытеснением давно неиспользуемых записей (LRU).
+
+    Ключ записи — URL и GET-параметры запроса. В течение TTL ответ отдаётся из кеша без запроса к серверу.
+    После истечения TTL запись с ETag не удаляется: следующий запрос уходит с заголовком If-None-Match,
+    и ответ 304 Not Modified продлевает запись, не перекачивая тело. Запись без ETag запрашивается заново.
+
+    Кеш предназначен только для вспомогательных фаз (сидинг, прогрев, проверка данных) и подключается
+    исключительно в клиентах без хуков Locust: в измеряемой нагрузке он искажал бы результаты.
+
+    Один кеш процесса делят синхронные и асинхронные клиенты из разных потоков, поэтому каждая операция
+    выполняется под блокировкой ОС. Внутри блокировки нет ввода-вывода и переключений гринлетов,
+    так что гринлеты одного потока не могут заблокировать друг друга.
+
+    :param max_size: Максимальное количество записей.
+    :param ttl: Время жизни записи в секундах.
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.entries: OrderedDict[tuple[str, str], HTTPCacheEntry] = OrderedDict()
+        self.lock = allocate_lock()
+
+    @staticmethod
+    def build_key(url: URL | str, params: QueryParams | None = None) -> tuple[str, str]:
+        return str(url), str(params or "")
+
+    def get(self, key: tuple[str, str]) -> HTTPCacheEntry | None:
+        """
+        Возвращает запись (в том числе устаревшую) и отмечает её как недавно использованную.
+        """
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+            return entry
+
+    def put(self, key: tuple[str, str], response: Response) -> None:
+        """
+        Сохраняет успешный ответ и вытесняет самые давно неиспользуемые записи сверх max_size.
+        """
+        entry = HTTPCacheEntry(time.monotonic() + self.ttl, response, response.headers.get("ETag"))
+
+        with self.lock:
+            self.entries[key] = entry
+            self.entries.move_to_end(key)
+
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+    def refresh(self, key: tuple[str, str], entry: HTTPCacheEntry) -> Response:
+        """
+        Продлевает запись после ответа 304 Not Modified и возвращает закешированный ответ.
+        """
+        with self.lock:
+            self.entries[key] = entry._replace(expires_at=time.monotonic() + self.ttl)
+        return entry.response
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
@@ -1,21 +1,87 @@
-from typing import Any, TypedDict
+import time
+from typing import Any, TypedDict, TypeVar
 
-from httpx import Client, URL, Response, QueryParams
+from httpx import Client, AsyncClient, URL, Response, QueryParams, codes
+from pydantic import BaseModel
+
+from clients.http.cache import HTTPResponseCache
+from clients.http.parsing import LazySchema, parse_response
+from clients.http.serializers import get_json_serializer
+from clients.http.templates import JSON_CONTENT_HEADERS, get_request_body_template
+from config import settings
+from tools.config.http import HTTPResponseParsingMode, HTTPSerializer
+
+T = TypeVar("T", bound=BaseModel)
+R = TypeVar("R", bound=BaseModel)
 
 
 class HTTPClientExtensions(TypedDict, total=False):
     route: str
 
 
-class HTTPClient:
+class BaseHTTPClient:
     """
-    Базовый HTTP API клиент, принимающий объект httpx.Client.
+    Общая часть HTTPClient и AsyncHTTPClient: настройки разбора ответов, сериализации и кеша,
+    а также сборка тел запросов. Сами запросы выполняют наследники — синхронно или асинхронно.
 
-    :param client: экземпляр httpx.Client для выполнения HTTP-запросов
+    :param client: экземпляр httpx.Client или httpx.AsyncClient для выполнения HTTP-запросов
+    :param parsing_mode: режим разбора ответов; по умолчанию GATEWAY_HTTP_CLIENT.PARSING_MODE
+    :param request_templates: собирать тела запросов из шаблонов; по умолчанию GATEWAY_HTTP_CLIENT.REQUEST_TEMPLATES
+    :param serializer: бэкенд кодирования запросов и разбора ответов; по умолчанию GATEWAY_HTTP_CLIENT.SERIALIZER
+    :param cache: кеш ответов GET-запросов (см. clients.http.cache); по умолчанию GET-запросы не кешируются
     """
 
-    def __init__(self, client: Client):
+    def __init__(
+            self,
+            client: Client | AsyncClient,
+            parsing_mode: HTTPResponseParsingMode | None = None,
+            request_templates: bool | None = None,
+            serializer: HTTPSerializer | None = None,
+            cache: HTTPResponseCache | None = None
+    ):
         self.client = client
+        self.parsing_mode = parsing_mode or settings.gateway_http_client.parsing_mode
+        self.request_templates = (
+            settings.gateway_http_client.request_templates if request_templates is None else request_templates
+        )
+        self.serializer = get_json_serializer(serializer or settings.gateway_http_client.serializer)
+        self.cache = cache
+
+    def parse_response(self, response: Response, schema: type[T], discard: bool = False) -> T | LazySchema | None:
+        """
+        Разбирает тело ответа в схему согласно режиму парсинга клиента (см. clients.http.parsing).
+
+        :param response: Ответ httpx.
+        :param schema: Pydantic-схема ответа.
+        :param discard: Вызывающий код не использует результат; только такие ответы режим none не разбирает.
+        :return: Экземпляр схемы (full), LazySchema (lazy) или None (none и discard=True).
+        """
+        return parse_response(response, schema, self.parsing_mode, self.serializer, discard)
+
+    def build_request(self, schema: type[R], **slots: str) -> R | bytes:
+        """
+        Создаёт тело запроса: экземпляр схемы или, если включены шаблоны, готовые JSON-байты
+        из заранее отрендеренного шаблона (см. clients.http.templates).
+
+        :param schema: Pydantic-схема тела запроса.
+        :param slots: Значения полей, которые задаёт вызывающий код (остальные генерируются схемой).
+        :return: Экземпляр схемы или JSON-байты.
+        """
+        if not self.request_templates:
+            return schema(**slots)
+
+        template = get_request_body_template(
+            schema, tuple(slots), settings.gateway_http_client.request_templates_pool_size
+        )
+        return template.render(**slots)
+
+
+class HTTPClient(BaseHTTPClient):
+    """
+    Базовый HTTP API клиент, принимающий объект httpx.Client (параметры см. в BaseHTTPClient).
+    """
+
+    client: Client
 
     def get(self, url: URL | str, params: QueryParams | None = None,
             extensions: HTTPClientExtensions | None = None) -> Response:
@@ -26,15 +92,94 @@ class HTTPClient:
         :param params: GET-параметры запроса (например, ?key=value).
         :return: Объект Response с данными ответа.
         """
-        return self.client.get(url, params=params, extensions=extensions)
+        if self.cache is None:
+            return self.client.get(url, params=params, extensions=extensions)
+
+        key = self.cache.build_key(url, params)
+        entry = self.cache.get(key)
+        if entry is not None and entry.expires_at > time.monotonic():
+            return entry.response
+
+        # Устаревшую запись с ETag перепроверяем условным запросом
+        headers = {"If-None-Match": entry.etag} if entry is not None and entry.etag else None
+        response = self.client.get(url, params=params, headers=headers, extensions=extensions)
+        if entry is not None and response.status_code == codes.NOT_MODIFIED:
+            return self.cache.refresh(key, entry)
 
-    def post(self, url: str, json: Any | None = None,
+        if response.is_success:
+            self.cache.put(key, response)
+        return response
+
+    def post(self, url: str, json: Any | None = None, content: bytes | None = None,
              extensions: HTTPClientExtensions | None = None) -> Response:
         """
         Выполняет POST-запрос.
 
         :param url: URL-адрес эндпоинта.
-        :param json: Данные в формате JSON.
+        :param json: Данные в формате JSON (кодируются бэкендом сериализации клиента).
+        :param content: Уже сериализованное JSON-тело (например, из шаблона).
+        :return: Объект Response с данными ответа.
+        """
+        if json is not None:
+            content = self.serializer.dumps(json)
+
+        headers = JSON_CONTENT_HEADERS if content is not None else None
+        return self.client.post(url=url, content=content, headers=headers, extensions=extensions)
+
+
+class AsyncHTTPClient(BaseHTTPClient):
+    """
+    Асинхронный аналог HTTPClient, принимающий объект httpx.AsyncClient (параметры см. в BaseHTTPClient).
+
+    Позволяет держать в полёте тысячи запросов в одном event loop'е.
+    """
+
+    client: AsyncClient
+
+    async def get(self, url: URL | str, params: QueryParams | None = None,
+                  extensions: HTTPClientExtensions | None = None) -> Response:
+        """
+        Выполняет асинхронный GET-запрос.
+
+        :param url: URL-адрес эндпоинта.
+        :param params: GET-параметры запроса (например, ?key=value).
         :return: Объект Response с данными ответа.
         """
-        return self.client.post(url=url, json=json, extensions=extensions)
+        if self.cache is None:
+            return await self.client.get(url, params=params, extensions=extensions)
+
+        key = self.cache.build_key(url, params)
+        entry = self.cache.get(key)
+        if entry is not None and entry.expires_at > time.monotonic():
+            return entry.response
+
+        headers = {"If-None-Match": entry.etag} if entry is not None and entry.etag else None
+        response = await self.client.get(url, params=params, headers=headers, extensions=extensions)
+        if entry is not None and response.status_code == codes.NOT_MODIFIED:
+            return self.cache.refresh(key, entry)
+
+        if response.is_success:
+            self.cache.put(key, response)
+        return response
+
+    async def post(self, url: str, json: Any | None = None, content: bytes | None = None,
+                   extensions: HTTPClientExtensions | None = None) -> Response:
+        """
+        Выполняет асинхронный POST-запрос.
+
+        :param url: URL-адрес эндпоинта.
+        :param json: Данные в формате JSON (кодируются бэкендом сериализации клиента).
+        :param content: Уже сериализованное JSON-тело (например, из шаблона).
+        :return: Объект Response с данными ответа.
+        """
+        if json is not None:
+            content = self.serializer.dumps(json)
+
+        headers = JSON_CONTENT_HEADERS if content is not None else None
+        return await self.client.post(url=url, content=content, headers=headers, extensions=extensions)
+
+    async def close(self) -> None:
+        """
+        Закрывает httpx.AsyncClient и все его соединения. Повторный вызов безопасен.
+        """
+        await self.client.aclose()
@@ -1,30 +1,183 @@
 import time
+from typing import AsyncIterator, Callable, Iterator
 
-from httpx import Request, Response, HTTPStatusError, HTTPError
+from httpx import Request, Response, HTTPStatusError, HTTPError, SyncByteStream, AsyncByteStream
 from locust.env import Environment
 
+from config import settings
+from tools.locust.loop import get_locust_event_loop
+from tools.locust.metrics import get_metrics_buffer, log_breakdown
+
+# Фазы HTTP-запроса: название фазы -> (событие начала, событие окончания) trace-расширения httpcore.
+# "start" — момент вызова request event hook, "close" — закрытие потока тела ответа
+HTTP_PHASES: dict[str, tuple[str, str]] = {
+    "pool": ("start", "acquired"),
+    "connect": ("connect_tcp.started", "connect_tcp.complete"),
+    "tls": ("start_tls.started", "start_tls.complete"),
+    "send": ("send_request_headers.started", "send_request_body.complete"),
+    "ttfb": ("send_request_body.complete", "receive_response_headers.complete"),
+    "download": ("receive_response_headers.complete", "close"),
+}
+
+
+class HTTPPhaseTimings:
+    """
+    Отметки времени (perf_counter_ns) по событиям trace-расширения httpcore для одного запроса.
+
+    Экземпляр подключается как `request.extensions["trace"]` и запоминает момент каждого события
+    без префикса соединения (connection., http11., http2.), чтобы HTTP/1.1 и HTTP/2 считались одинаково.
+    Момент, когда запрос получил соединение из пула, — первое событие connect_tcp.started
+    (новое соединение) или send_request_headers.started (переиспользованное).
+    """
+
+    def __init__(self, start: int, previous: Callable | None = None):
+        self.marks: dict[str, int] = {"start": start}
+        # Trace-функция, установленная раньше (например, сценарием), — вызывается следом за нашей
+        self.previous = previous
+
+    def mark(self, event_name: str) -> None:
+        now = time.perf_counter_ns()
+        event = event_name.split(".", 1)[1]
+        if event in ("connect_tcp.started", "send_request_headers.started"):
+            self.marks.setdefault("acquired", now)
+        self.marks[event] = now
+
+    def trace(self, event_name: str, info: dict) -> None:
+        self.mark(event_name)
+        if self.previous is not None:
+            self.previous(event_name, info)
+
+    async def atrace(self, event_name: str, info: dict) -> None:
+        self.mark(event_name)
+        if self.previous is not None:
+            await self.previous(event_name, info)
+
+    def phases(self, close: int) -> dict[str, float]:
+        """
+        Возвращает длительность каждой наблюдавшейся фазы в миллисекундах.
+
+        :param close: Момент закрытия потока тела ответа (perf_counter_ns).
+        """
+        marks = {**self.marks, "close": close}
+        return {
+            phase: (marks[end] - marks[begin]) / 1_000_000
+            for phase, (begin, end) in HTTP_PHASES.items()
+            if begin in marks and end in marks
+        }
+
+
+def log_phase_timings(environment: Environment, name: str, request_type: str, phases: dict[str, float]) -> None:
+    """
+    Записывает длительности фаз запроса в отдельные записи статистики Locust.
+
+    Записи имеют тип "<request_type> phase" и имя "<запрос> [<фаза>]", поэтому в отчёте Locust
+    рядом с общим временем ответа видно, сколько из него ушло на ожидание пула, соединение, TLS,
+    отправку, ожидание первого байта и загрузку тела. В Aggregated фазы не попадают (см. log_breakdown).
+    """
+    for phase, response_time in phases.items():
+        log_breakdown(environment, f"{request_type} phase", f"{name} [{phase}]", response_time, 0)
+
+
+class LocustMetricsByteStream(SyncByteStream):
+    """
+    Обёртка над потоком тела ответа, которая считает байты, пришедшие из транспорта,
+    и вызывает колбэк, когда поток закрыт (тело прочитано или ответ закрыт).
+
+    Позволяет отправить метрику в Locust без отдельного буферизованного чтения тела в хуке:
+    тело читается один раз — тем, кто его потребляет (httpx при обычном запросе).
+    Ошибка чтения тела (например, ReadTimeout посреди ответа) передаётся в колбэк,
+    чтобы запрос был засчитан как неуспешный.
+    """
+
+    def __init__(self, stream: SyncByteStream, on_close: Callable[[int, Exception | None], None]):
+        self.stream = stream
+        self.on_close = on_close
+        self.length = 0
+        self.error: Exception | None = None
+        self.closed = False
+
+    def __iter__(self) -> Iterator[bytes]:
+        try:
+            for chunk in self.stream:
+                self.length += len(chunk)
+                yield chunk
+        except Exception as error:
+            self.error = error
+            raise
+
+    def close(self) -> None:
+        try:
+            self.stream.close()
+        finally:
+            if not self.closed:
+                self.closed = True
+                self.on_close(self.length, self.error)
+
+
+class AsyncLocustMetricsByteStream(AsyncByteStream):
+    """
+    Асинхронный аналог LocustMetricsByteStream для httpx.AsyncClient.
+    """
+
+    def __init__(self, stream: AsyncByteStream, on_close: Callable[[int, Exception | None], None]):
+        self.stream = stream
+        self.on_close = on_close
+        self.length = 0
+        self.error: Exception | None = None
+        self.closed = False
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        try:
+            async for chunk in self.stream:
+                self.length += len(chunk)
+                yield chunk
+        except Exception as error:
+            self.error = error
+            raise
+
+    async def aclose(self) -> None:
+        try:
+            await self.stream.aclose()
+        finally:
+            if not self.closed:
+                self.closed = True
+                self.on_close(self.length, self.error)
+
 
 def locust_request_event_hook(request: Request) -> None:
     """
     HTTPX event hook, вызываемый перед отправкой запроса.
 
-    Сохраняет текущее время в `request.extensions["start_time"]`,
-    чтобы потом использовать его для расчёта времени ответа.
+    Сохраняет монотонное время perf_counter_ns в `request.extensions["start_time"]`,
+    чтобы потом использовать его для расчёта времени ответа. Если включена настройка
+    GATEWAY_HTTP_CLIENT.PHASE_TIMINGS, подключает HTTPPhaseTimings как trace-расширение.
     """
-    request.extensions["start_time"] = time.time()
+    start_time = time.perf_counter_ns()
+    request.extensions["start_time"] = start_time
 
+    if settings.gateway_http_client.phase_timings:
+        timings = HTTPPhaseTimings(start_time, previous=request.extensions.get("trace"))
+        request.extensions["phase_timings"] = timings
+        request.extensions["trace"] = timings.trace
 
-def locust_response_event_hook(environment: Environment):
+
+def locust_response_event_hook(environment: Environment, request_type: str = "HTTP"):
     """
     Возвращает HTTPX event hook, вызываемый после получения ответа.
 
     Использует `request.extensions["start_time"]` для вычисления времени отклика.
+    Тело ответа хук не читает: поток тела оборачивается в LocustMetricsByteStream, и событие
+    отправляется при его закрытии с количеством байт, пришедших из транспорта.
+    При включённой настройке LOCUST_USER.BUFFERED_METRICS успешные запросы записываются
+    в буфер метрик процесса (см. tools.locust.metrics), а не отправляются событием.
     Извлекает route из `request.extensions["route"]`, если задан.
     Отправляет собранные метрики в `environment.events.request`, чтобы Locust мог агрегировать статистику.
 
     :param environment: Объект окружения Locust, через который отправляются метрики.
+    :param request_type: Тип запроса в статистике Locust (например, HTTP или HTTP/2).
     :return: Функция-хук для HTTPX response event hook.
     """
+    buffer = get_metrics_buffer(environment)
 
     def inner(response: Response) -> None:
         exception: HTTPError | HTTPStatusError | None = None
@@ -39,22 +192,112 @@ def locust_response_event_hook(environment: Environment):
 
         # Получаем route, если он был передан через extensions, иначе используем raw path
         route = request.extensions.get("route", request.url.path)
-        # Время начала запроса, установленное в request event hook
-        start_time = request.extensions.get("start_time", time.time())
-        # Вычисляем длительность запроса в миллисекундах
-        response_time = (time.time() - start_time) * 1000
-        # Определяем размер тела ответа (можно заменить на 0, если не нужно)
-        response_length = len(response.read())
-
-        # Отправляем событие в Locust
-        environment.events.request.fire(
-            name=f"{request.method} {route}",  # Имя запроса (метод + логическое имя маршрута)
-            context=None,  # Контекст (опционально, можно использовать для расширений)
-            response=response,  # Объект ответа (опционально)
-            exception=exception,  # Исключение, если оно произошло
-            request_type="HTTP",  # Тип запроса (может быть любым: HTTP, gRPC, DB и т.д.)
-            response_time=response_time,  # Время выполнения запроса в мс
-            response_length=response_length,  # Размер тела ответа
-        )
+        # Время начала запроса (perf_counter_ns), установленное в request event hook
+        start_time = request.extensions.get("start_time", time.perf_counter_ns())
+
+        def on_close(response_length: int, body_error: Exception | None) -> None:
+            # Ошибка при получении тела важнее успешного статуса заголовков
+            error = exception or body_error
+            end_time = time.perf_counter_ns()
+            # Вычисляем длительность запроса в миллисекундах (вместе с загрузкой тела)
+            response_time = (end_time - start_time) / 1_000_000
+            timings = request.extensions.get("phase_timings")
+
+            # Успешный запрос без разбивки по фазам записываем в буфер метрик, если он включён
+            if buffer is not None and error is None and timings is None:
+                buffer.record((request_type, request.method, route), response_time, response_length)
+                return
+
+            name = f"{request.method} {route}"
+
+            # Отправляем событие в Locust
+            environment.events.request.fire(
+                name=name,  # Имя запроса (метод + логическое имя маршрута)
+                context=None,  # Контекст (опционально, можно использовать для расширений)
+                response=response,  # Объект ответа (опционально)
+                exception=error,  # Исключение, если оно произошло
+                request_type=request_type,  # Тип запроса (может быть любым: HTTP, HTTP/2, gRPC, DB и т.д.)
+                response_time=response_time,  # Время выполнения запроса в мс
+                response_length=response_length,  # Размер тела ответа в байтах, как он пришёл из транспорта
+            )
+
+            # Разбивка времени ответа по фазам, если она включена
+            if timings is not None:
+                log_phase_timings(environment, name, request_type, timings.phases(end_time))
+
+        # Тело здесь не читаем: метрика уйдёт, когда httpx дочитает тело и закроет поток
+        response.stream = LocustMetricsByteStream(response.stream, on_close)
+
+    return inner
+
+
+async def async_locust_request_event_hook(request: Request) -> None:
+    """
+    Асинхронный аналог locust_request_event_hook для httpx.AsyncClient.
+    """
+    start_time = time.perf_counter_ns()
+    request.extensions["start_time"] = start_time
+
+    if settings.gateway_http_client.phase_timings:
+        timings = HTTPPhaseTimings(start_time, previous=request.extensions.get("trace"))
+        request.extensions["phase_timings"] = timings
+        request.extensions["trace"] = timings.atrace
+
+
+def async_locust_response_event_hook(environment: Environment, request_type: str = "HTTP"):
+    """
+    Возвращает асинхронный HTTPX response event hook для httpx.AsyncClient.
+
+    Метрики считаются так же, как в locust_response_event_hook, но хук выполняется в потоке
+    event loop'а, а статистика Locust не потокобезопасна. Поэтому событие request отправляется
+    не напрямую, а через gevent hub основного потока.
+
+    :param environment: Объект окружения Locust, через который отправляются метрики.
+    :param request_type: Тип запроса в статистике Locust (например, HTTP или HTTP/2).
+    :return: Асинхронная функция-хук для HTTPX response event hook.
+    """
+    loop = get_locust_event_loop()
+    buffer = get_metrics_buffer(environment)
+
+    async def inner(response: Response) -> None:
+        exception: HTTPError | HTTPStatusError | None = None
+
+        try:
+            response.raise_for_status()
+        except (HTTPError, HTTPStatusError) as error:
+            exception = error
+
+        request = response.request
+
+        route = request.extensions.get("route", request.url.path)
+        start_time = request.extensions.get("start_time", time.perf_counter_ns())
+
+        def on_close(response_length: int, body_error: Exception | None) -> None:
+            error = exception or body_error
+            end_time = time.perf_counter_ns()
+            response_time = (end_time - start_time) / 1_000_000
+            timings = request.extensions.get("phase_timings")
+
+            if buffer is not None and error is None and timings is None:
+                # Без межпоточного вызова: буфер заберёт запрос пачкой при ближайшем сбросе
+                buffer.record_threadsafe((request_type, request.method, route), response_time, response_length)
+                return
+
+            name = f"{request.method} {route}"
+            loop.call_in_hub(
+                environment.events.request.fire,
+                name=name,
+                context=None,
+                response=response,
+                exception=error,
+                request_type=request_type,
+                response_time=response_time,
+                response_length=response_length,
+            )
+
+            if timings is not None:
+                loop.call_in_hub(log_phase_timings, environment, name, request_type, timings.phases(end_time))
+
+        response.stream = AsyncLocustMetricsByteStream(response.stream, on_close)
 
     return inner
@@ -1,10 +1,17 @@
 from typing import TypedDict
 
-from httpx import Response, QueryParams
+from httpx import Response, Client, QueryParams, AsyncClient
 from locust.env import Environment
 
-from clients.http.client import HTTPClient, HTTPClientExtensions
-from clients.http.gateway.client import build_gateway_http_client, build_gateway_locust_http_client
+from clients.http.client import BaseHTTPClient, HTTPClient, AsyncHTTPClient, HTTPClientExtensions
+from clients.http.parsing import LazySchema
+from clients.http.gateway.client import (
+    build_gateway_http_client,
+    build_gateway_http_response_cache,
+    build_gateway_async_http_client,
+    build_gateway_locust_http_client,
+    build_gateway_async_locust_http_client
+)
 from clients.http.gateway.accounts.schema import (
     GetAccountsQuerySchema,
     GetAccountsResponseSchema,
@@ -18,12 +25,16 @@ from clients.http.gateway.accounts.schema import (
     OpenCreditCardAccountResponseSchema
 )
 
+from tools.config.http import HTTPResponseParsingMode
 from tools.routes import APIRoutes
 
 
-class AccountsGatewayHTTPClient(HTTPClient):
+class BaseAccountsGatewayHTTPClient(BaseHTTPClient):
     """
-    Клиент для взаимодействия с /api/v1/accounts сервиса http-gateway.
+    Низкоуровневые запросы к /api/v1/accounts сервиса http-gateway, общие для синхронного и асинхронного клиента.
+
+    Методы *_api возвращают результат get/post транспорта: httpx.Response в AccountsGatewayHTTPClient
+    и корутину, которую нужно await'ить, в AsyncAccountsGatewayHTTPClient.
     """
 
     def get_accounts_api(self, query: GetAccountsQuerySchema) -> Response:
@@ -87,42 +98,121 @@ class AccountsGatewayHTTPClient(HTTPClient):
             json=request.model_dump(by_alias=True)
         )
 
-    def get_accounts(self, user_id: str) -> GetAccountsResponseSchema:
+
+class AccountsGatewayHTTPClient(BaseAccountsGatewayHTTPClient, HTTPClient):
+    """
+    Клиент для взаимодействия с /api/v1/accounts сервиса http-gateway.
+    """
+
+    def get_accounts(self, user_id: str, discard: bool = False) -> GetAccountsResponseSchema | LazySchema | None:
         query = GetAccountsQuerySchema(user_id=user_id)
         response = self.get_accounts_api(query)
-        return GetAccountsResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, GetAccountsResponseSchema, discard)
 
-    def open_deposit_account(self, user_id: str) -> OpenDepositAccountResponseSchema:
+    def open_deposit_account(
+            self,
+            user_id: str,
+            discard: bool = False
+    ) -> OpenDepositAccountResponseSchema | LazySchema | None:
         request = OpenDepositAccountRequestSchema(user_id=user_id)
         response = self.open_deposit_account_api(request)
-        return OpenDepositAccountResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, OpenDepositAccountResponseSchema, discard)
 
-    def open_savings_account(self, user_id: str) -> OpenSavingsAccountResponseSchema:
+    def open_savings_account(
+            self,
+            user_id: str,
+            discard: bool = False
+    ) -> OpenSavingsAccountResponseSchema | LazySchema | None:
         request = OpenSavingsAccountRequestSchema(user_id=user_id)
         response = self.open_savings_account_api(request)
-        return OpenSavingsAccountResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, OpenSavingsAccountResponseSchema, discard)
 
-    def open_debit_card_account(self, user_id: str) -> OpenDebitCardAccountResponseSchema:
+    def open_debit_card_account(
+            self,
+            user_id: str,
+            discard: bool = False
+    ) -> OpenDebitCardAccountResponseSchema | LazySchema | None:
         request = OpenDebitCardAccountRequestSchema(user_id=user_id)
         response = self.open_debit_card_account_api(request)
-        return OpenDebitCardAccountResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, OpenDebitCardAccountResponseSchema, discard)
 
-    def open_credit_card_account(self, user_id: str) -> OpenCreditCardAccountResponseSchema:
+    def open_credit_card_account(
+            self,
+            user_id: str,
+            discard: bool = False
+    ) -> OpenCreditCardAccountResponseSchema | LazySchema | None:
         request = OpenCreditCardAccountRequestSchema(user_id=user_id)
         response = self.open_credit_card_account_api(request)
-        return OpenCreditCardAccountResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, OpenCreditCardAccountResponseSchema, discard)
+
+
+class AsyncAccountsGatewayHTTPClient(BaseAccountsGatewayHTTPClient, AsyncHTTPClient):
+    """
+    Асинхронный клиент для взаимодействия с /api/v1/accounts сервиса http-gateway.
+    """
+
+    async def get_accounts(self, user_id: str, discard: bool = False) -> GetAccountsResponseSchema | LazySchema | None:
+        query = GetAccountsQuerySchema(user_id=user_id)
+        response = await self.get_accounts_api(query)
+        return self.parse_response(response, GetAccountsResponseSchema, discard)
+
+    async def open_deposit_account(
+            self,
+            user_id: str,
+            discard: bool = False
+    ) -> OpenDepositAccountResponseSchema | LazySchema | None:
+        request = OpenDepositAccountRequestSchema(user_id=user_id)
+        response = await self.open_deposit_account_api(request)
+        return self.parse_response(response, OpenDepositAccountResponseSchema, discard)
+
+    async def open_savings_account(
+            self,
+            user_id: str,
+            discard: bool = False
+    ) -> OpenSavingsAccountResponseSchema | LazySchema | None:
+        request = OpenSavingsAccountRequestSchema(user_id=user_id)
+        response = await self.open_savings_account_api(request)
+        return self.parse_response(response, OpenSavingsAccountResponseSchema, discard)
+
+    async def open_debit_card_account(
+            self,
+            user_id: str,
+            discard: bool = False
+    ) -> OpenDebitCardAccountResponseSchema | LazySchema | None:
+        request = OpenDebitCardAccountRequestSchema(user_id=user_id)
+        response = await self.open_debit_card_account_api(request)
+        return self.parse_response(response, OpenDebitCardAccountResponseSchema, discard)
+
+    async def open_credit_card_account(
+            self,
+            user_id: str,
+            discard: bool = False
+    ) -> OpenCreditCardAccountResponseSchema | LazySchema | None:
+        request = OpenCreditCardAccountRequestSchema(user_id=user_id)
+        response = await self.open_credit_card_account_api(request)
+        return self.parse_response(response, OpenCreditCardAccountResponseSchema, discard)
 
 
-def build_accounts_gateway_http_client() -> AccountsGatewayHTTPClient:
+def build_accounts_gateway_http_client(client: Client | None = None) -> AccountsGatewayHTTPClient:
     """
     Функция создаёт экземпляр AccountsGatewayHTTPClient с уже настроенным HTTP-клиентом.
+    GET-запросы кешируются, если включена настройка GATEWAY_HTTP_CLIENT.RESPONSE_CACHE.
+    Ответы разбираются полностью независимо от GATEWAY_HTTP_CLIENT.PARSING_MODE: сидинг читает их поля.
 
+    :param client: общий httpx.Client; если не передан, будет создан новый.
     :return: Готовый к использованию AccountsGatewayHTTPClient.
     """
-    return AccountsGatewayHTTPClient(client=build_gateway_http_client())
+    return AccountsGatewayHTTPClient(
+        client=client or build_gateway_http_client(),
+        parsing_mode=HTTPResponseParsingMode.FULL,
+        cache=build_gateway_http_response_cache()
+    )
 
 
-def build_accounts_gateway_locust_http_client(environment: Environment) -> AccountsGatewayHTTPClient:
+def build_accounts_gateway_locust_http_client(
+        environment: Environment,
+        client: Client | None = None
+) -> AccountsGatewayHTTPClient:
     """
     Функция создаёт экземпляр AccountsGatewayHTTPClient адаптированного под Locust.
 
@@ -130,6 +220,40 @@ def build_accounts_gateway_locust_http_client(environment: Environment) -> Accou
     Используется исключительно в нагрузочных тестах.
 
     :param environment: объект окружения Locust.
+    :param client: общий httpx.Client с хуками Locust (см. build_gateway_locust_http_shared_client);
+        если не передан, будет создан новый.
     :return: экземпляр AccountsGatewayHTTPClient с хуками сбора метрик.
     """
-    return AccountsGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
+    return AccountsGatewayHTTPClient(client=client or build_gateway_locust_http_client(environment))
+
+
+def build_accounts_gateway_async_http_client(client: AsyncClient | None = None) -> AsyncAccountsGatewayHTTPClient:
+    """
+    Функция создаёт экземпляр AsyncAccountsGatewayHTTPClient.
+    GET-запросы кешируются, если включена настройка GATEWAY_HTTP_CLIENT.RESPONSE_CACHE.
+    Ответы разбираются полностью независимо от GATEWAY_HTTP_CLIENT.PARSING_MODE: сидинг читает их поля.
+
+    :param client: общий httpx.AsyncClient; если не передан, будет создан новый.
+    :return: Готовый к использованию AsyncAccountsGatewayHTTPClient.
+    """
+    return AsyncAccountsGatewayHTTPClient(
+        client=client or build_gateway_async_http_client(),
+        parsing_mode=HTTPResponseParsingMode.FULL,
+        cache=build_gateway_http_response_cache()
+    )
+
+
+def build_accounts_gateway_async_locust_http_client(
+        environment: Environment,
+        client: AsyncClient | None = None
+) -> AsyncAccountsGatewayHTTPClient:
+    """
+    Функция создаёт экземпляр AsyncAccountsGatewayHTTPClient адаптированного под Locust.
+
+    Клиент выполняется в event loop'е процесса (см. tools.locust.loop) и передаёт метрики в Locust через хуки.
+
+    :param environment: объект окружения Locust.
+    :param client: общий httpx.AsyncClient с хуками Locust; если не передан, будет создан новый.
+    :return: экземпляр AsyncAccountsGatewayHTTPClient с хуками сбора метрик.
+    """
+    return AsyncAccountsGatewayHTTPClient(client=client or build_gateway_async_locust_http_client(environment))
@@ -1,10 +1,14 @@
 from locust.env import Environment
 
-from clients.http.client import HTTPClient
-from httpx import Response
+from clients.http.client import BaseHTTPClient, HTTPClient, AsyncHTTPClient
+from clients.http.parsing import LazySchema
+from httpx import Response, Client, AsyncClient
 from clients.http.gateway.client import (
     build_gateway_http_client,
-    build_gateway_locust_http_client
+    build_gateway_http_response_cache,
+    build_gateway_async_http_client,
+    build_gateway_locust_http_client,
+    build_gateway_async_locust_http_client
 )
 from clients.http.gateway.cards.schema import (
     IssueVirtualCardRequestSchema,
@@ -13,12 +17,16 @@ from clients.http.gateway.cards.schema import (
     IssuePhysicalCardResponseSchema
 )
 
+from tools.config.http import HTTPResponseParsingMode
 from tools.routes import APIRoutes
 
 
-class CardsGatewayHTTPClient(HTTPClient):
+class BaseCardsGatewayHTTPClient(BaseHTTPClient):
     """
-    Клиент для взаимодействия с /api/v1/cards сервиса http-gateway.
+    Низкоуровневые запросы к /api/v1/cards сервиса http-gateway, общие для синхронного и асинхронного клиента.
+
+    Методы *_api возвращают результат get/post транспорта: httpx.Response в CardsGatewayHTTPClient
+    и корутину, которую нужно await'ить, в AsyncCardsGatewayHTTPClient.
     """
 
     def issue_virtual_card_api(self, request: IssueVirtualCardRequestSchema) -> Response:
@@ -45,33 +53,91 @@ class CardsGatewayHTTPClient(HTTPClient):
             json=request.model_dump(by_alias=True)
         )
 
-    def issue_virtual_card(self, user_id: str, account_id: str) -> IssueVirtualCardResponseSchema:
+
+class CardsGatewayHTTPClient(BaseCardsGatewayHTTPClient, HTTPClient):
+    """
+    Клиент для взаимодействия с /api/v1/cards сервиса http-gateway.
+    """
+
+    def issue_virtual_card(
+            self,
+            user_id: str,
+            account_id: str,
+            discard: bool = False
+    ) -> IssueVirtualCardResponseSchema | LazySchema | None:
         request = IssueVirtualCardRequestSchema(
             user_id=user_id,
             account_id=account_id
         )
         response = self.issue_virtual_card_api(request)
-        return IssueVirtualCardResponseSchema.model_validate_json(response.text)
-
-    def issue_physical_card(self, user_id: str, account_id: str) -> IssuePhysicalCardResponseSchema:
+        return self.parse_response(response, IssueVirtualCardResponseSchema, discard)
+
+    def issue_physical_card(
+            self,
+            user_id: str,
+            account_id: str,
+            discard: bool = False
+    ) -> IssuePhysicalCardResponseSchema | LazySchema | None:
         request = IssuePhysicalCardRequestSchema(
             user_id=user_id,
             account_id=account_id
         )
         response = self.issue_physical_card_api(request)
-        return IssuePhysicalCardResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, IssuePhysicalCardResponseSchema, discard)
 
 
-def build_cards_gateway_http_client() -> CardsGatewayHTTPClient:
+class AsyncCardsGatewayHTTPClient(BaseCardsGatewayHTTPClient, AsyncHTTPClient):
+    """
+    Асинхронный клиент для взаимодействия с /api/v1/cards сервиса http-gateway.
+    """
+
+    async def issue_virtual_card(
+            self,
+            user_id: str,
+            account_id: str,
+            discard: bool = False
+    ) -> IssueVirtualCardResponseSchema | LazySchema | None:
+        request = IssueVirtualCardRequestSchema(
+            user_id=user_id,
+            account_id=account_id
+        )
+        response = await self.issue_virtual_card_api(request)
+        return self.parse_response(response, IssueVirtualCardResponseSchema, discard)
+
+    async def issue_physical_card(
+            self,
+            user_id: str,
+            account_id: str,
+            discard: bool = False
+    ) -> IssuePhysicalCardResponseSchema | LazySchema | None:
+        request = IssuePhysicalCardRequestSchema(
+            user_id=user_id,
+            account_id=account_id
+        )
+        response = await self.issue_physical_card_api(request)
+        return self.parse_response(response, IssuePhysicalCardResponseSchema, discard)
+
+
+def build_cards_gateway_http_client(client: Client | None = None) -> CardsGatewayHTTPClient:
     """
     Функция создаёт экземпляр CardsGatewayHTTPClient с уже настроенным HTTP-клиентом.
+    GET-запросы кешируются, если включена настройка GATEWAY_HTTP_CLIENT.RESPONSE_CACHE.
+    Ответы разбираются полностью независимо от GATEWAY_HTTP_CLIENT.PARSING_MODE: сидинг читает их поля.
 
+    :param client: общий httpx.Client; если не передан, будет создан новый.
     :return: Готовый к использованию CardsGatewayHTTPClient.
     """
-    return CardsGatewayHTTPClient(client=build_gateway_http_client())
+    return CardsGatewayHTTPClient(
+        client=client or build_gateway_http_client(),
+        parsing_mode=HTTPResponseParsingMode.FULL,
+        cache=build_gateway_http_response_cache()
+    )
 
 
-def build_cards_gateway_locust_http_client(environment: Environment) -> CardsGatewayHTTPClient:
+def build_cards_gateway_locust_http_client(
+        environment: Environment,
+        client: Client | None = None
+) -> CardsGatewayHTTPClient:
     """
     Функция создаёт экземпляр CardsGatewayHTTPClient адаптированного под Locust.
 
@@ -79,6 +145,40 @@ def build_cards_gateway_locust_http_client(environment: Environment) -> CardsGat
     Используется исключительно в нагрузочных тестах.
 
     :param environment: объект окружения Locust.
+    :param client: общий httpx.Client с хуками Locust (см. build_gateway_locust_http_shared_client);
+        если не передан, будет создан новый.
     :return: экземпляр CardsGatewayHTTPClient с хуками сбора метрик.
     """
-    return CardsGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
+    return CardsGatewayHTTPClient(client=client or build_gateway_locust_http_client(environment))
+
+
+def build_cards_gateway_async_http_client(client: AsyncClient | None = None) -> AsyncCardsGatewayHTTPClient:
+    """
+    Функция создаёт экземпляр AsyncCardsGatewayHTTPClient.
+    GET-запросы кешируются, если включена настройка GATEWAY_HTTP_CLIENT.RESPONSE_CACHE.
+    Ответы разбираются полностью независимо от GATEWAY_HTTP_CLIENT.PARSING_MODE: сидинг читает их поля.
+
+    :param client: общий httpx.AsyncClient; если не передан, будет создан новый.
+    :return: Готовый к использованию AsyncCardsGatewayHTTPClient.
+    """
+    return AsyncCardsGatewayHTTPClient(
+        client=client or build_gateway_async_http_client(),
+        parsing_mode=HTTPResponseParsingMode.FULL,
+        cache=build_gateway_http_response_cache()
+    )
+
+
+def build_cards_gateway_async_locust_http_client(
+        environment: Environment,
+        client: AsyncClient | None = None
+) -> AsyncCardsGatewayHTTPClient:
+    """
+    Функция создаёт экземпляр AsyncCardsGatewayHTTPClient адаптированного под Locust.
+
+    Клиент выполняется в event loop'е процесса (см. tools.locust.loop) и передаёт метрики в Locust через хуки.
+
+    :param environment: объект окружения Locust.
+    :param client: общий httpx.AsyncClient с хуками Locust; если не передан, будет создан новый.
+    :return: экземпляр AsyncCardsGatewayHTTPClient с хуками сбора метрик.
+    """
+    return AsyncCardsGatewayHTTPClient(client=client or build_gateway_async_locust_http_client(environment))
@@ -1,15 +1,71 @@
-from httpx import Client
+from functools import cache
+
+from httpx import Client, AsyncClient, Limits
 import logging
 
 from locust.env import Environment  # Импорт окружения Locust для передачи в хуки
 from  config import settings
+from tools.config.http import HTTPClientPoolScope
+from clients.http.cache import HTTPResponseCache
 
 from clients.http.event_hooks.locust_event_hook import (
     locust_request_event_hook,  # Хук для отслеживания начала запроса
-    locust_response_event_hook  # Хук для сбора метрик по завершении запроса
+    locust_response_event_hook,  # Хук для сбора метрик по завершении запроса
+    async_locust_request_event_hook,
+    async_locust_response_event_hook
 )
 
 
+def build_gateway_http_limits() -> Limits:
+    """
+    Функция создаёт лимиты пула соединений httpx из настроек http-gateway.
+
+    :return: Объект httpx.Limits.
+    """
+    return Limits(
+        max_connections=settings.gateway_http_client.max_connections,
+        max_keepalive_connections=settings.gateway_http_client.max_keepalive_connections,
+        keepalive_expiry=settings.gateway_http_client.keepalive_expiry
+    )
+
+
+def build_gateway_http_protocols(http2: bool | None = None) -> dict[str, bool]:
+    """
+    Функция возвращает параметры http1/http2 для httpx.Client по настройкам http-gateway.
+
+    Без TLS протокол не согласуется через ALPN, поэтому HTTP/2 включается как h2c
+    с prior knowledge — HTTP/1.1 при этом отключается. По https HTTP/2 согласуется через ALPN.
+
+    :param http2: Использовать HTTP/2; по умолчанию берётся из настройки GATEWAY_HTTP_CLIENT.HTTP2.
+    :return: Словарь с параметрами http1 и http2.
+    """
+    http2 = settings.gateway_http_client.http2 if http2 is None else http2
+    if not http2:
+        return {"http1": True, "http2": False}
+
+    return {"http1": settings.gateway_http_client.is_tls, "http2": True}
+
+
+@cache
+def build_gateway_http_response_cache() -> HTTPResponseCache | None:
+    """
+    Возвращает общий для процесса кеш ответов GET-запросов или None, если кеш выключен
+    настройкой GATEWAY_HTTP_CLIENT.RESPONSE_CACHE.
+
+    Передаётся только в API-клиенты без хуков Locust (сидинг, прогрев, проверка данных),
+    чтобы кеш не искажал результаты нагрузочных сценариев.
+
+    :return: Экземпляр HTTPResponseCache или None.
+    """
+    if not settings.gateway_http_client.response_cache:
+        return None
+
+    return HTTPResponseCache(
+        max_size=settings.gateway_http_client.response_cache_max_size,
+        ttl=settings.gateway_http_client.response_cache_ttl
+    )
+
+
 def build_gateway_http_client() -> Client:
     """
     Функция создаёт экземпляр httpx.Client с базовыми настройками для сервиса http-gateway.
@@ -17,12 +73,28 @@ def build_gateway_http_client() -> Client:
     :return: Готовый к использованию объект httpx.Client.
     """
     return Client(
+        limits=build_gateway_http_limits(),
         timeout=settings.gateway_http_client.timeout,
-        base_url=settings.gateway_http_client.client_url
+        base_url=settings.gateway_http_client.client_url,
+        **build_gateway_http_protocols()
     )
 
 
-def build_gateway_locust_http_client(environment: Environment) -> Client:
+def build_gateway_async_http_client() -> AsyncClient:
+    """
+    Функция создаёт экземпляр httpx.AsyncClient с базовыми настройками для сервиса http-gateway.
+
+    :return: Готовый к использованию объект httpx.AsyncClient.
+    """
+    return AsyncClient(
+        limits=build_gateway_http_limits(),
+        timeout=settings.gateway_http_client.timeout,
+        base_url=settings.gateway_http_client.client_url,
+        **build_gateway_http_protocols()
+    )
+
+
+def build_gateway_locust_http_client(environment: Environment, http2: bool | None = None) -> Client:
     """
     HTTP-клиент, предназначенный специально для нагрузочного тестирования с помощью Locust.
 
@@ -34,18 +106,116 @@ def build_gateway_locust_http_client(environment: Environment) -> Client:
     Таким образом, данный клиент автоматически репортит статистику в Locust
     при каждом выполненном HTTP-запросе.
 
+    Запросы по HTTP/2 попадают в статистику Locust с типом HTTP/2, чтобы их можно было
+    сравнить с HTTP/1.1 в одном отчёте.
+
     :param environment: Объект окружения Locust, необходим для генерации событий метрик.
+    :param http2: Использовать HTTP/2; по умолчанию берётся из настройки GATEWAY_HTTP_CLIENT.HTTP2.
     :return: httpx.Client с подключёнными хуками под нагрузочное тестирование.
     """
     # Подавляем INFO-логи httpx (например: "HTTP Request: GET ... 200 OK")
     # Это избавляет консоль от лишнего вывода при высоконагруженных тестах
     logging.getLogger("httpx").setLevel(logging.WARNING)
 
+    protocols = build_gateway_http_protocols(http2)
+    request_type = "HTTP/2" if protocols["http2"] else "HTTP"
+
     return Client(
+        limits=build_gateway_http_limits(),
         timeout=settings.gateway_http_client.timeout,
         base_url=settings.gateway_http_client.client_url,
         event_hooks={
             "request": [locust_request_event_hook],  # Отмечаем время начала запроса
-            "response": [locust_response_event_hook(environment)]  # Собираем метрики и передаём их в Locust
-        }
+            # Собираем метрики и передаём их в Locust
+            "response": [locust_response_event_hook(environment, request_type=request_type)]
+        },
+        **protocols
+    )
+
+
+@cache
+def build_gateway_locust_http_process_client(environment: Environment) -> Client:
+    """
+    Возвращает один httpx.Client с хуками Locust на весь процесс.
+    Клиент создаётся при первом вызове, дальше возвращается тот же экземпляр.
+
+    :param environment: Объект окружения Locust.
+    :return: Общий для процесса httpx.Client.
+    """
+    return build_gateway_locust_http_client(environment)
+
+
+def build_gateway_locust_http_shared_client(environment: Environment) -> Client | None:
+    """
+    Возвращает httpx.Client, который делят между собой API-клиенты согласно настройке pool_scope.
+
+    - user: новый клиент, который виртуальный пользователь передаёт во все свои API-клиенты;
+    - process: один клиент на весь процесс Locust;
+    - client: None — каждый API-клиент создаёт собственный httpx.Client.
+
+    :param environment: Объект окружения Locust.
+    :return: Общий httpx.Client или None.
+    """
+    match settings.gateway_http_client.pool_scope:
+        case HTTPClientPoolScope.PROCESS:
+            return build_gateway_locust_http_process_client(environment)
+        case HTTPClientPoolScope.USER:
+            return build_gateway_locust_http_client(environment)
+        case _:
+            return None
+
+
+def build_gateway_async_locust_http_client(environment: Environment, http2: bool | None = None) -> AsyncClient:
+    """
+    Асинхронный аналог build_gateway_locust_http_client на httpx.AsyncClient.
+
+    Клиент нужно использовать только внутри event loop'а процесса (см. tools.locust.loop),
+    а создавать — в основном потоке, например в on_start виртуального пользователя.
+
+    :param environment: Объект окружения Locust, необходим для генерации событий метрик.
+    :param http2: Использовать HTTP/2; по умолчанию берётся из настройки GATEWAY_HTTP_CLIENT.HTTP2.
+    :return: httpx.AsyncClient с подключёнными хуками под нагрузочное тестирование.
+    """
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    protocols = build_gateway_http_protocols(http2)
+    request_type = "HTTP/2" if protocols["http2"] else "HTTP"
+
+    return AsyncClient(
+        limits=build_gateway_http_limits(),
+        timeout=settings.gateway_http_client.timeout,
+        base_url=settings.gateway_http_client.client_url,
+        event_hooks={
+            "request": [async_locust_request_event_hook],
+            "response": [async_locust_response_event_hook(environment, request_type=request_type)]
+        },
+        **protocols
     )
+
+
+@cache
+def build_gateway_async_locust_http_process_client(environment: Environment) -> AsyncClient:
+    """
+    Возвращает один httpx.AsyncClient с хуками Locust на весь процесс.
+
+    :param environment: Объект окружения Locust.
+    :return: Общий для процесса httpx.AsyncClient.
+    """
+    return build_gateway_async_locust_http_client(environment)
+
+
+def build_gateway_async_locust_http_shared_client(environment: Environment) -> AsyncClient | None:
+    """
+    Асинхронный аналог build_gateway_locust_http_shared_client: возвращает httpx.AsyncClient,
+    который делят между собой API-клиенты согласно настройке pool_scope.
+
+    :param environment: Объект окружения Locust.
+    :return: Общий httpx.AsyncClient или None.
+    """
+    match settings.gateway_http_client.pool_scope:
+        case HTTPClientPoolScope.PROCESS:
+            return build_gateway_async_locust_http_process_client(environment)
+        case HTTPClientPoolScope.USER:
+            return build_gateway_async_locust_http_client(environment)
+        case _:
+            return None
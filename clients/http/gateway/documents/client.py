@@ -1,19 +1,30 @@
-from httpx import Response
+from httpx import Response, Client, AsyncClient
 from locust.env import Environment
 
-from clients.http.client import HTTPClient, HTTPClientExtensions
-from clients.http.gateway.client import build_gateway_http_client, build_gateway_locust_http_client
+from clients.http.client import BaseHTTPClient, HTTPClient, AsyncHTTPClient, HTTPClientExtensions
+from clients.http.parsing import LazySchema
+from clients.http.gateway.client import (
+    build_gateway_http_client,
+    build_gateway_http_response_cache,
+    build_gateway_async_http_client,
+    build_gateway_locust_http_client,
+    build_gateway_async_locust_http_client
+)
 from clients.http.gateway.documents.schema import (
     GetContractDocumentResponseSchema,
     GetTariffDocumentResponseSchema
 )
 
+from tools.config.http import HTTPResponseParsingMode
 from tools.routes import APIRoutes
 
 
-class DocumentsGatewayHTTPClient(HTTPClient):
+class BaseDocumentsGatewayHTTPClient(BaseHTTPClient):
     """
-    Клиент для взаимодействия с /api/v1/documents сервиса http-gateway.
+    Низкоуровневые запросы к /api/v1/documents сервиса http-gateway, общие для синхронного и асинхронного клиента.
+
+    Методы *_api возвращают результат get/post транспорта: httpx.Response в DocumentsGatewayHTTPClient
+    и корутину, которую нужно await'ить, в AsyncDocumentsGatewayHTTPClient.
     """
 
     def get_tariff_document_api(self, account_id: str) -> Response:
@@ -40,25 +51,71 @@ class DocumentsGatewayHTTPClient(HTTPClient):
             extensions=HTTPClientExtensions(route=f"{APIRoutes.DOCUMENTS}/contract-document/{{account_id}}")
         )
 
-    def get_tariff_document(self, account_id: str) -> GetTariffDocumentResponseSchema:
+
+class DocumentsGatewayHTTPClient(BaseDocumentsGatewayHTTPClient, HTTPClient):
+    """
+    Клиент для взаимодействия с /api/v1/documents сервиса http-gateway.
+    """
+
+    def get_tariff_document(
+            self,
+            account_id: str,
+            discard: bool = False
+    ) -> GetTariffDocumentResponseSchema | LazySchema | None:
         response = self.get_tariff_document_api(account_id)
-        return GetTariffDocumentResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, GetTariffDocumentResponseSchema, discard)
 
-    def get_contract_document(self, account_id: str) -> GetContractDocumentResponseSchema:
+    def get_contract_document(
+            self,
+            account_id: str,
+            discard: bool = False
+    ) -> GetContractDocumentResponseSchema | LazySchema | None:
         response = self.get_contract_document_api(account_id)
-        return GetContractDocumentResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, GetContractDocumentResponseSchema, discard)
+
+
+class AsyncDocumentsGatewayHTTPClient(BaseDocumentsGatewayHTTPClient, AsyncHTTPClient):
+    """
+    Асинхронный клиент для взаимодействия с /api/v1/documents сервиса http-gateway.
+    """
+
+    async def get_tariff_document(
+            self,
+            account_id: str,
+            discard: bool = False
+    ) -> GetTariffDocumentResponseSchema | LazySchema | None:
+        response = await self.get_tariff_document_api(account_id)
+        return self.parse_response(response, GetTariffDocumentResponseSchema, discard)
 
+    async def get_contract_document(
+            self,
+            account_id: str,
+            discard: bool = False
+    ) -> GetContractDocumentResponseSchema | LazySchema | None:
+        response = await self.get_contract_document_api(account_id)
+        return self.parse_response(response, GetContractDocumentResponseSchema, discard)
 
-def build_documents_gateway_http_client() -> DocumentsGatewayHTTPClient:
+
+def build_documents_gateway_http_client(client: Client | None = None) -> DocumentsGatewayHTTPClient:
     """
     Функция создаёт экземпляр DocumentsGatewayHTTPClient с уже настроенным HTTP-клиентом.
+    GET-запросы кешируются, если включена настройка GATEWAY_HTTP_CLIENT.RESPONSE_CACHE.
+    Ответы разбираются полностью независимо от GATEWAY_HTTP_CLIENT.PARSING_MODE: сидинг читает их поля.
 
+    :param client: общий httpx.Client; если не передан, будет создан новый.
     :return: Готовый к использованию DocumentsGatewayHTTPClient.
     """
-    return DocumentsGatewayHTTPClient(client=build_gateway_http_client())
+    return DocumentsGatewayHTTPClient(
+        client=client or build_gateway_http_client(),
+        parsing_mode=HTTPResponseParsingMode.FULL,
+        cache=build_gateway_http_response_cache()
+    )
 
 
-def build_documents_gateway_locust_http_client(environment: Environment) -> DocumentsGatewayHTTPClient:
+def build_documents_gateway_locust_http_client(
+        environment: Environment,
+        client: Client | None = None
+) -> DocumentsGatewayHTTPClient:
     """
     Функция создаёт экземпляр DocumentsGatewayHTTPClient адаптированного под Locust.
 
@@ -66,6 +123,42 @@ def build_documents_gateway_locust_http_client(environment: Environment) -> Docu
     Используется исключительно в нагрузочных тестах.
 
     :param environment: объект окружения Locust.
+    :param client: общий httpx.Client с хуками Locust (см. build_gateway_locust_http_shared_client);
+        если не передан, будет создан новый.
     :return: экземпляр DocumentsGatewayHTTPClient с хуками сбора метрик.
     """
-    return DocumentsGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
+    return DocumentsGatewayHTTPClient(client=client or build_gateway_locust_http_client(environment))
+
+
+def build_documents_gateway_async_http_client(
+        client: AsyncClient | None = None
+) -> AsyncDocumentsGatewayHTTPClient:
+    """
+    Функция создаёт экземпляр AsyncDocumentsGatewayHTTPClient.
+    GET-запросы кешируются, если включена настройка GATEWAY_HTTP_CLIENT.RESPONSE_CACHE.
+    Ответы разбираются полностью независимо от GATEWAY_HTTP_CLIENT.PARSING_MODE: сидинг читает их поля.
+
+    :param client: общий httpx.AsyncClient; если не передан, будет создан новый.
+    :return: Готовый к использованию AsyncDocumentsGatewayHTTPClient.
+    """
+    return AsyncDocumentsGatewayHTTPClient(
+        client=client or build_gateway_async_http_client(),
+        parsing_mode=HTTPResponseParsingMode.FULL,
+        cache=build_gateway_http_response_cache()
+    )
+
+
+def build_documents_gateway_async_locust_http_client(
+        environment: Environment,
+        client: AsyncClient | None = None
+) -> AsyncDocumentsGatewayHTTPClient:
+    """
+    Функция создаёт экземпляр AsyncDocumentsGatewayHTTPClient адаптированного под Locust.
+
+    Клиент выполняется в event loop'е процесса (см. tools.locust.loop) и передаёт метрики в Locust через хуки.
+
+    :param environment: объект окружения Locust.
+    :param client: общий httpx.AsyncClient с хуками Locust; если не передан, будет создан новый.
+    :return: экземпляр AsyncDocumentsGatewayHTTPClient с хуками сбора метрик.
+    """
+    return AsyncDocumentsGatewayHTTPClient(client=client or build_gateway_async_locust_http_client(environment))
@@ -1,17 +1,43 @@
+import inspect
+
 from locust import TaskSet, SequentialTaskSet
 
 # Импортируем типы и билдеры для построения HTTP API клиентов
-from clients.http.gateway.accounts.client import AccountsGatewayHTTPClient, build_accounts_gateway_locust_http_client
-from clients.http.gateway.cards.client import CardsGatewayHTTPClient, build_cards_gateway_locust_http_client
+from clients.http.gateway.accounts.client import (
+    AccountsGatewayHTTPClient,
+    AsyncAccountsGatewayHTTPClient,
+    build_accounts_gateway_locust_http_client,
+    build_accounts_gateway_async_locust_http_client
+)
+from clients.http.gateway.cards.client import (
+    CardsGatewayHTTPClient,
+    AsyncCardsGatewayHTTPClient,
+    build_cards_gateway_locust_http_client,
+    build_cards_gateway_async_locust_http_client
+)
+from clients.http.gateway.client import (
+    build_gateway_locust_http_shared_client,
+    build_gateway_async_locust_http_shared_client
+)
 from clients.http.gateway.documents.client import (
     DocumentsGatewayHTTPClient,
-    build_documents_gateway_locust_http_client
+    AsyncDocumentsGatewayHTTPClient,
+    build_documents_gateway_locust_http_client,
+    build_documents_gateway_async_locust_http_client
 )
 from clients.http.gateway.operations.client import (
     OperationsGatewayHTTPClient,
-    build_operations_gateway_locust_http_client
+    AsyncOperationsGatewayHTTPClient,
+    build_operations_gateway_locust_http_client,
+    build_operations_gateway_async_locust_http_client
+)
+from clients.http.gateway.users.client import (
+    UsersGatewayHTTPClient,
+    AsyncUsersGatewayHTTPClient,
+    build_users_gateway_locust_http_client,
+    build_users_gateway_async_locust_http_client
 )
-from clients.http.gateway.users.client import UsersGatewayHTTPClient, build_users_gateway_locust_http_client
+from tools.locust.user import AsyncLocustBaseUser
 
 
 class GatewayHTTPTaskSet(TaskSet):
@@ -34,11 +60,14 @@ class GatewayHTTPTaskSet(TaskSet):
         Метод вызывается перед запуском задач TaskSet.
         Здесь создаются API клиенты с использованием контекста окружения Locust.
         """
-        self.users_gateway_client = build_users_gateway_locust_http_client(self.user.environment)
-        self.cards_gateway_client = build_cards_gateway_locust_http_client(self.user.environment)
-        self.accounts_gateway_client = build_accounts_gateway_locust_http_client(self.user.environment)
-        self.documents_gateway_client = build_documents_gateway_locust_http_client(self.user.environment)
-        self.operations_gateway_client = build_operations_gateway_locust_http_client(self.user.environment)
+        # Все API клиенты используют один пул соединений (см. GATEWAY_HTTP_CLIENT.POOL_SCOPE)
+        client = build_gateway_locust_http_shared_client(self.user.environment)
+
+        self.users_gateway_client = build_users_gateway_locust_http_client(self.user.environment, client)
+        self.cards_gateway_client = build_cards_gateway_locust_http_client(self.user.environment, client)
+        self.accounts_gateway_client = build_accounts_gateway_locust_http_client(self.user.environment, client)
+        self.documents_gateway_client = build_documents_gateway_locust_http_client(self.user.environment, client)
+        self.operations_gateway_client = build_operations_gateway_locust_http_client(self.user.environment, client)
 
 
 class GatewayHTTPSequentialTaskSet(SequentialTaskSet):
@@ -59,8 +88,55 @@ class GatewayHTTPSequentialTaskSet(SequentialTaskSet):
         """
         Создание API клиентов для последовательного сценария.
         """
-        self.users_gateway_client = build_users_gateway_locust_http_client(self.user.environment)
-        self.cards_gateway_client = build_cards_gateway_locust_http_client(self.user.environment)
-        self.accounts_gateway_client = build_accounts_gateway_locust_http_client(self.user.environment)
-        self.documents_gateway_client = build_documents_gateway_locust_http_client(self.user.environment)
-        self.operations_gateway_client = build_operations_gateway_locust_http_client(self.user.environment)
+        # Все API клиенты используют один пул соединений (см. GATEWAY_HTTP_CLIENT.POOL_SCOPE)
+        client = build_gateway_locust_http_shared_client(self.user.environment)
+
+        self.users_gateway_client = build_users_gateway_locust_http_client(self.user.environment, client)
+        self.cards_gateway_client = build_cards_gateway_locust_http_client(self.user.environment, client)
+        self.accounts_gateway_client = build_accounts_gateway_locust_http_client(self.user.environment, client)
+        self.documents_gateway_client = build_documents_gateway_locust_http_client(self.user.environment, client)
+        self.operations_gateway_client = build_operations_gateway_locust_http_client(self.user.environment, client)
+
+
+class AsyncGatewayHTTPTaskSet(TaskSet):
+    """
+    Базовый TaskSet для асинхронных HTTP-сценариев, работающих с http-gateway.
+
+    Используется вместе с AsyncLocustBaseUser. Задачи объявляются как async def и выполняются
+    в event loop'е процесса, а API клиенты построены на httpx.AsyncClient.
+    Синхронные задачи по-прежнему поддерживаются.
+    """
+
+    user: AsyncLocustBaseUser
+
+    users_gateway_client: AsyncUsersGatewayHTTPClient
+    cards_gateway_client: AsyncCardsGatewayHTTPClient
+    accounts_gateway_client: AsyncAccountsGatewayHTTPClient
+    documents_gateway_client: AsyncDocumentsGatewayHTTPClient
+    operations_gateway_client: AsyncOperationsGatewayHTTPClient
+
+    def on_start(self) -> None:
+        """
+        Создание асинхронных API клиентов. Клиенты создаются в основном потоке,
+        а используются только внутри event loop'а.
+        """
+        client = build_gateway_async_locust_http_shared_client(self.user.environment)
+
+        self.users_gateway_client = build_users_gateway_async_locust_http_client(self.user.environment, client)
+        self.cards_gateway_client = build_cards_gateway_async_locust_http_client(self.user.environment, client)
+        self.accounts_gateway_client = build_accounts_gateway_async_locust_http_client(self.user.environment, client)
+        self.documents_gateway_client = build_documents_gateway_async_locust_http_client(
+            self.user.environment, client
+        )
+        self.operations_gateway_client = build_operations_gateway_async_locust_http_client(
+            self.user.environment, client
+        )
+
+    def execute_task(self, task) -> None:
+        """
+        Выполняет задачу: корутины отправляются в event loop процесса, обычные функции — как в TaskSet.
+        """
+        if inspect.iscoroutinefunction(task):
+            self.user.run_coroutine(task(self))
+        else:
+            super().execute_task(task)
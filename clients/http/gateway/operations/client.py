@@ -1,11 +1,16 @@
-from httpx import Response, QueryParams
+from httpx import Response, Client, QueryParams, AsyncClient
 from locust.env import Environment
 
-from clients.http.client import HTTPClient, HTTPClientExtensions
+from clients.http.client import BaseHTTPClient, HTTPClient, AsyncHTTPClient, HTTPClientExtensions
+from clients.http.parsing import LazySchema
 from clients.http.gateway.client import (
     build_gateway_http_client,
-    build_gateway_locust_http_client
+    build_gateway_http_response_cache,
+    build_gateway_async_http_client,
+    build_gateway_locust_http_client,
+    build_gateway_async_locust_http_client
 )
+from clients.http.templates import build_request_body
 from clients.http.gateway.operations.schema import (
     GetOperationsQuerySchema, GetOperationsSummaryQuerySchema, MakeFeeOperationRequestSchema,
     MakeTopUpOperationRequestSchema, MakeCashbackOperationRequestSchema, MakeTransferOperationRequestSchema,
@@ -16,12 +21,16 @@ from clients.http.gateway.operations.schema import (
     MakePurchaseOperationResponseSchema, MakeBillPaymentOperationResponseSchema,
     MakeCashWithdrawalOperationResponseSchema)
 
+from tools.config.http import HTTPResponseParsingMode
 from tools.routes import APIRoutes
 
 
-class OperationsGatewayHTTPClient(HTTPClient):
+class BaseOperationsGatewayHTTPClient(BaseHTTPClient):
     """
-    Клиент для взаимодействия с /api/v1/operations сервиса http-gateway.
+    Низкоуровневые запросы к /api/v1/operations сервиса http-gateway, общие для синхронного и асинхронного клиента.
+
+    Методы *_api возвращают результат get/post транспорта: httpx.Response в OperationsGatewayHTTPClient
+    и корутину, которую нужно await'ить, в AsyncOperationsGatewayHTTPClient.
     """
 
     def get_operation_api(self, operation_id: str) -> Response:
@@ -74,169 +83,316 @@ class OperationsGatewayHTTPClient(HTTPClient):
             extensions=HTTPClientExtensions(route=f"{APIRoutes.OPERATIONS}/operations-summary")
         )
 
-    def make_fee_operation_api(self, request: MakeFeeOperationRequestSchema) -> Response:
+    def make_fee_operation_api(self, request: MakeFeeOperationRequestSchema | bytes) -> Response:
         """
         Выполняет POST-запрос для создания операции комиссии.
 
-        :param request: Словарь с данными операции.
+        :param request: Схема с данными операции или готовое JSON-тело из шаблона.
         :return: Объект httpx.Response.
         """
         return self.post(
             url=f"{APIRoutes.OPERATIONS}/make-fee-operation",
-            json=request.model_dump(by_alias=True))
+            **build_request_body(request))
 
-    def make_top_up_operation_api(self, request: MakeTopUpOperationRequestSchema) -> Response:
+    def make_top_up_operation_api(self, request: MakeTopUpOperationRequestSchema | bytes) -> Response:
         """
         Выполняет POST-запрос для создания операции пополнения.
 
-        :param request: Словарь с данными операции.
+        :param request: Схема с данными операции или готовое JSON-тело из шаблона.
         :return: Объект httpx.Response.
         """
         return self.post(
             url=f"{APIRoutes.OPERATIONS}/make-top-up-operation",
-            json=request.model_dump(by_alias=True))
+            **build_request_body(request))
 
-    def make_cashback_operation_api(self, request: MakeCashbackOperationRequestSchema) -> Response:
+    def make_cashback_operation_api(self, request: MakeCashbackOperationRequestSchema | bytes) -> Response:
         """
         Выполняет POST-запрос для создания операции кэшбэка.
 
-        :param request: Словарь с данными операции.
+        :param request: Схема с данными операции или готовое JSON-тело из шаблона.
         :return: Объект httpx.Response.
         """
         return self.post(
             url=f"{APIRoutes.OPERATIONS}/make-cashback-operation",
-            json=request.model_dump(by_alias=True))
+            **build_request_body(request))
 
-    def make_transfer_operation_api(self, request: MakeTransferOperationRequestSchema) -> Response:
+    def make_transfer_operation_api(self, request: MakeTransferOperationRequestSchema | bytes) -> Response:
         """
         Выполняет POST-запрос для создания операции перевода.
 
-        :param request: Словарь с данными операции.
+        :param request: Схема с данными операции или готовое JSON-тело из шаблона.
         :return: Объект httpx.Response.
         """
         return self.post(
             url=f"{APIRoutes.OPERATIONS}/make-transfer-operation",
-            json=request.model_dump(by_alias=True))
+            **build_request_body(request))
 
-    def make_purchase_operation_api(self, request: MakePurchaseOperationRequestSchema) -> Response:
+    def make_purchase_operation_api(self, request: MakePurchaseOperationRequestSchema | bytes) -> Response:
         """
         Выполняет POST-запрос для создания операции покупки.
 
-        :param request: Словарь с данными операции.
+        :param request: Схема с данными операции или готовое JSON-тело из шаблона.
         :return: Объект httpx.Response.
         """
         return self.post(
             url=f"{APIRoutes.OPERATIONS}/make-purchase-operation",
-            json=request.model_dump(by_alias=True))
+            **build_request_body(request))
 
-    def make_bill_payment_operation_api(self, request: MakeBillPaymentOperationRequestSchema) -> Response:
+    def make_bill_payment_operation_api(self, request: MakeBillPaymentOperationRequestSchema | bytes) -> Response:
         """
         Выполняет POST-запрос для создания операции оплаты по счету.
 
-        :param request: Словарь с данными операции.
+        :param request: Схема с данными операции или готовое JSON-тело из шаблона.
         :return: Объект httpx.Response.
         """
         return self.post(
             url=f"{APIRoutes.OPERATIONS}/make-bill-payment-operation",
-            json=request.model_dump(by_alias=True))
+            **build_request_body(request))
 
-    def make_cash_withdrawal_operation_api(self, request: MakeCashWithdrawalOperationRequestSchema) -> Response:
+    def make_cash_withdrawal_operation_api(self, request: MakeCashWithdrawalOperationRequestSchema | bytes) -> Response:
         """
         Выполняет POST-запрос для создания операции снятия наличных денег.
 
-        :param request: Словарь с данными операции.
+        :param request: Схема с данными операции или готовое JSON-тело из шаблона.
         :return: Объект httpx.Response.
         """
         return self.post(
             url=f"{APIRoutes.OPERATIONS}/make-cash-withdrawal-operation",
-            json=request.model_dump(by_alias=True))
+            **build_request_body(request))
+
+
+class OperationsGatewayHTTPClient(BaseOperationsGatewayHTTPClient, HTTPClient):
+    """
+    Клиент для взаимодействия с /api/v1/operations сервиса http-gateway.
+    """
 
-    def get_operation(self, operation_id: str) -> GetOperationResponseSchema:
+    def get_operation(self, operation_id: str, discard: bool = False) -> GetOperationResponseSchema | LazySchema | None:
         response = self.get_operation_api(operation_id=operation_id)
-        return GetOperationResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, GetOperationResponseSchema, discard)
 
-    def get_operation_receipt(self, operation_id: str) -> GetReceiptResponseSchema:
+    def get_operation_receipt(
+            self,
+            operation_id: str,
+            discard: bool = False
+    ) -> GetReceiptResponseSchema | LazySchema | None:
         response = self.get_operation_receipt_api(operation_id=operation_id)
-        return GetReceiptResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, GetReceiptResponseSchema, discard)
 
-    def get_operations(self, account_id: str) -> GetOperationsResponseSchema:
+    def get_operations(self, account_id: str, discard: bool = False) -> GetOperationsResponseSchema | LazySchema | None:
         query = GetOperationsQuerySchema(account_id=account_id)
         response = self.get_operations_api(query)
-        return GetOperationsResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, GetOperationsResponseSchema, discard)
 
-    def get_operations_summary(self, account_id: str) -> GetOperationsSummaryResponseSchema:
+    def get_operations_summary(
+            self,
+            account_id: str,
+            discard: bool = False
+    ) -> GetOperationsSummaryResponseSchema | LazySchema | None:
         query = GetOperationsSummaryQuerySchema(account_id=account_id)
         response = self.get_operations_summary_api(query)
-        return GetOperationsSummaryResponseSchema.model_validate_json(response.text)
-
-    def make_fee_operation(self, card_id: str, account_id: str) -> MakeFeeOperationResponseSchema:
-        request = MakeFeeOperationRequestSchema(
-            card_id=card_id,
-            account_id=account_id
-        )
+        return self.parse_response(response, GetOperationsSummaryResponseSchema, discard)
+
+    def make_fee_operation(
+            self,
+            card_id: str,
+            account_id: str,
+            discard: bool = False
+    ) -> MakeFeeOperationResponseSchema | LazySchema | None:
+        request = self.build_request(MakeFeeOperationRequestSchema, card_id=card_id, account_id=account_id)
         response = self.make_fee_operation_api(request)
-        return MakeFeeOperationResponseSchema.model_validate_json(response.text)
-
-    def make_top_up_operation(self, card_id: str, account_id: str) -> MakeTopUpOperationResponseSchema:
-        request = MakeTopUpOperationRequestSchema(
-            card_id=card_id,
-            account_id=account_id
-        )
+        return self.parse_response(response, MakeFeeOperationResponseSchema, discard)
+
+    def make_top_up_operation(
+            self,
+            card_id: str,
+            account_id: str,
+            discard: bool = False
+    ) -> MakeTopUpOperationResponseSchema | LazySchema | None:
+        request = self.build_request(MakeTopUpOperationRequestSchema, card_id=card_id, account_id=account_id)
         response = self.make_top_up_operation_api(request)
-        return MakeTopUpOperationResponseSchema.model_validate_json(response.text)
-
-    def make_cashback_operation(self, card_id: str, account_id: str) -> MakeCashbackOperationResponseSchema:
-        request = MakeCashbackOperationRequestSchema(
-            card_id=card_id,
-            account_id=account_id
-        )
+        return self.parse_response(response, MakeTopUpOperationResponseSchema, discard)
+
+    def make_cashback_operation(
+            self,
+            card_id: str,
+            account_id: str,
+            discard: bool = False
+    ) -> MakeCashbackOperationResponseSchema | LazySchema | None:
+        request = self.build_request(MakeCashbackOperationRequestSchema, card_id=card_id, account_id=account_id)
         response = self.make_cashback_operation_api(request)
-        return response.json()
-
-    def make_transfer_operation(self, card_id: str, account_id: str) -> MakeTransferOperationResponseSchema:
-        request = MakeTransferOperationRequestSchema(
-            card_id=card_id,
-            account_id=account_id
-        )
+        return self.parse_response(response, MakeCashbackOperationResponseSchema, discard)
+
+    def make_transfer_operation(
+            self,
+            card_id: str,
+            account_id: str,
+            discard: bool = False
+    ) -> MakeTransferOperationResponseSchema | LazySchema | None:
+        request = self.build_request(MakeTransferOperationRequestSchema, card_id=card_id, account_id=account_id)
         response = self.make_transfer_operation_api(request)
-        return response.json()
-
-    def make_purchase_operation(self, card_id: str, account_id: str) -> MakePurchaseOperationResponseSchema:
-        request = MakePurchaseOperationRequestSchema(
-            card_id=card_id,
-            account_id=account_id
-        )
+        return self.parse_response(response, MakeTransferOperationResponseSchema, discard)
+
+    def make_purchase_operation(
+            self,
+            card_id: str,
+            account_id: str,
+            discard: bool = False
+    ) -> MakePurchaseOperationResponseSchema | LazySchema | None:
+        request = self.build_request(MakePurchaseOperationRequestSchema, card_id=card_id, account_id=account_id)
         response = self.make_purchase_operation_api(request)
-        return MakePurchaseOperationResponseSchema.model_validate_json(response.text)
-
-    def make_bill_payment_operation(self, card_id: str, account_id: str) -> MakeBillPaymentOperationResponseSchema:
-        request = MakeBillPaymentOperationRequestSchema(
-            card_id=card_id,
-            account_id=account_id
-        )
+        return self.parse_response(response, MakePurchaseOperationResponseSchema, discard)
+
+    def make_bill_payment_operation(
+            self,
+            card_id: str,
+            account_id: str,
+            discard: bool = False
+    ) -> MakeBillPaymentOperationResponseSchema | LazySchema | None:
+        request = self.build_request(MakeBillPaymentOperationRequestSchema, card_id=card_id, account_id=account_id)
         response = self.make_bill_payment_operation_api(request)
-        return MakeBillPaymentOperationResponseSchema.model_validate_json(response.text)
-
-    def make_cash_withdrawal_operation(self, card_id: str,
-                                       account_id: str) -> MakeCashWithdrawalOperationResponseSchema:
-        request = MakeCashWithdrawalOperationRequestSchema(
-            card_id=card_id,
-            account_id=account_id
-        )
+        return self.parse_response(response, MakeBillPaymentOperationResponseSchema, discard)
+
+    def make_cash_withdrawal_operation(
+            self,
+            card_id: str,
+            account_id: str,
+            discard: bool = False
+    ) -> MakeCashWithdrawalOperationResponseSchema | LazySchema | None:
+        request = self.build_request(MakeCashWithdrawalOperationRequestSchema, card_id=card_id, account_id=account_id)
         response = self.make_cash_withdrawal_operation_api(request)
-        return MakeCashWithdrawalOperationResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, MakeCashWithdrawalOperationResponseSchema, discard)
+
 
+class AsyncOperationsGatewayHTTPClient(BaseOperationsGatewayHTTPClient, AsyncHTTPClient):
+    """
+    Асинхронный клиент для взаимодействия с /api/v1/operations сервиса http-gateway.
+    """
 
-def build_operations_gateway_http_client() -> OperationsGatewayHTTPClient:
+    async def get_operation(
+            self,
+            operation_id: str,
+            discard: bool = False
+    ) -> GetOperationResponseSchema | LazySchema | None:
+        response = await self.get_operation_api(operation_id=operation_id)
+        return self.parse_response(response, GetOperationResponseSchema, discard)
+
+    async def get_operation_receipt(
+            self,
+            operation_id: str,
+            discard: bool = False
+    ) -> GetReceiptResponseSchema | LazySchema | None:
+        response = await self.get_operation_receipt_api(operation_id=operation_id)
+        return self.parse_response(response, GetReceiptResponseSchema, discard)
+
+    async def get_operations(
+            self,
+            account_id: str,
+            discard: bool = False
+    ) -> GetOperationsResponseSchema | LazySchema | None:
+        query = GetOperationsQuerySchema(account_id=account_id)
+        response = await self.get_operations_api(query)
+        return self.parse_response(response, GetOperationsResponseSchema, discard)
+
+    async def get_operations_summary(
+            self,
+            account_id: str,
+            discard: bool = False
+    ) -> GetOperationsSummaryResponseSchema | LazySchema | None:
+        query = GetOperationsSummaryQuerySchema(account_id=account_id)
+        response = await self.get_operations_summary_api(query)
+        return self.parse_response(response, GetOperationsSummaryResponseSchema, discard)
+
+    async def make_fee_operation(
+            self,
+            card_id: str,
+            account_id: str,
+            discard: bool = False
+    ) -> MakeFeeOperationResponseSchema | LazySchema | None:
+        request = self.build_request(MakeFeeOperationRequestSchema, card_id=card_id, account_id=account_id)
+        response = await self.make_fee_operation_api(request)
+        return self.parse_response(response, MakeFeeOperationResponseSchema, discard)
+
+    async def make_top_up_operation(
+            self,
+            card_id: str,
+            account_id: str,
+            discard: bool = False
+    ) -> MakeTopUpOperationResponseSchema | LazySchema | None:
+        request = self.build_request(MakeTopUpOperationRequestSchema, card_id=card_id, account_id=account_id)
+        response = await self.make_top_up_operation_api(request)
+        return self.parse_response(response, MakeTopUpOperationResponseSchema, discard)
+
+    async def make_cashback_operation(
+            self,
+            card_id: str,
+            account_id: str,
+            discard: bool = False
+    ) -> MakeCashbackOperationResponseSchema | LazySchema | None:
+        request = self.build_request(MakeCashbackOperationRequestSchema, card_id=card_id, account_id=account_id)
+        response = await self.make_cashback_operation_api(request)
+        return self.parse_response(response, MakeCashbackOperationResponseSchema, discard)
+
+    async def make_transfer_operation(
+            self,
+            card_id: str,
+            account_id: str,
+            discard: bool = False
+    ) -> MakeTransferOperationResponseSchema | LazySchema | None:
+        request = self.build_request(MakeTransferOperationRequestSchema, card_id=card_id, account_id=account_id)
+        response = await self.make_transfer_operation_api(request)
+        return self.parse_response(response, MakeTransferOperationResponseSchema, discard)
+
+    async def make_purchase_operation(
+            self,
+            card_id: str,
+            account_id: str,
+            discard: bool = False
+    ) -> MakePurchaseOperationResponseSchema | LazySchema | None:
+        request = self.build_request(MakePurchaseOperationRequestSchema, card_id=card_id, account_id=account_id)
+        response = await self.make_purchase_operation_api(request)
+        return self.parse_response(response, MakePurchaseOperationResponseSchema, discard)
+
+    async def make_bill_payment_operation(
+            self,
+            card_id: str,
+            account_id: str,
+            discard: bool = False
+    ) -> MakeBillPaymentOperationResponseSchema | LazySchema | None:
+        request = self.build_request(MakeBillPaymentOperationRequestSchema, card_id=card_id, account_id=account_id)
+        response = await self.make_bill_payment_operation_api(request)
+        return self.parse_response(response, MakeBillPaymentOperationResponseSchema, discard)
+
+    async def make_cash_withdrawal_operation(
+            self,
+            card_id: str,
+            account_id: str,
+            discard: bool = False
+    ) -> MakeCashWithdrawalOperationResponseSchema | LazySchema | None:
+        request = self.build_request(MakeCashWithdrawalOperationRequestSchema, card_id=card_id, account_id=account_id)
+        response = await self.make_cash_withdrawal_operation_api(request)
+        return self.parse_response(response, MakeCashWithdrawalOperationResponseSchema, discard)
+
+
+def build_operations_gateway_http_client(client: Client | None = None) -> OperationsGatewayHTTPClient:
     """
     Функция создаёт экземпляр OperationsGatewayHTTPClient с уже настроенным HTTP-клиентом.
+    GET-запросы кешируются, если включена настройка GATEWAY_HTTP_CLIENT.RESPONSE_CACHE.
+    Ответы разбираются полностью независимо от GATEWAY_HTTP_CLIENT.PARSING_MODE: сидинг читает их поля.
 
+    :param client: общий httpx.Client; если не передан, будет создан новый.
     :return: Готовый к использованию DocumentsGatewayHTTPClient.
     """
-    return OperationsGatewayHTTPClient(client=build_gateway_http_client())
+    return OperationsGatewayHTTPClient(
+        client=client or build_gateway_http_client(),
+        parsing_mode=HTTPResponseParsingMode.FULL,
+        cache=build_gateway_http_response_cache()
+    )
 
 
-def build_operations_gateway_locust_http_client(environment: Environment) -> OperationsGatewayHTTPClient:
+def build_operations_gateway_locust_http_client(
+        environment: Environment,
+        client: Client | None = None
+) -> OperationsGatewayHTTPClient:
     """
     Функция создаёт экземпляр OperationsGatewayHTTPClient адаптированного под Locust.
 
@@ -244,6 +400,42 @@ def build_operations_gateway_locust_http_client(environment: Environment) -> Ope
     Используется исключительно в нагрузочных тестах.
 
     :param environment: объект окружения Locust.
+    :param client: общий httpx.Client с хуками Locust (см. build_gateway_locust_http_shared_client);
+        если не передан, будет создан новый.
     :return: экземпляр OperationsGatewayHTTPClient с хуками сбора метрик.
     """
-    return OperationsGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
+    return OperationsGatewayHTTPClient(client=client or build_gateway_locust_http_client(environment))
+
+
+def build_operations_gateway_async_http_client(
+        client: AsyncClient | None = None
+) -> AsyncOperationsGatewayHTTPClient:
+    """
+    Функция создаёт экземпляр AsyncOperationsGatewayHTTPClient.
+    GET-запросы кешируются, если включена настройка GATEWAY_HTTP_CLIENT.RESPONSE_CACHE.
+    Ответы разбираются полностью независимо от GATEWAY_HTTP_CLIENT.PARSING_MODE: сидинг читает их поля.
+
+    :param client: общий httpx.AsyncClient; если не передан, будет создан новый.
+    :return: Готовый к использованию AsyncOperationsGatewayHTTPClient.
+    """
+    return AsyncOperationsGatewayHTTPClient(
+        client=client or build_gateway_async_http_client(),
+        parsing_mode=HTTPResponseParsingMode.FULL,
+        cache=build_gateway_http_response_cache()
+    )
+
+
+def build_operations_gateway_async_locust_http_client(
+        environment: Environment,
+        client: AsyncClient | None = None
+) -> AsyncOperationsGatewayHTTPClient:
+    """
+    Функция создаёт экземпляр AsyncOperationsGatewayHTTPClient адаптированного под Locust.
+
+    Клиент выполняется в event loop'е процесса (см. tools.locust.loop) и передаёт метрики в Locust через хуки.
+
+    :param environment: объект окружения Locust.
+    :param client: общий httpx.AsyncClient с хуками Locust; если не передан, будет создан новый.
+    :return: экземпляр AsyncOperationsGatewayHTTPClient с хуками сбора метрик.
+    """
+    return AsyncOperationsGatewayHTTPClient(client=client or build_gateway_async_locust_http_client(environment))
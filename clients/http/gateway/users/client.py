@@ -1,10 +1,14 @@
-from httpx import Response
+from httpx import Response, Client, AsyncClient
 from locust.env import Environment  # Импорт окружения Locust для передачи в хуки
 
-from clients.http.client import HTTPClient, HTTPClientExtensions
+from clients.http.client import BaseHTTPClient, HTTPClient, AsyncHTTPClient, HTTPClientExtensions
+from clients.http.parsing import LazySchema
 from clients.http.gateway.client import (
     build_gateway_http_client,
-    build_gateway_locust_http_client
+    build_gateway_http_response_cache,
+    build_gateway_async_http_client,
+    build_gateway_locust_http_client,
+    build_gateway_async_locust_http_client
 )
 from clients.http.gateway.users.schema import (
     GetUserResponseSchema,
@@ -12,11 +16,15 @@ from clients.http.gateway.users.schema import (
     CreateUserRequestSchema
 )
 
+from tools.config.http import HTTPResponseParsingMode
 from tools.routes import APIRoutes
 
-class UsersGatewayHTTPClient(HTTPClient):
+class BaseUsersGatewayHTTPClient(BaseHTTPClient):
     """
-    Клиент для взаимодействия с /api/v1/users сервиса http-gateway.
+    Низкоуровневые запросы к /api/v1/users сервиса http-gateway, общие для синхронного и асинхронного клиента.
+
+    Методы *_api возвращают результат get/post транспорта: httpx.Response в UsersGatewayHTTPClient
+    и корутину, которую нужно await'ить, в AsyncUsersGatewayHTTPClient.
     """
 
     def get_user_api(self, user_id: str) -> Response:
@@ -40,26 +48,57 @@ class UsersGatewayHTTPClient(HTTPClient):
         """
         return self.post(APIRoutes.USERS, json=request.model_dump(by_alias=True))
 
-    def get_user(self, user_id: str) -> GetUserResponseSchema:
+
+class UsersGatewayHTTPClient(BaseUsersGatewayHTTPClient, HTTPClient):
+    """
+    Клиент для взаимодействия с /api/v1/users сервиса http-gateway.
+    """
+
+    def get_user(self, user_id: str, discard: bool = False) -> GetUserResponseSchema | LazySchema | None:
         response = self.get_user_api(user_id)
-        return GetUserResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, GetUserResponseSchema, discard)
 
-    def create_user(self) -> CreateUserResponseSchema:
+    def create_user(self, discard: bool = False) -> CreateUserResponseSchema | LazySchema | None:
         request = CreateUserRequestSchema()
         response = self.create_user_api(request)
-        return CreateUserResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, CreateUserResponseSchema, discard)
+
+
+class AsyncUsersGatewayHTTPClient(BaseUsersGatewayHTTPClient, AsyncHTTPClient):
+    """
+    Асинхронный клиент для взаимодействия с /api/v1/users сервиса http-gateway.
+    """
+
+    async def get_user(self, user_id: str, discard: bool = False) -> GetUserResponseSchema | LazySchema | None:
+        response = await self.get_user_api(user_id)
+        return self.parse_response(response, GetUserResponseSchema, discard)
+
+    async def create_user(self, discard: bool = False) -> CreateUserResponseSchema | LazySchema | None:
+        request = CreateUserRequestSchema()
+        response = await self.create_user_api(request)
+        return self.parse_response(response, CreateUserResponseSchema, discard)
 
 
-def build_users_gateway_http_client() -> UsersGatewayHTTPClient:
+def build_users_gateway_http_client(client: Client | None = None) -> UsersGatewayHTTPClient:
     """
     Функция создаёт экземпляр UsersGatewayHTTPClient с уже настроенным HTTP-клиентом.
+    GET-запросы кешируются, если включена настройка GATEWAY_HTTP_CLIENT.RESPONSE_CACHE.
+    Ответы разбираются полностью независимо от GATEWAY_HTTP_CLIENT.PARSING_MODE: сидинг читает их поля.
 
+    :param client: общий httpx.Client; если не передан, будет создан новый.
     :return: Готовый к использованию UsersGatewayHTTPClient.
     """
-    return UsersGatewayHTTPClient(client=build_gateway_http_client())
+    return UsersGatewayHTTPClient(
+        client=client or build_gateway_http_client(),
+        parsing_mode=HTTPResponseParsingMode.FULL,
+        cache=build_gateway_http_response_cache()
+    )
 
 
-def build_users_gateway_locust_http_client(environment: Environment) -> UsersGatewayHTTPClient:
+def build_users_gateway_locust_http_client(
+        environment: Environment,
+        client: Client | None = None
+) -> UsersGatewayHTTPClient:
     """
     Функция создаёт экземпляр UsersGatewayHTTPClient адаптированного под Locust.
 
@@ -67,6 +106,40 @@ def build_users_gateway_locust_http_client(environment: Environment) -> UsersGat
     Используется исключительно в нагрузочных тестах.
 
     :param environment: объект окружения Locust.
+    :param client: общий httpx.Client с хуками Locust (см. build_gateway_locust_http_shared_client);
+        если не передан, будет создан новый.
     :return: экземпляр UsersGatewayHTTPClient с хуками сбора метрик.
     """
-    return UsersGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
+    return UsersGatewayHTTPClient(client=client or build_gateway_locust_http_client(environment))
+
+
+def build_users_gateway_async_http_client(client: AsyncClient | None = None) -> AsyncUsersGatewayHTTPClient:
+    """
+    Функция создаёт экземпляр AsyncUsersGatewayHTTPClient.
+    GET-запросы кешируются, если включена настройка GATEWAY_HTTP_CLIENT.RESPONSE_CACHE.
+    Ответы разбираются полностью независимо от GATEWAY_HTTP_CLIENT.PARSING_MODE: сидинг читает их поля.
+
+    :param client: общий httpx.AsyncClient; если не передан, будет создан новый.
+    :return: Готовый к использованию AsyncUsersGatewayHTTPClient.
+    """
+    return AsyncUsersGatewayHTTPClient(
+        client=client or build_gateway_async_http_client(),
+        parsing_mode=HTTPResponseParsingMode.FULL,
+        cache=build_gateway_http_response_cache()
+    )
+
+
+def build_users_gateway_async_locust_http_client(
+        environment: Environment,
+        client: AsyncClient | None = None
+) -> AsyncUsersGatewayHTTPClient:
+    """
+    Функция создаёт экземпляр AsyncUsersGatewayHTTPClient адаптированного под Locust.
+
+    Клиент выполняется в event loop'е процесса (см. tools.locust.loop) и передаёт метрики в Locust через хуки.
+
+    :param environment: объект окружения Locust.
+    :param client: общий httpx.AsyncClient с хуками Locust; если не передан, будет создан новый.
+    :return: экземпляр AsyncUsersGatewayHTTPClient с хуками сбора метрик.
+    """
+    return AsyncUsersGatewayHTTPClient(client=client or build_gateway_async_locust_http_client(environment))
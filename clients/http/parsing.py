@@ -0,0 +1,182 @@
+from functools import cache
+from types import UnionType
+from typing import Any, TypeVar, Union, get_args, get_origin
+
+from httpx import Response
+from pydantic import BaseModel
+
+from clients.http.serializers import JSONSerializer, get_json_serializer
+from tools.config.http import HTTPResponseParsingMode, HTTPSerializer
+
+T = TypeVar("T", bound=BaseModel)
+
+
+@cache
+def get_lazy_schema_fields(schema: type[BaseModel]) -> dict[str, tuple[str, type[BaseModel] | None, bool]]:
+    """
+    Возвращает описание полей схемы для ленивого доступа (результат кешируется на схему).
+
+    :param schema: Pydantic-схема ответа.
+    :return: Словарь: имя поля → (ключ в JSON, вложенная схема или None, является ли поле списком).
+    """
+    fields = {}
+    for name, field in schema.model_fields.items():
+        annotation, is_list = field.annotation, False
+
+        # Optional[X] / X | None → X
+        if get_origin(annotation) in (Union, UnionType):
+            annotation = next((arg for arg in get_args(annotation) if arg is not type(None)), annotation)
+
+        if get_origin(annotation) is list:
+            annotation, is_list = get_args(annotation)[0], True
+
+        nested = annotation if isinstance(annotation, type) and issubclass(annotation, BaseModel) else None
+        fields[name] = (field.alias or name, nested, is_list)
+
+    return fields
+
+
+class LazySchema:
+    """
+    Ленивое представление ответа по pydantic-схеме без валидации.
+
+    Тело ответа разбирается в словари JSON-парсером бэкенда сериализации (pydantic-core или orjson — оба быстрее json.loads),
+    а поля читаются по тем же именам, что и у схемы (алиасы вроде cardId учитываются).
+
+    Словарь из JSON служит __dict__ объекта, поэтому поле без алиаса читается обычным поиском атрибута
+    без вызова Python-кода. Вложенные объекты и алиасы обслуживают дескрипторы класса, который строится
+    один раз на схему (см. get_lazy_schema_class). Вложенный объект оборачивается при первом обращении
+    и сохраняется в словарь вместо исходного значения, так что повторные обращения к
+    response.account.cards[0].id не создают новых обёрток.
+
+    Значения не приводятся к типам схемы: перечисления, даты и URL остаются строками из JSON.
+    """
+    # Схема, по которой построен класс; задаётся в get_lazy_schema_class
+    schema: type[BaseModel]
+
+    def __getattr__(self, name: str) -> Any:
+        # Вызывается, только если поля нет в словаре: необязательное поле, отсутствующее в ответе
+        if name in get_lazy_schema_fields(type(self).schema):
+            return None
+
+        raise AttributeError(f"{type(self).schema.__name__} has no field {name!r}")
+
+    def __repr__(self) -> str:
+        return f"LazySchema({type(self).schema.__name__}, {self.__dict__!r})"
+
+
+class LazyAliasField:
+    """
+    Дескриптор поля с алиасом: читает значение из словаря по ключу JSON.
+    """
+    __slots__ = ("key",)
+
+    def __init__(self, key: str):
+        self.key = key
+
+    def __get__(self, instance: LazySchema | None, owner: type) -> Any:
+        if instance is None:
+            return self
+
+        return instance.__dict__.get(self.key)
+
+
+class LazyNestedField:
+    """
+    Дескриптор поля с вложенной схемой (или списком вложенных схем).
+
+    Data-дескриптор (есть __set__), поэтому имеет приоритет над одноимённым ключом словаря.
+    """
+    __slots__ = ("key", "schema", "is_list")
+
+    def __init__(self, key: str, schema: type[BaseModel], is_list: bool):
+        self.key = key
+        self.schema = schema
+        self.is_list = is_list
+
+    def __get__(self, instance: LazySchema | None, owner: type) -> Any:
+        if instance is None:
+            return self
+
+        data = instance.__dict__
+        value = data.get(self.key)
+        if value is None or isinstance(value, (LazySchema, LazyList)):
+            return value
+
+        lazy_class = get_lazy_schema_class(self.schema)
+        if self.is_list:
+            value = LazyList(build_lazy_schema(item, lazy_class) for item in value)
+        else:
+            value = build_lazy_schema(value, lazy_class)
+
+        data[self.key] = value
+        return value
+
+    def __set__(self, instance: LazySchema, value: Any) -> None:
+        raise AttributeError("LazySchema fields are read-only")
+
+
+class LazyList(list):
+    """
+    Список уже обёрнутых вложенных объектов; отличает закешированное значение от исходного списка из JSON.
+    """
+
+
+@cache
+def get_lazy_schema_class(schema: type[BaseModel]) -> type[LazySchema]:
+    """
+    Возвращает класс LazySchema для схемы (результат кешируется на схему).
+
+    :param schema: Pydantic-схема ответа.
+    :return: Подкласс LazySchema с дескрипторами для вложенных полей и полей с алиасами.
+    """
+    namespace: dict[str, Any] = {"schema": schema}
+    for name, (key, nested, is_list) in get_lazy_schema_fields(schema).items():
+        if nested is not None:
+            namespace[name] = LazyNestedField(key, nested, is_list)
+        elif key != name:
+            namespace[name] = LazyAliasField(key)
+
+    return type(f"Lazy{schema.__name__}", (LazySchema,), namespace)
+
+
+def build_lazy_schema(data: dict[str, Any], lazy_class: type[LazySchema]) -> LazySchema:
+    """
+    Оборачивает словарь из JSON в объект LazySchema без копирования.
+    """
+    instance = object.__new__(lazy_class)
+    instance.__dict__ = data
+    return instance
+
+
+def parse_response(
+        response: Response,
+        schema: type[T],
+        mode: HTTPResponseParsingMode,
+        serializer: JSONSerializer | None = None,
+        discard: bool = False
+) -> T | LazySchema | None:
+    """
+    Разбирает тело ответа согласно режиму парсинга.
+
+    - full: полная валидация pydantic-схемой (из байтов, без декодирования тела в str);
+    - lazy: разбор JSON без валидации и ленивый доступ к полям через LazySchema;
+    - none: тело не разбирается и возвращается None, но только для вызовов, результат которых
+      вызывающий код отбрасывает (discard=True); остальные ответы разбираются полностью.
+
+    :param response: Ответ httpx.
+    :param schema: Pydantic-схема ответа.
+    :param mode: Режим парсинга.
+    :param serializer: Бэкенд разбора JSON; по умолчанию стандартный (pydantic-core).
+    :param discard: Результат вызова не используется.
+    :return: Экземпляр схемы, LazySchema или None.
+    """
+    serializer = serializer or get_json_serializer(HTTPSerializer.PYDANTIC)
+
+    match mode:
+        case HTTPResponseParsingMode.LAZY:
+            return build_lazy_schema(serializer.loads(response.content), get_lazy_schema_class(schema))
+        case HTTPResponseParsingMode.NONE if discard:
+            return None
+        case _:
+            return serializer.validate(response.content, schema)
@@ -0,0 +1,74 @@
+import json
+from functools import cache
+from typing import Any, TypeVar
+
+from pydantic import BaseModel
+from pydantic_core import from_json
+
+from tools.config.http import HTTPSerializer
+
+T = TypeVar("T", bound=BaseModel)
+
+
+class JSONSerializer:
+    """
+    Стандартный бэкенд сериализации HTTP-клиентов.
+
+    Кодирует тела запросов модулем json с теми же параметрами, что и httpx, а ответы разбирает
+    JSON-парсером pydantic-core и валидирует через model_validate_json.
+    """
+
+    def dumps(self, data: Any) -> bytes:
+        """
+        Кодирует тело запроса в JSON-байты.
+        """
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode()
+
+    def loads(self, content: bytes) -> Any:
+        """
+        Разбирает JSON-байты в словари и списки без валидации.
+        """
+        return from_json(content)
+
+    def validate(self, content: bytes, schema: type[T]) -> T:
+        """
+        Разбирает JSON-байты и валидирует их pydantic-схемой.
+        """
+        return schema.model_validate_json(content)
+
+
+class OrjsonSerializer(JSONSerializer):
+    """
+    Бэкенд сериализации на orjson.
+
+    Тела запросов кодируются orjson.dumps (перечисления и подклассы str поддерживаются нативно),
+    а ответы без валидации (режим lazy) разбираются orjson.loads. Полная валидация остаётся
+    на model_validate_json: разбор JSON внутри pydantic-core быстрее, чем orjson.loads
+    с последующей валидацией словарей (см. python -m benchmarks.serialization).
+    """
+
+    def __init__(self):
+        # orjson импортируется только при выборе этого бэкенда: по умолчанию используется PYDANTIC
+        import orjson
+        self.orjson = orjson
+
+    def dumps(self, data: Any) -> bytes:
+        return self.orjson.dumps(data)
+
+    def loads(self, content: bytes) -> Any:
+        return self.orjson.loads(content)
+
+
+@cache
+def get_json_serializer(serializer: HTTPSerializer) -> JSONSerializer:
+    """
+    Возвращает бэкенд сериализации по значению настройки (один экземпляр на процесс).
+
+    :param serializer: Значение GATEWAY_HTTP_CLIENT.SERIALIZER.
+    :return: Экземпляр JSONSerializer.
+    """
+    match serializer:
+        case HTTPSerializer.ORJSON:
+            return OrjsonSerializer()
+        case _:
+            return JSONSerializer()
@@ -0,0 +1,102 @@
+import json
+from functools import cache
+from itertools import cycle
+from typing import Any
+
+from pydantic import BaseModel
+
+# Заголовки для тела запроса, переданного уже готовыми JSON-байтами
+JSON_CONTENT_HEADERS = {"Content-Type": "application/json"}
+
+
+class RequestBodyTemplate:
+    """
+    Заранее отрендеренные JSON-тела запроса для одной pydantic-схемы.
+
+    При создании шаблон строит pool_size экземпляров схемы: поля-слоты (например, card_id и account_id)
+    заполняются метками, а остальные поля — фейковыми данными из default_factory схемы, как при обычном
+    создании запроса. Каждый экземпляр один раз сериализуется в JSON и разрезается по меткам на готовые
+    куски байт. При рендеринге берётся следующий вариант из пула, и в него подставляются значения слотов —
+    без создания модели, генерации фейковых данных и model_dump.
+
+    Слоты должны быть строковыми полями схемы.
+
+    :param schema: Pydantic-схема тела запроса.
+    :param slots: Имена полей схемы, значения которых передаются при каждом рендеринге.
+    :param pool_size: Количество заранее сгенерированных вариантов тела.
+    """
+
+    def __init__(self, schema: type[BaseModel], slots: tuple[str, ...], pool_size: int):
+        self.schema = schema
+        self.slots = slots
+
+        markers = {slot: f"__slot_{slot}__" for slot in slots}
+        variants = []
+        for _ in range(pool_size):
+            body = schema(**markers).model_dump_json(by_alias=True).encode()
+            variants.append(self.split(body, markers))
+
+        self.variants = cycle(variants)
+
+    @staticmethod
+    def split(body: bytes, markers: dict[str, str]) -> tuple[bytes | str, ...]:
+        """
+        Разрезает JSON-тело по меткам слотов.
+
+        :return: Кортеж из кусков байт и имён слотов в порядке их следования в теле.
+        """
+        parts: list[bytes | str] = [body]
+        for slot, marker in markers.items():
+            quoted = json.dumps(marker).encode()
+            split_parts: list[bytes | str] = []
+            for part in parts:
+                if isinstance(part, str):
+                    split_parts.append(part)
+                    continue
+
+                chunks = part.split(quoted)
+                for index, chunk in enumerate(chunks):
+                    if index:
+                        split_parts.append(slot)
+                    split_parts.append(chunk)
+            parts = split_parts
+
+        return tuple(part for part in parts if part != b"")
+
+    def render(self, **slots: str) -> bytes:
+        """
+        Возвращает JSON-тело запроса со значениями слотов.
+
+        :param slots: Значения всех слотов шаблона.
+        :return: Тело запроса в виде JSON-байт.
+        """
+        return b"".join(
+            part if isinstance(part, bytes) else json.dumps(slots[part]).encode()
+            for part in next(self.variants)
+        )
+
+
+@cache
+def get_request_body_template(schema: type[BaseModel], slots: tuple[str, ...], pool_size: int) -> RequestBodyTemplate:
+    """
+    Возвращает шаблон тела запроса для схемы (создаётся один раз на процесс).
+
+    :param schema: Pydantic-схема тела запроса.
+    :param slots: Имена полей-слотов.
+    :param pool_size: Количество заранее сгенерированных вариантов тела.
+    :return: Экземпляр RequestBodyTemplate.
+    """
+    return RequestBodyTemplate(schema, slots, pool_size)
+
+
+def build_request_body(request: BaseModel | bytes) -> dict[str, Any]:
+    """
+    Возвращает аргументы тела запроса для HTTPClient.post.
+
+    :param request: Pydantic-схема запроса или уже отрендеренное шаблоном JSON-тело.
+    :return: {"content": ...} для готовых байт или {"json": ...} для схемы.
+    """
+    if isinstance(request, bytes):
+        return {"content": request}
+
+    return {"json": request.model_dump(by_alias=True)}
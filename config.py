@@ -1,9 +1,11 @@
+from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 # Импортируем вложенные модели
 from tools.config.grpc import GRPCClientConfig
 from tools.config.http import HTTPClientConfig
 from tools.config.locust import LocustUserConfig
+from tools.config.seeds import SeedsConfig
 
 
 class Settings(BaseSettings):
@@ -12,13 +14,15 @@ class Settings(BaseSettings):
         extra="allow",  # Разрешить дополнительные поля (например, неиспользуемые переменные)
         env_file=".env",  # Указываем имя основного .env файла
         env_file_encoding="utf-8",  # Кодировка файла
-        env_nested_delimiter="."  # Позволяет использовать вложенные переменные, например: LOCUST_USER.WAIT_TIME_MIN
+        env_nested_delimiter=".",  # Позволяет использовать вложенные переменные, например: LOCUST_USER.WAIT_TIME_MIN
+        env_parse_none_str=""  # Пустое значение (SEEDS.EXHAUSTION_TIMEOUT=) задаёт None для необязательных полей
     )
 
     # Вложенные секции настроек
     locust_user: LocustUserConfig  # Настройки виртуального пользователя
     gateway_http_client: HTTPClientConfig  # Настройки HTTP-клиента
     gateway_grpc_client: GRPCClientConfig  # Настройки gRPC-клиента
+    seeds: SeedsConfig = Field(default_factory=SeedsConfig)  # Настройки сидинга
 
 
 # Глобальный объект настроек — его можно импортировать в любом месте проекта
@@ -12,10 +12,9 @@ from tools.locust.user import LocustBaseUser
 def init(environment: Environment, **kwargs):
     # Выполняем сидинг
     seeds_scenario = ExistingUserGetOperationsSeedsScenario()
-    seeds_scenario.build()
-
-    # Загружаем результат сидинга (из файла JSON)
-    environment.seeds = seeds_scenario.load()
+    # Выполняем генерацию данных, если они ещё не созданы, и загружаем пользователей в окружение Locust.
+    # В распределённом запуске каждый воркер получает только свою часть пользователей
+    seeds_scenario.setup(environment)
 
 
 # TaskSet — сценарий пользователя. Каждый виртуальный пользователь выполняет эти задачи
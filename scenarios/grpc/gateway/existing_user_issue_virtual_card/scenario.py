@@ -15,11 +15,9 @@ def init(environment: Environment, **kwargs):
     # Создаем экземпляр сидинг-сценария
     seeds_scenario = ExistingUserIssueVirtualCardSeedsScenario()
 
-    # Выполняем генерацию данных, если они ещё не созданы
-    seeds_scenario.build()
-
-    # Загружаем сгенерированных пользователей в окружение Locust
-    environment.seeds = seeds_scenario.load()
+    # Выполняем генерацию данных, если они ещё не созданы, и загружаем пользователей в окружение Locust.
+    # В распределённом запуске каждый воркер получает только свою часть пользователей
+    seeds_scenario.setup(environment)
 
 
 # Класс сценария: описывает последовательный флоу нового пользователя
@@ -33,6 +31,14 @@ class IssueVirtualCardTaskSet(GatewayGRPCTaskSet):
         # Получаем следующего пользователя из списка (по порядку!)
         self.seed_user = self.user.environment.seeds.get_next_user()
 
+    # Метод вызывается при остановке сессии пользователя
+    def on_stop(self) -> None:
+        # Возвращаем пользователя в пул, чтобы его мог получить другой виртуальный пользователь.
+        # Если on_start упал раньше получения пользователя, возвращать нечего
+        seed_user = getattr(self, "seed_user", None)
+        if seed_user is not None:
+            self.user.environment.seeds.release_user(seed_user)
+
     @task(3)
     def get_accounts(self):
         # Запрашиваем список счетов
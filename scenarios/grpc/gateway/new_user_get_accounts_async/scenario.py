@@ -0,0 +1,54 @@
+import asyncio
+
+from locust import task
+
+from clients.grpc.gateway.locust import AsyncGatewayGRPCTaskSet
+from contracts.services.gateway.users.rpc_create_user_pb2 import CreateUserResponse
+from tools.locust.user import AsyncLocustBaseUser
+
+
+class GetAccountsAsyncTaskSet(AsyncGatewayGRPCTaskSet):
+    """
+    Асинхронный вариант сценария new_user_get_accounts на grpc.aio:
+    1. При старте создаёт нового пользователя.
+    2. Открывает депозитный счёт.
+    3. Запрашивает данные пользователя и список его счетов одновременно.
+
+    Запуская его рядом с синхронным gRPC-сценарием с одинаковым числом пользователей, можно сравнить,
+    сколько запросов в секунду выдаёт одно ядро генератора нагрузки на стеке aio и на gevent.
+
+    grpc.aio не работает под gevent monkey patching, поэтому сценарий запускается так:
+    LOCUST_SKIP_MONKEY_PATCH=1 locust --config=./scenarios/grpc/gateway/new_user_get_accounts_async/v1.0.conf
+    """
+
+    create_user_response: CreateUserResponse
+
+    def on_start(self) -> None:
+        super().on_start()
+
+        # on_start синхронный, поэтому корутину явно отправляем в event loop
+        self.create_user_response = self.user.run_coroutine(self.users_gateway_client.create_user())
+
+    @task(2)
+    async def open_deposit_account(self):
+        """
+        Открываем депозитный счёт для созданного пользователя.
+        """
+        await self.accounts_gateway_client.open_deposit_account(user_id=self.create_user_response.user.id)
+
+    @task(6)
+    async def get_user_and_accounts(self):
+        """
+        Запрашиваем пользователя и его счета параллельно — оба вызова одновременно в полёте.
+        """
+        await asyncio.gather(
+            self.users_gateway_client.get_user(user_id=self.create_user_response.user.id),
+            self.accounts_gateway_client.get_accounts(user_id=self.create_user_response.user.id)
+        )
+
+
+class GetAccountsAsyncScenarioUser(AsyncLocustBaseUser):
+    """
+    Пользователь Locust, исполняющий асинхронный gRPC-сценарий получения счетов.
+    """
+    tasks = [GetAccountsAsyncTaskSet]
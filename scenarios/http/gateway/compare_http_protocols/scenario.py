@@ -0,0 +1,130 @@
+from collections import Counter
+from functools import cache
+
+import gevent
+from httpx import Client, Request
+from locust import TaskSet, task, events
+from locust.env import Environment
+
+from clients.http.gateway.accounts.client import AccountsGatewayHTTPClient, build_accounts_gateway_locust_http_client
+from clients.http.gateway.client import build_gateway_locust_http_client
+from clients.http.gateway.users.client import UsersGatewayHTTPClient, build_users_gateway_locust_http_client
+from clients.http.gateway.users.schema import CreateUserResponseSchema
+from tools.locust.user import LocustBaseUser
+from tools.logger import get_logger
+
+logger = get_logger("COMPARE_HTTP_PROTOCOLS")
+
+# Количество установленных TCP-соединений по каждому протоколу
+connections: Counter[str] = Counter()
+
+
+def connections_trace_hook(protocol: str):
+    """
+    Возвращает HTTPX request event hook, который подсчитывает новые TCP-соединения клиента.
+
+    Использует trace-расширение httpcore: событие connection.connect_tcp.complete
+    приходит только тогда, когда пул открывает новое соединение, а не переиспользует существующее.
+
+    :param protocol: Протокол, под которым учитываются соединения (HTTP/1.1 или HTTP/2).
+    """
+
+    def trace(event_name: str, info: dict) -> None:
+        if event_name == "connection.connect_tcp.complete":
+            connections[protocol] += 1
+
+    def inner(request: Request) -> None:
+        # Trace-расширение, подключённое раньше (например, разбивка по фазам), вызываем следом
+        previous = request.extensions.get("trace")
+
+        def chained(event_name: str, info: dict) -> None:
+            trace(event_name, info)
+            if previous is not None:
+                previous(event_name, info)
+
+        request.extensions["trace"] = chained
+
+    return inner
+
+
+@cache
+def build_protocol_http_client(environment: Environment, http2: bool) -> Client:
+    """
+    Возвращает общий для процесса httpx.Client с хуками Locust для заданного протокола.
+    Клиент создаётся при первом вызове, дальше все виртуальные пользователи протокола делят его пул.
+
+    :param environment: Объект окружения Locust.
+    :param http2: Использовать HTTP/2.
+    """
+    client = build_gateway_locust_http_client(environment, http2=http2)
+    client.event_hooks["request"].append(connections_trace_hook("HTTP/2" if http2 else "HTTP/1.1"))
+    return client
+
+
+@events.test_stop.add_listener
+def report_connections(environment: Environment, **kwargs):
+    # В отчёте Locust запросы разделены по типу (HTTP и HTTP/2), а количество соединений выводим в лог
+    for protocol, count in sorted(connections.items()):
+        logger.info(f"{protocol}: opened {count} TCP connections")
+
+
+class CompareHTTPProtocolsTaskSet(TaskSet):
+    """
+    Нагрузочный сценарий, который создаёт пользователя и затем читает его данные и счета.
+
+    Все виртуальные пользователи одного протокола в процессе делят один httpx.Client,
+    а данные пользователя и счета запрашиваются одновременно из двух гринлетов. Поэтому при HTTP/2
+    параллельные запросы мультиплексируются в одном соединении, а при HTTP/1.1 каждый запрос
+    в полёте занимает отдельное соединение пула (GATEWAY_HTTP_CLIENT.MAX_CONNECTIONS).
+
+    Без TLS HTTP/2 включается как h2c, поэтому шлюз должен его поддерживать. Сценарий не входит
+    в workflow performance-tests и запускается вручную:
+    locust --config=./scenarios/http/gateway/compare_http_protocols/v1.0.conf
+    """
+
+    # Протокол, которым пользуется таск-сет (задаётся в наследниках)
+    http2: bool = False
+
+    users_gateway_client: UsersGatewayHTTPClient
+    accounts_gateway_client: AccountsGatewayHTTPClient
+
+    create_user_response: CreateUserResponseSchema
+
+    def on_start(self) -> None:
+        client = build_protocol_http_client(self.user.environment, http2=self.http2)
+
+        self.users_gateway_client = build_users_gateway_locust_http_client(self.user.environment, client)
+        self.accounts_gateway_client = build_accounts_gateway_locust_http_client(self.user.environment, client)
+
+        self.create_user_response = self.users_gateway_client.create_user()
+
+    @task
+    def get_user_and_accounts(self):
+        """
+        Запрашиваем пользователя и его счета параллельно — оба запроса одновременно в полёте.
+        """
+        user_id = self.create_user_response.user.id
+        gevent.joinall(
+            [
+                gevent.spawn(self.users_gateway_client.get_user, user_id=user_id, discard=True),
+                gevent.spawn(self.accounts_gateway_client.get_accounts, user_id=user_id, discard=True)
+            ],
+            raise_error=True
+        )
+
+
+class HTTP1TaskSet(CompareHTTPProtocolsTaskSet):
+    http2 = False
+
+
+class HTTP2TaskSet(CompareHTTPProtocolsTaskSet):
+    http2 = True
+
+
+# Пользователи обоих классов спавнятся поровну, поэтому протоколы сравниваются при одинаковой нагрузке
+class HTTP1ScenarioUser(LocustBaseUser):
+    tasks = [HTTP1TaskSet]
+
+
+class HTTP2ScenarioUser(LocustBaseUser):
+    tasks = [HTTP2TaskSet]
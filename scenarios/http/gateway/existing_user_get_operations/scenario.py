@@ -12,10 +12,9 @@ from tools.locust.user import LocustBaseUser
 def init(environment: Environment, **kwargs):
     # Выполняем сидинг
     seeds_scenario = ExistingUserGetOperationsSeedsScenario()
-    seeds_scenario.build()
-
-    # Загружаем результат сидинга (из файла JSON)
-    environment.seeds = seeds_scenario.load()
+    # Выполняем генерацию данных, если они ещё не созданы, и загружаем пользователей в окружение Locust.
+    # В распределённом запуске каждый воркер получает только свою часть пользователей
+    seeds_scenario.setup(environment)
 
 
 # TaskSet — сценарий пользователя. Каждый виртуальный пользователь выполняет эти задачи
@@ -30,20 +29,22 @@ class GetOperationsTaskSet(GatewayHTTPTaskSet):
     @task(1)
     def get_accounts(self):
         # Получаем список счетов пользователя
-        self.accounts_gateway_client.get_accounts(user_id=self.seed_user.user_id)
+        self.accounts_gateway_client.get_accounts(user_id=self.seed_user.user_id, discard=True)
 
     @task(3)
     def get_operations(self):
         # Получаем список операций по счёту
         self.operations_gateway_client.get_operations(
-            account_id=self.seed_user.credit_card_accounts[0].account_id
+            account_id=self.seed_user.credit_card_accounts[0].account_id,
+            discard=True
         )
 
     @task(3)
     def get_operations_summary(self):
         # Получаем статистику по операциям пользователя
         self.operations_gateway_client.get_operations_summary(
-            account_id=self.seed_user.credit_card_accounts[0].account_id
+            account_id=self.seed_user.credit_card_accounts[0].account_id,
+            discard=True
         )
 
 
@@ -14,11 +14,9 @@ def init(environment: Environment, **kwargs):
     # Создаем экземпляр сидинг-сценария
     seeds_scenario = ExistingUserIssueVirtualCardSeedsScenario()
 
-    # Выполняем генерацию данных, если они ещё не созданы
-    seeds_scenario.build()
-
-    # Загружаем сгенерированных пользователей в окружение Locust
-    environment.seeds = seeds_scenario.load()
+    # Выполняем генерацию данных, если они ещё не созданы, и загружаем пользователей в окружение Locust.
+    # В распределённом запуске каждый воркер получает только свою часть пользователей
+    seeds_scenario.setup(environment)
 
 
 # Набор задач (TaskSet), который будет выполняться виртуальными пользователями.
@@ -33,10 +31,18 @@ class IssueVirtualCardTaskSet(GatewayHTTPTaskSet):
         # Получаем следующего пользователя из списка (по порядку!)
         self.seed_user = self.user.environment.seeds.get_next_user()
 
+    # Метод вызывается при остановке сессии пользователя
+    def on_stop(self) -> None:
+        # Возвращаем пользователя в пул, чтобы его мог получить другой виртуальный пользователь.
+        # Если on_start упал раньше получения пользователя, возвращать нечего
+        seed_user = getattr(self, "seed_user", None)
+        if seed_user is not None:
+            self.user.environment.seeds.release_user(seed_user)
+
     @task(2)
     def get_accounts(self):
         # Запрашиваем список счетов
-        self.accounts_gateway_client.get_accounts(user_id=self.seed_user.user_id)
+        self.accounts_gateway_client.get_accounts(user_id=self.seed_user.user_id, discard=True)
 
     @task(1)
     def issue_virtual_card(self):
@@ -44,6 +50,7 @@ class IssueVirtualCardTaskSet(GatewayHTTPTaskSet):
         self.cards_gateway_client.issue_virtual_card(
             user_id=self.seed_user.user_id,
             account_id=self.seed_user.debit_card_accounts[0].account_id,
+            discard=True
         )
 
 
@@ -36,7 +36,8 @@ class GetAccountsTaskSet(GatewayHTTPTaskSet):
             return  # Если пользователь не был создан, нет смысла продолжать
 
         self.accounts_gateway_client.open_deposit_account(
-            user_id=self.create_user_response.user.id
+            user_id=self.create_user_response.user.id,
+            discard=True
         )
 
     @task(6)
@@ -48,7 +49,8 @@ class GetAccountsTaskSet(GatewayHTTPTaskSet):
             return  # Если счёт не открыт, запрос документов невозможен
 
         self.accounts_gateway_client.get_accounts(
-            user_id=self.create_user_response.user.id
+            user_id=self.create_user_response.user.id,
+            discard=True
         )
 
 
@@ -0,0 +1,50 @@
+import asyncio
+
+from locust import task
+
+from clients.http.gateway.locust import AsyncGatewayHTTPTaskSet
+from clients.http.gateway.users.schema import CreateUserResponseSchema
+from tools.locust.user import AsyncLocustBaseUser
+
+
+class GetAccountsAsyncTaskSet(AsyncGatewayHTTPTaskSet):
+    """
+    Асинхронный вариант сценария new_user_get_accounts:
+    1. При старте создаёт нового пользователя.
+    2. Открывает депозитный счёт.
+    3. Запрашивает данные пользователя и список его счетов одновременно.
+
+    Запросы выполняются в event loop'е процесса на httpx.AsyncClient.
+    """
+
+    create_user_response: CreateUserResponseSchema
+
+    def on_start(self) -> None:
+        super().on_start()
+
+        # on_start синхронный, поэтому корутину явно отправляем в event loop
+        self.create_user_response = self.user.run_coroutine(self.users_gateway_client.create_user())
+
+    @task(2)
+    async def open_deposit_account(self):
+        """
+        Открываем депозитный счёт для созданного пользователя.
+        """
+        await self.accounts_gateway_client.open_deposit_account(user_id=self.create_user_response.user.id, discard=True)
+
+    @task(6)
+    async def get_user_and_accounts(self):
+        """
+        Запрашиваем пользователя и его счета параллельно — оба запроса одновременно в полёте.
+        """
+        await asyncio.gather(
+            self.users_gateway_client.get_user(user_id=self.create_user_response.user.id, discard=True),
+            self.accounts_gateway_client.get_accounts(user_id=self.create_user_response.user.id, discard=True)
+        )
+
+
+class GetAccountsAsyncScenarioUser(AsyncLocustBaseUser):
+    """
+    Пользователь Locust, исполняющий асинхронный сценарий получения счетов.
+    """
+    tasks = [GetAccountsAsyncTaskSet]
@@ -48,10 +48,12 @@ class GetDocumentsSequentialTaskSet(GatewayHTTPSequentialTaskSet):
             return
 
         self.documents_gateway_client.get_tariff_document(
-            account_id=self.open_savings_account_response.account.id
+            account_id=self.open_savings_account_response.account.id,
+            discard=True
         )
         self.documents_gateway_client.get_contract_document(
-            account_id=self.open_savings_account_response.account.id
+            account_id=self.open_savings_account_response.account.id,
+            discard=True
         )
 
 
@@ -37,6 +37,7 @@ class IssuePhysicalCardSequentialTaskSet(GatewayHTTPSequentialTaskSet):
         self.cards_gateway_client.issue_physical_card(
             user_id=self.create_user_response.user.id,
             account_id=self.open_open_debit_card_account_response.account.id,
+            discard=True
         )
 
 
@@ -49,7 +49,8 @@ class MakeTopUpOperationSequentialTaskSet(GatewayHTTPSequentialTaskSet):
             return
 
         self.operations_gateway_client.get_operations(
-            account_id=self.open_open_debit_card_account_response.account.id
+            account_id=self.open_open_debit_card_account_response.account.id,
+            discard=True
         )
 
     @task
@@ -59,7 +60,8 @@ class MakeTopUpOperationSequentialTaskSet(GatewayHTTPSequentialTaskSet):
             return
 
         self.operations_gateway_client.get_operations_summary(
-            account_id=self.open_open_debit_card_account_response.account.id
+            account_id=self.open_open_debit_card_account_response.account.id,
+            discard=True
         )
 
     @task
@@ -69,7 +71,8 @@ class MakeTopUpOperationSequentialTaskSet(GatewayHTTPSequentialTaskSet):
             return
 
         self.operations_gateway_client.get_operation(
-            operation_id=self.make_top_up_operation_response.operation.id
+            operation_id=self.make_top_up_operation_response.operation.id,
+            discard=True
         )
 
 
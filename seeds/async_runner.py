@@ -0,0 +1,59 @@
+"""
+Запуск асинхронного сидера в отдельном процессе.
+
+Клиенты импортируют Locust, а он при импорте патчит стандартную библиотеку gevent'ом. В таком процессе
+grpc.aio под asyncio.run зависает, поэтому SeedsScenario.build() с SEEDS.USE_ASYNC запускает этот модуль
+с LOCUST_SKIP_MONKEY_PATCH=1. Созданные пользователи пишутся в чекпоинт сценария, откуда их забирает
+родительский процесс.
+
+Запуск: python -m seeds.async_runner <module>:<class> <count>
+"""
+import asyncio
+import importlib
+import os
+import subprocess
+import sys
+
+from seeds.dumps import SeedsCheckpointWriter
+
+ASYNC_RUNNER_MODULE = "seeds.async_runner"
+
+
+def get_scenario_class_path(scenario_class: type) -> str:
+    """
+    Возвращает путь к классу сценария сидинга в виде module:class.
+    Для сценария, запущенного через python -m, вместо __main__ берётся настоящее имя модуля.
+    """
+    module = scenario_class.__module__
+    if module == "__main__" and getattr(sys.modules["__main__"], "__spec__", None) is not None:
+        module = sys.modules["__main__"].__spec__.name
+
+    return f"{module}:{scenario_class.__qualname__}"
+
+
+def run_async_seeding(scenario_class: type, count: int) -> None:
+    """
+    Создаёт count пользователей асинхронным сидером в дочернем процессе без monkey patching
+    и дожидается его завершения.
+
+    :param scenario_class: Класс сценария сидинга (наследник SeedsScenario).
+    :param count: Количество пользователей, которое нужно создать.
+    :raises subprocess.CalledProcessError: Если сидинг в дочернем процессе завершился ошибкой.
+    """
+    subprocess.run(
+        [sys.executable, "-m", ASYNC_RUNNER_MODULE, get_scenario_class_path(scenario_class), str(count)],
+        env={**os.environ, "LOCUST_SKIP_MONKEY_PATCH": "1"},
+        check=True
+    )
+
+
+def main(scenario_class_path: str, count: int) -> None:
+    module, name = scenario_class_path.split(":")
+    scenario = getattr(importlib.import_module(module), name)()
+
+    with SeedsCheckpointWriter(scenario=scenario.scenario, fingerprint=scenario.fingerprint) as checkpoint:
+        asyncio.run(scenario.build_async(count=count, checkpoint=checkpoint))
+
+
+if __name__ == '__main__':
+    main(scenario_class_path=sys.argv[1], count=int(sys.argv[2]))
@@ -1,11 +1,60 @@
-from clients.grpc.gateway.accounts.client import build_accounts_gateway_grpc_client, AccountsGatewayGRPCClient
-from clients.grpc.gateway.cards.client import build_cards_gateway_grpc_client, CardsGatewayGRPCClient
-from clients.grpc.gateway.operations.client import build_operations_gateway_grpc_client, OperationsGatewayGRPCClient
-from clients.grpc.gateway.users.client import build_users_gateway_grpc_client, UsersGatewayGRPCClient
-from clients.http.gateway.accounts.client import build_accounts_gateway_http_client, AccountsGatewayHTTPClient
-from clients.http.gateway.cards.client import build_cards_gateway_http_client, CardsGatewayHTTPClient
-from clients.http.gateway.operations.client import build_operations_gateway_http_client, OperationsGatewayHTTPClient
-from clients.http.gateway.users.client import build_users_gateway_http_client, UsersGatewayHTTPClient
+import asyncio
+from functools import partial
+from typing import Any, Callable, Iterator
+
+from gevent.pool import Pool
+
+from clients.grpc.gateway.accounts.client import (
+    build_accounts_gateway_grpc_client,
+    build_accounts_gateway_async_grpc_client,
+    AccountsGatewayGRPCClient,
+    AsyncAccountsGatewayGRPCClient
+)
+from clients.grpc.gateway.cards.client import (
+    build_cards_gateway_grpc_client,
+    build_cards_gateway_async_grpc_client,
+    CardsGatewayGRPCClient,
+    AsyncCardsGatewayGRPCClient
+)
+from clients.grpc.gateway.client import build_gateway_grpc_client, build_gateway_async_grpc_client
+from clients.grpc.gateway.operations.client import (
+    build_operations_gateway_grpc_client,
+    build_operations_gateway_async_grpc_client,
+    OperationsGatewayGRPCClient,
+    AsyncOperationsGatewayGRPCClient
+)
+from clients.grpc.gateway.users.client import (
+    build_users_gateway_grpc_client,
+    build_users_gateway_async_grpc_client,
+    UsersGatewayGRPCClient,
+    AsyncUsersGatewayGRPCClient
+)
+from clients.http.gateway.accounts.client import (
+    build_accounts_gateway_http_client,
+    build_accounts_gateway_async_http_client,
+    AccountsGatewayHTTPClient,
+    AsyncAccountsGatewayHTTPClient
+)
+from clients.http.gateway.cards.client import (
+    build_cards_gateway_http_client,
+    build_cards_gateway_async_http_client,
+    CardsGatewayHTTPClient,
+    AsyncCardsGatewayHTTPClient
+)
+from clients.http.gateway.client import build_gateway_http_client, build_gateway_async_http_client
+from clients.http.gateway.operations.client import (
+    build_operations_gateway_http_client,
+    build_operations_gateway_async_http_client,
+    OperationsGatewayHTTPClient,
+    AsyncOperationsGatewayHTTPClient
+)
+from clients.http.gateway.users.client import (
+    build_users_gateway_http_client,
+    build_users_gateway_async_http_client,
+    UsersGatewayHTTPClient,
+    AsyncUsersGatewayHTTPClient
+)
+from config import settings
 from seeds.schema.plan import (
     SeedsPlan,
     SeedUsersPlan,
@@ -30,6 +79,8 @@ class SeedsBuilder:
         cards_gateway_client: Клиент для выпуска карт
         accounts_gateway_client: Клиент для открытия счетов
         operations_gateway_client: Клиент для операций (топ-ап, покупки и т.д.)
+        concurrency: Количество пользователей (в пакетном режиме — запросов), которые выполняются параллельно
+        batch_size: Размер пачки пользователей для пакетного сидинга (0 — каждый пользователь создаётся целиком)
     """
 
     def __init__(
@@ -37,12 +88,16 @@ class SeedsBuilder:
             users_gateway_client: UsersGatewayGRPCClient | UsersGatewayHTTPClient,
             cards_gateway_client: CardsGatewayGRPCClient | CardsGatewayHTTPClient,
             accounts_gateway_client: AccountsGatewayGRPCClient | AccountsGatewayHTTPClient,
-            operations_gateway_client: OperationsGatewayGRPCClient | OperationsGatewayHTTPClient
+            operations_gateway_client: OperationsGatewayGRPCClient | OperationsGatewayHTTPClient,
+            concurrency: int = 1,
+            batch_size: int = 0
     ):
         self.users_gateway_client = users_gateway_client
         self.cards_gateway_client = cards_gateway_client
         self.accounts_gateway_client = accounts_gateway_client
         self.operations_gateway_client = operations_gateway_client
+        self.concurrency = concurrency
+        self.batch_size = batch_size
 
     def build_physical_card_result(self, user_id: str, account_id: str) -> SeedCardResult:
         """
@@ -297,6 +352,170 @@ class SeedsBuilder:
             ]
         )
 
+    def build_users(
+            self,
+            plan: SeedUsersPlan,
+            count: int,
+            on_user_built: Callable[[SeedUserResult], None] | None = None
+    ) -> Iterator[SeedUserResult]:
+        """
+        Создаёт count пользователей по плану и отдаёт их итератором по мере создания,
+        поэтому все созданные пользователи одновременно в памяти не держатся.
+        Пользователи создаются только при обходе итератора.
+
+        Если concurrency > 1, пользователи создаются параллельно в пуле greenlet'ов.
+        Внутри одного пользователя порядок сохраняется (пользователь → счёт → карты/операции),
+        а пользователи отдаются в том же порядке, что и при последовательном сидинге.
+
+        Args:
+            plan: План генерации пользователя
+            count: Количество пользователей, которое нужно создать
+            on_user_built: Колбэк, вызываемый сразу после создания каждого пользователя
+                (например, для записи чекпоинта на диск)
+
+        Returns:
+            Iterator[SeedUserResult]: Созданные пользователи
+        """
+        if self.batch_size > 0:
+            return self.build_users_batched(plan=plan, count=count, on_user_built=on_user_built)
+
+        def build_user(_: int) -> SeedUserResult:
+            user = self.build_user(plan=plan)
+            if on_user_built is not None:
+                on_user_built(user)
+            return user
+
+        if self.concurrency <= 1:
+            return map(build_user, range(count))
+
+        # Pool.imap ограничивает число одновременно работающих greenlet'ов и сохраняет порядок результатов
+        pool = Pool(size=self.concurrency)
+        return pool.imap(build_user, range(count), maxsize=self.concurrency)
+
+    def run_wave(self, tasks: list[Callable[[], Any]]) -> list[Any]:
+        """
+        Выполняет волну независимых запросов параллельно, не более concurrency одновременно.
+
+        Args:
+            tasks: Запросы волны
+
+        Returns:
+            list: Результаты запросов в том же порядке, что и tasks
+        """
+        pool = Pool(size=max(self.concurrency, 1))
+        return pool.map(lambda task: task(), tasks)
+
+    def build_users_chunk(self, plan: SeedUsersPlan, count: int) -> list[SeedUserResult]:
+        """
+        Создаёт пачку пользователей волнами: сначала все пользователи, затем все счета,
+        затем для каждого вида карт и операций — все сущности этого вида по всем счетам пачки.
+
+        Волны выполняются строго по очереди в том же порядке, что и при обычном сидинге
+        (карты → пополнения → покупки → переводы → снятия), поэтому, например, покупки
+        всегда выполняются после пополнений своего счёта.
+
+        Args:
+            plan: План генерации пользователя
+            count: Количество пользователей в пачке
+
+        Returns:
+            list[SeedUserResult]: Созданные пользователи
+        """
+        users = [
+            SeedUserResult(user_id=response.user.id)
+            for response in self.run_wave([self.users_gateway_client.create_user] * count)
+        ]
+
+        # Волна счетов: запросы и списки, в которые попадут созданные счета
+        tasks, targets = [], []
+        for user in users:
+            for _ in range(plan.savings_accounts.count):
+                tasks.append(partial(self.build_savings_account_result, user_id=user.user_id))
+                targets.append((user.savings_accounts, None))
+            for _ in range(plan.deposit_accounts.count):
+                tasks.append(partial(self.build_deposit_account_result, user_id=user.user_id))
+                targets.append((user.deposit_accounts, None))
+            for _ in range(plan.debit_card_accounts.count):
+                tasks.append(partial(self.accounts_gateway_client.open_debit_card_account, user_id=user.user_id))
+                targets.append((user.debit_card_accounts, (user.user_id, plan.debit_card_accounts)))
+            for _ in range(plan.credit_card_accounts.count):
+                tasks.append(partial(self.accounts_gateway_client.open_credit_card_account, user_id=user.user_id))
+                targets.append((user.credit_card_accounts, (user.user_id, plan.credit_card_accounts)))
+
+        # Для карточных счетов запоминаем всё, что нужно следующим волнам:
+        # пользователя, план счёта, созданный счёт и его карту по умолчанию
+        card_accounts: list[tuple[str, SeedAccountsPlan, SeedAccountResult, str]] = []
+        for (target, card_account), result in zip(targets, self.run_wave(tasks)):
+            if card_account is None:
+                target.append(result)
+                continue
+
+            user_id, account_plan = card_account
+            account = SeedAccountResult(account_id=result.account.id)
+            target.append(account)
+            card_accounts.append((user_id, account_plan, account, result.account.cards[0].id))
+
+        # Имена полей плана и результата совпадают, поэтому волна описывается одним именем
+        waves: list[tuple[str, Callable[[str, str, str], Any]]] = [
+            ("physical_cards", lambda user_id, account_id, card_id: self.build_physical_card_result(
+                user_id=user_id, account_id=account_id
+            )),
+            ("virtual_cards", lambda user_id, account_id, card_id: self.build_virtual_card_result(
+                user_id=user_id, account_id=account_id
+            )),
+            ("top_up_operations", lambda user_id, account_id, card_id: self.build_top_up_operation_result(
+                card_id=card_id, account_id=account_id
+            )),
+            ("purchase_operations", lambda user_id, account_id, card_id: self.build_purchase_operation_result(
+                card_id=card_id, account_id=account_id
+            )),
+            ("transfer_operations", lambda user_id, account_id, card_id: self.build_transfer_operation_result(
+                card_id=card_id, account_id=account_id
+            )),
+            ("cash_withdrawal_operations", lambda user_id, account_id, card_id: (
+                self.build_cash_withdrawal_operation_result(card_id=card_id, account_id=account_id)
+            )),
+        ]
+        for field, build in waves:
+            tasks, targets = [], []
+            for user_id, account_plan, account, card_id in card_accounts:
+                for _ in range(getattr(account_plan, field).count):
+                    tasks.append(partial(build, user_id, account.account_id, card_id))
+                    targets.append(getattr(account, field))
+
+            for target, result in zip(targets, self.run_wave(tasks)):
+                target.append(result)
+
+        return users
+
+    def build_users_batched(
+            self,
+            plan: SeedUsersPlan,
+            count: int,
+            on_user_built: Callable[[SeedUserResult], None] | None = None
+    ) -> Iterator[SeedUserResult]:
+        """
+        Создаёт count пользователей пачками по batch_size (см. build_users_chunk)
+        и отдаёт их итератором: в памяти одновременно держится не больше одной пачки.
+
+        Колбэк вызывается после готовности всей пачки, поэтому чекпоинт пополняется
+        по мере сидинга, а при падении теряется не больше одной пачки.
+
+        Args:
+            plan: План генерации пользователя
+            count: Количество пользователей, которое нужно создать
+            on_user_built: Колбэк, вызываемый для каждого созданного пользователя
+
+        Returns:
+            Iterator[SeedUserResult]: Созданные пользователи
+        """
+        for start in range(0, count, self.batch_size):
+            chunk = self.build_users_chunk(plan=plan, count=min(self.batch_size, count - start))
+            if on_user_built is not None:
+                for user in chunk:
+                    on_user_built(user)
+            yield from chunk
+
     def build(self, plan: SeedsPlan) -> SeedsResult:
         """
         Генерирует полную структуру данных на основе плана:
@@ -309,7 +528,258 @@ class SeedsBuilder:
         Returns:
             SeedsResult: Результат с данными всех созданных пользователей
         """
-        return SeedsResult(users=[self.build_user(plan=plan.users) for _ in range(plan.users.count)])
+        return SeedsResult(users=list(self.build_users(plan=plan.users, count=plan.users.count)))
+
+
+class AsyncSeedsBuilder:
+    """
+    AsyncSeedsBuilder — асинхронный вариант SeedsBuilder на grpc.aio / httpx.AsyncClient.
+
+    Все пользователи создаются в одном event loop'е: одновременно в полёте может быть до
+    concurrency пользователей, а карты и операции одного счёта отправляются волнами.
+    Порядок зависимостей сохраняется: пользователь → счёт → карты → пополнения → списания.
+
+    Attributes:
+        users_gateway_client: Асинхронный клиент для работы с пользователями (HTTP или gRPC)
+        cards_gateway_client: Асинхронный клиент для выпуска карт
+        accounts_gateway_client: Асинхронный клиент для открытия счетов
+        operations_gateway_client: Асинхронный клиент для операций
+        concurrency: Количество пользователей, которые создаются одновременно
+    """
+
+    def __init__(
+            self,
+            users_gateway_client: AsyncUsersGatewayGRPCClient | AsyncUsersGatewayHTTPClient,
+            cards_gateway_client: AsyncCardsGatewayGRPCClient | AsyncCardsGatewayHTTPClient,
+            accounts_gateway_client: AsyncAccountsGatewayGRPCClient | AsyncAccountsGatewayHTTPClient,
+            operations_gateway_client: AsyncOperationsGatewayGRPCClient | AsyncOperationsGatewayHTTPClient,
+            concurrency: int = 1
+    ):
+        self.users_gateway_client = users_gateway_client
+        self.cards_gateway_client = cards_gateway_client
+        self.accounts_gateway_client = accounts_gateway_client
+        self.operations_gateway_client = operations_gateway_client
+        self.concurrency = concurrency
+
+    async def build_physical_card_result(self, user_id: str, account_id: str) -> SeedCardResult:
+        """
+        Асинхронно выпускает физическую карту для заданного пользователя и счёта.
+        """
+        response = await self.cards_gateway_client.issue_physical_card(user_id=user_id, account_id=account_id)
+        return SeedCardResult(card_id=response.card.id)
+
+    async def build_virtual_card_result(self, user_id: str, account_id: str) -> SeedCardResult:
+        """
+        Асинхронно выпускает виртуальную карту для заданного пользователя и счёта.
+        """
+        response = await self.cards_gateway_client.issue_virtual_card(user_id=user_id, account_id=account_id)
+        return SeedCardResult(card_id=response.card.id)
+
+    async def build_top_up_operation_result(self, card_id: str, account_id: str) -> SeedOperationResult:
+        """
+        Асинхронно выполняет операцию пополнения на карту.
+        """
+        response = await self.operations_gateway_client.make_top_up_operation(card_id=card_id, account_id=account_id)
+        return SeedOperationResult(operation_id=response.operation.id)
+
+    async def build_purchase_operation_result(self, card_id: str, account_id: str) -> SeedOperationResult:
+        """
+        Асинхронно выполняет операцию покупки по карте.
+        """
+        response = await self.operations_gateway_client.make_purchase_operation(card_id=card_id, account_id=account_id)
+        return SeedOperationResult(operation_id=response.operation.id)
+
+    async def build_transfer_operation_result(self, card_id: str, account_id: str) -> SeedOperationResult:
+        """
+        Асинхронно выполняет операцию перевода по карте.
+        """
+        response = await self.operations_gateway_client.make_transfer_operation(card_id=card_id, account_id=account_id)
+        return SeedOperationResult(operation_id=response.operation.id)
+
+    async def build_cash_withdrawal_operation_result(self, card_id: str, account_id: str) -> SeedOperationResult:
+        """
+        Асинхронно выполняет операцию снятия наличных с карты.
+        """
+        response = await self.operations_gateway_client.make_cash_withdrawal_operation(
+            card_id=card_id,
+            account_id=account_id
+        )
+        return SeedOperationResult(operation_id=response.operation.id)
+
+    async def build_savings_account_result(self, user_id: str) -> SeedAccountResult:
+        """
+        Асинхронно открывает сберегательный счёт для пользователя.
+        """
+        response = await self.accounts_gateway_client.open_savings_account(user_id=user_id)
+        return SeedAccountResult(account_id=response.account.id)
+
+    async def build_deposit_account_result(self, user_id: str) -> SeedAccountResult:
+        """
+        Асинхронно открывает депозитный счёт для пользователя.
+        """
+        response = await self.accounts_gateway_client.open_deposit_account(user_id=user_id)
+        return SeedAccountResult(account_id=response.account.id)
+
+    async def build_card_account_result(self, response, plan: SeedAccountsPlan, user_id: str) -> SeedAccountResult:
+        """
+        Наполняет уже открытый карточный счёт картами и операциями согласно плану.
+
+        Запросы идут волнами строго по очереди: карты, затем пополнения, затем покупки, переводы
+        и снятия наличных — в том же порядке, что и в SeedsBuilder, чтобы к списаниям на счёте уже
+        были средства, а списания одного вида не конкурировали за баланс с другими.
+        Внутри волны все запросы отправляются одновременно.
+
+        Args:
+            response: Ответ на открытие дебетового или кредитного счёта
+            plan: План наполнения счёта
+            user_id: Идентификатор пользователя
+
+        Returns:
+            SeedAccountResult: Результат с ID счёта, карт и операций
+        """
+        card_id = response.account.cards[0].id
+        account_id = response.account.id
+
+        async def gather(factory, count: int, **kwargs) -> list:
+            return list(await asyncio.gather(*(factory(**kwargs) for _ in range(count))))
+
+        physical_cards, virtual_cards = await asyncio.gather(
+            gather(self.build_physical_card_result, plan.physical_cards.count, user_id=user_id, account_id=account_id),
+            gather(self.build_virtual_card_result, plan.virtual_cards.count, user_id=user_id, account_id=account_id),
+        )
+
+        top_up_operations = await gather(
+            self.build_top_up_operation_result, plan.top_up_operations.count, card_id=card_id, account_id=account_id
+        )
+
+        purchase_operations = await gather(
+            self.build_purchase_operation_result, plan.purchase_operations.count, card_id=card_id, account_id=account_id
+        )
+        transfer_operations = await gather(
+            self.build_transfer_operation_result, plan.transfer_operations.count, card_id=card_id, account_id=account_id
+        )
+        cash_withdrawal_operations = await gather(
+            self.build_cash_withdrawal_operation_result, plan.cash_withdrawal_operations.count,
+            card_id=card_id, account_id=account_id
+        )
+
+        return SeedAccountResult(
+            account_id=account_id,
+            physical_cards=physical_cards,
+            virtual_cards=virtual_cards,
+            top_up_operations=top_up_operations,
+            purchase_operations=purchase_operations,
+            transfer_operations=transfer_operations,
+            cash_withdrawal_operations=cash_withdrawal_operations
+        )
+
+    async def build_debit_card_account_result(self, plan: SeedAccountsPlan, user_id: str) -> SeedAccountResult:
+        """
+        Асинхронно открывает дебетовый счёт и наполняет его картами и операциями.
+        """
+        response = await self.accounts_gateway_client.open_debit_card_account(user_id=user_id)
+        return await self.build_card_account_result(response, plan=plan, user_id=user_id)
+
+    async def build_credit_card_account_result(self, plan: SeedAccountsPlan, user_id: str) -> SeedAccountResult:
+        """
+        Асинхронно открывает кредитный счёт и наполняет его картами и операциями.
+        """
+        response = await self.accounts_gateway_client.open_credit_card_account(user_id=user_id)
+        return await self.build_card_account_result(response, plan=plan, user_id=user_id)
+
+    async def build_user(self, plan: SeedUsersPlan) -> SeedUserResult:
+        """
+        Асинхронно создаёт пользователя и все его счета согласно плану.
+
+        Args:
+            plan: План генерации пользователя
+
+        Returns:
+            SeedUserResult: Результат с ID пользователя и всеми созданными сущностями
+        """
+        response = await self.users_gateway_client.create_user()
+        user_id = response.user.id
+
+        savings_accounts, deposit_accounts, debit_card_accounts, credit_card_accounts = await asyncio.gather(
+            asyncio.gather(*(
+                self.build_savings_account_result(user_id=user_id)
+                for _ in range(plan.savings_accounts.count)
+            )),
+            asyncio.gather(*(
+                self.build_deposit_account_result(user_id=user_id)
+                for _ in range(plan.deposit_accounts.count)
+            )),
+            asyncio.gather(*(
+                self.build_debit_card_account_result(plan=plan.debit_card_accounts, user_id=user_id)
+                for _ in range(plan.debit_card_accounts.count)
+            )),
+            asyncio.gather(*(
+                self.build_credit_card_account_result(plan=plan.credit_card_accounts, user_id=user_id)
+                for _ in range(plan.credit_card_accounts.count)
+            )),
+        )
+
+        return SeedUserResult(
+            user_id=user_id,
+            savings_accounts=list(savings_accounts),
+            deposit_accounts=list(deposit_accounts),
+            debit_card_accounts=list(debit_card_accounts),
+            credit_card_accounts=list(credit_card_accounts)
+        )
+
+    async def build_users(
+            self,
+            plan: SeedUsersPlan,
+            count: int,
+            on_user_built: Callable[[SeedUserResult], None] | None = None
+    ) -> list[SeedUserResult]:
+        """
+        Асинхронно создаёт count пользователей по плану.
+        Одновременно создаётся не более concurrency пользователей, порядок результатов сохраняется.
+
+        Args:
+            plan: План генерации пользователя
+            count: Количество пользователей, которое нужно создать
+            on_user_built: Колбэк, вызываемый сразу после создания каждого пользователя
+
+        Returns:
+            list[SeedUserResult]: Созданные пользователи
+        """
+        semaphore = asyncio.Semaphore(max(self.concurrency, 1))
+
+        async def build_user() -> SeedUserResult:
+            async with semaphore:
+                user = await self.build_user(plan=plan)
+            if on_user_built is not None:
+                on_user_built(user)
+            return user
+
+        return list(await asyncio.gather(*(build_user() for _ in range(count))))
+
+    async def build(self, plan: SeedsPlan) -> SeedsResult:
+        """
+        Асинхронно генерирует полную структуру данных на основе плана.
+
+        Args:
+            plan: Полный план генерации данных
+
+        Returns:
+            SeedsResult: Результат с данными всех созданных пользователей
+        """
+        return SeedsResult(users=await self.build_users(plan=plan.users, count=plan.users.count))
+
+    async def close(self) -> None:
+        """
+        Закрывает каналы/соединения всех клиентов. Клиенты могут разделять один канал,
+        поэтому закрытие выполняется для каждого — повторное закрытие безопасно.
+        """
+        for client in (
+                self.users_gateway_client,
+                self.cards_gateway_client,
+                self.accounts_gateway_client,
+                self.operations_gateway_client
+        ):
+            await client.close()
 
 
 def build_grpc_seeds_builder() -> SeedsBuilder:
@@ -319,11 +789,15 @@ def build_grpc_seeds_builder() -> SeedsBuilder:
     Returns:
         SeedsBuilder: Инициализированный сидер с gRPC-клиентами
     """
+    # Все клиенты используют один общий канал: HTTP/2 мультиплексирует параллельные запросы
+    channel = build_gateway_grpc_client()
     return SeedsBuilder(
-        users_gateway_client=build_users_gateway_grpc_client(),
-        cards_gateway_client=build_cards_gateway_grpc_client(),
-        accounts_gateway_client=build_accounts_gateway_grpc_client(),
-        operations_gateway_client=build_operations_gateway_grpc_client()
+        users_gateway_client=build_users_gateway_grpc_client(channel=channel),
+        cards_gateway_client=build_cards_gateway_grpc_client(channel=channel),
+        accounts_gateway_client=build_accounts_gateway_grpc_client(channel=channel),
+        operations_gateway_client=build_operations_gateway_grpc_client(channel=channel),
+        concurrency=settings.seeds.concurrency,
+        batch_size=settings.seeds.batch_size
     )
 
 
@@ -334,9 +808,50 @@ def build_http_seeds_builder():
     Returns:
         SeedsBuilder: Инициализированный сидер с HTTP-клиентами
     """
+    # Все клиенты используют один общий пул соединений
+    client = build_gateway_http_client()
     return SeedsBuilder(
-        users_gateway_client=build_users_gateway_http_client(),
-        cards_gateway_client=build_cards_gateway_http_client(),
-        accounts_gateway_client=build_accounts_gateway_http_client(),
-        operations_gateway_client=build_operations_gateway_http_client()
+        users_gateway_client=build_users_gateway_http_client(client=client),
+        cards_gateway_client=build_cards_gateway_http_client(client=client),
+        accounts_gateway_client=build_accounts_gateway_http_client(client=client),
+        operations_gateway_client=build_operations_gateway_http_client(client=client),
+        concurrency=settings.seeds.concurrency,
+        batch_size=settings.seeds.batch_size
+    )
+
+
+def build_grpc_async_seeds_builder() -> AsyncSeedsBuilder:
+    """
+    Фабрика для создания асинхронного сидера на grpc.aio.
+    Все клиенты используют один общий aio-канал (HTTP/2 мультиплексирует запросы).
+    Вызывать нужно внутри работающего event loop'а.
+
+    Returns:
+        AsyncSeedsBuilder: Инициализированный асинхронный сидер с gRPC-клиентами
+    """
+    channel = build_gateway_async_grpc_client()
+    return AsyncSeedsBuilder(
+        users_gateway_client=build_users_gateway_async_grpc_client(channel),
+        cards_gateway_client=build_cards_gateway_async_grpc_client(channel),
+        accounts_gateway_client=build_accounts_gateway_async_grpc_client(channel),
+        operations_gateway_client=build_operations_gateway_async_grpc_client(channel),
+        concurrency=settings.seeds.async_concurrency
+    )
+
+
+def build_http_async_seeds_builder() -> AsyncSeedsBuilder:
+    """
+    Фабрика для создания асинхронного сидера на httpx.AsyncClient.
+    Все клиенты используют один общий пул соединений.
+
+    Returns:
+        AsyncSeedsBuilder: Инициализированный асинхронный сидер с HTTP-клиентами
+    """
+    client = build_gateway_async_http_client()
+    return AsyncSeedsBuilder(
+        users_gateway_client=build_users_gateway_async_http_client(client),
+        cards_gateway_client=build_cards_gateway_async_http_client(client),
+        accounts_gateway_client=build_accounts_gateway_async_http_client(client),
+        operations_gateway_client=build_operations_gateway_async_http_client(client),
+        concurrency=settings.seeds.async_concurrency
     )
@@ -0,0 +1,275 @@
+from typing import Any, Callable, Iterable, Sequence
+
+from config import settings
+from seeds.handout import SeedUsersHandout
+from seeds.schema.result import SeedUserResult
+
+
+class CompactSeedCard:
+    """
+    Компактная запись карты: вместо экземпляра BaseModel — объект с __slots__,
+    который создаётся только в момент обращения к карте.
+    """
+    __slots__ = ("card_id",)
+
+    def __init__(self, card_id: str):
+        self.card_id = card_id
+
+
+class CompactSeedOperation:
+    """
+    Компактная запись операции, создаётся только в момент обращения к операции.
+    """
+    __slots__ = ("operation_id",)
+
+    def __init__(self, operation_id: str):
+        self.operation_id = operation_id
+
+
+class SeedIdsView(Sequence):
+    """
+    Представление кортежа идентификаторов в виде последовательности записей.
+
+    Хранятся только строки идентификаторов, а записи (CompactSeedCard, CompactSeedOperation)
+    создаются при индексации, поэтому seed_user.credit_card_accounts[0].physical_cards[0].card_id
+    работает так же, как с pydantic-моделями.
+    """
+    __slots__ = ("ids", "factory")
+
+    def __init__(self, ids: tuple[str, ...], factory: Callable[[str], Any]):
+        self.ids = ids
+        self.factory = factory
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, index: int | slice):
+        if isinstance(index, slice):
+            return [self.factory(item) for item in self.ids[index]]
+
+        return self.factory(self.ids[index])
+
+
+class CompactSeedAccount:
+    """
+    Компактная запись счёта: идентификаторы карт и операций хранятся кортежами строк.
+    Пустые списки не занимают памяти — все они ссылаются на один и тот же пустой кортеж.
+    """
+    __slots__ = (
+        "account_id",
+        "physical_card_ids",
+        "virtual_card_ids",
+        "top_up_operation_ids",
+        "purchase_operation_ids",
+        "transfer_operation_ids",
+        "cash_withdrawal_operation_ids",
+    )
+
+    def __init__(
+            self,
+            account_id: str,
+            physical_card_ids: tuple[str, ...] = (),
+            virtual_card_ids: tuple[str, ...] = (),
+            top_up_operation_ids: tuple[str, ...] = (),
+            purchase_operation_ids: tuple[str, ...] = (),
+            transfer_operation_ids: tuple[str, ...] = (),
+            cash_withdrawal_operation_ids: tuple[str, ...] = ()
+    ):
+        self.account_id = account_id
+        self.physical_card_ids = physical_card_ids
+        self.virtual_card_ids = virtual_card_ids
+        self.top_up_operation_ids = top_up_operation_ids
+        self.purchase_operation_ids = purchase_operation_ids
+        self.transfer_operation_ids = transfer_operation_ids
+        self.cash_withdrawal_operation_ids = cash_withdrawal_operation_ids
+
+    @property
+    def physical_cards(self) -> SeedIdsView:
+        return SeedIdsView(self.physical_card_ids, CompactSeedCard)
+
+    @property
+    def virtual_cards(self) -> SeedIdsView:
+        return SeedIdsView(self.virtual_card_ids, CompactSeedCard)
+
+    @property
+    def top_up_operations(self) -> SeedIdsView:
+        return SeedIdsView(self.top_up_operation_ids, CompactSeedOperation)
+
+    @property
+    def purchase_operations(self) -> SeedIdsView:
+        return SeedIdsView(self.purchase_operation_ids, CompactSeedOperation)
+
+    @property
+    def transfer_operations(self) -> SeedIdsView:
+        return SeedIdsView(self.transfer_operation_ids, CompactSeedOperation)
+
+    @property
+    def cash_withdrawal_operations(self) -> SeedIdsView:
+        return SeedIdsView(self.cash_withdrawal_operation_ids, CompactSeedOperation)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'CompactSeedAccount':
+        """
+        Создаёт запись счёта из словаря в формате SeedAccountResult (как в JSON-дампе).
+        """
+        return cls(
+            account_id=data["account_id"],
+            physical_card_ids=tuple(card["card_id"] for card in data.get("physical_cards", ())),
+            virtual_card_ids=tuple(card["card_id"] for card in data.get("virtual_cards", ())),
+            top_up_operation_ids=tuple(
+                operation["operation_id"] for operation in data.get("top_up_operations", ())
+            ),
+            purchase_operation_ids=tuple(
+                operation["operation_id"] for operation in data.get("purchase_operations", ())
+            ),
+            transfer_operation_ids=tuple(
+                operation["operation_id"] for operation in data.get("transfer_operations", ())
+            ),
+            cash_withdrawal_operation_ids=tuple(
+                operation["operation_id"] for operation in data.get("cash_withdrawal_operations", ())
+            ),
+        )
+
+    def to_dict(self) -> dict:
+        """
+        Возвращает счёт в виде словаря в формате SeedAccountResult.
+        """
+        return {
+            "account_id": self.account_id,
+            "physical_cards": [{"card_id": card_id} for card_id in self.physical_card_ids],
+            "top_up_operations": [{"operation_id": item} for item in self.top_up_operation_ids],
+            "purchase_operations": [{"operation_id": item} for item in self.purchase_operation_ids],
+            "virtual_cards": [{"card_id": card_id} for card_id in self.virtual_card_ids],
+            "transfer_operations": [{"operation_id": item} for item in self.transfer_operation_ids],
+            "cash_withdrawal_operations": [
+                {"operation_id": item} for item in self.cash_withdrawal_operation_ids
+            ],
+        }
+
+
+class CompactSeedUser:
+    """
+    Компактная запись пользователя с теми же атрибутами, что и у SeedUserResult.
+    """
+    __slots__ = (
+        "user_id",
+        "deposit_accounts",
+        "savings_accounts",
+        "debit_card_accounts",
+        "credit_card_accounts",
+    )
+
+    def __init__(
+            self,
+            user_id: str,
+            deposit_accounts: tuple[CompactSeedAccount, ...] = (),
+            savings_accounts: tuple[CompactSeedAccount, ...] = (),
+            debit_card_accounts: tuple[CompactSeedAccount, ...] = (),
+            credit_card_accounts: tuple[CompactSeedAccount, ...] = ()
+    ):
+        self.user_id = user_id
+        self.deposit_accounts = deposit_accounts
+        self.savings_accounts = savings_accounts
+        self.debit_card_accounts = debit_card_accounts
+        self.credit_card_accounts = credit_card_accounts
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'CompactSeedUser':
+        """
+        Создаёт запись пользователя из словаря в формате SeedUserResult (как в JSON-дампе).
+        """
+        return cls(
+            user_id=data["user_id"],
+            deposit_accounts=tuple(map(CompactSeedAccount.from_dict, data.get("deposit_accounts", ()))),
+            savings_accounts=tuple(map(CompactSeedAccount.from_dict, data.get("savings_accounts", ()))),
+            debit_card_accounts=tuple(map(CompactSeedAccount.from_dict, data.get("debit_card_accounts", ()))),
+            credit_card_accounts=tuple(map(CompactSeedAccount.from_dict, data.get("credit_card_accounts", ()))),
+        )
+
+    @classmethod
+    def from_result(cls, user: SeedUserResult) -> 'CompactSeedUser':
+        """
+        Создаёт запись пользователя из pydantic-модели SeedUserResult.
+        """
+        return cls.from_dict(user.model_dump(mode="json"))
+
+    def to_dict(self) -> dict:
+        """
+        Возвращает пользователя в виде словаря в формате SeedUserResult.
+        """
+        return {
+            "user_id": self.user_id,
+            "deposit_accounts": [account.to_dict() for account in self.deposit_accounts],
+            "savings_accounts": [account.to_dict() for account in self.savings_accounts],
+            "debit_card_accounts": [account.to_dict() for account in self.debit_card_accounts],
+            "credit_card_accounts": [account.to_dict() for account in self.credit_card_accounts],
+        }
+
+    def to_result(self) -> SeedUserResult:
+        """
+        Возвращает пользователя в виде pydantic-модели SeedUserResult.
+        """
+        return SeedUserResult.model_validate(self.to_dict())
+
+
+class CompactSeedsResult:
+    """
+    Компактное хранилище результата сидинга с теми же методами выдачи пользователей, что и у SeedsResult.
+
+    Каждая карта и операция занимает одну строку идентификатора в кортеже вместо экземпляра BaseModel,
+    поэтому воркер Locust может держать в памяти на порядок больше данных.
+
+    Attributes:
+        users (list[CompactSeedUser]): Список пользователей.
+        handout (SeedUsersHandout): Раздача пользователей виртуальным пользователям Locust.
+    """
+
+    def __init__(self, users: list[CompactSeedUser]):
+        self.users = users
+        self.handout = SeedUsersHandout(
+            users=users,
+            policy=settings.seeds.exhaustion_policy,
+            timeout=settings.seeds.exhaustion_timeout
+        )
+
+    @classmethod
+    def from_dicts(cls, users: Iterable[dict]) -> 'CompactSeedsResult':
+        """
+        Создаёт хранилище из словарей пользователей в формате SeedUserResult.
+        Словари обрабатываются по одному, поэтому их можно читать из дампа потоково.
+        """
+        return cls(users=[CompactSeedUser.from_dict(user) for user in users])
+
+    def get_next_user(self) -> CompactSeedUser:
+        """
+        Возвращает следующего пользователя согласно SEEDS.EXHAUSTION_POLICY.
+        """
+        return self.handout.get_next_user()
+
+    def get_random_user(self) -> CompactSeedUser:
+        """
+        Возвращает случайного пользователя.
+        """
+        return self.handout.get_random_user()
+
+    def shard(self, index: int, count: int) -> 'CompactSeedsResult':
+        """
+        Возвращает часть пользователей, предназначенную воркеру index из count.
+        """
+        return CompactSeedsResult(users=self.users[index::count])
+
+    def release_user(self, user: CompactSeedUser):
+        """
+        Возвращает ранее выданного пользователя в пул.
+        """
+        self.handout.release_user(user)
+
+
+def dump_seed_user(user: SeedUserResult | CompactSeedUser) -> dict:
+    """
+    Возвращает пользователя любого представления в виде словаря в формате SeedUserResult.
+    """
+    if isinstance(user, CompactSeedUser):
+        return user.to_dict()
+
+    return user.model_dump(mode="json")
@@ -1,39 +1,628 @@
+import glob
+import json
+import mmap
 import os
+import shutil
+import struct
+import threading
+from array import array
+from typing import Iterable, Iterator, Sequence
 
-from seeds.schema.result import SeedsResult
+from pydantic import ValidationError
+
+from config import settings
+from seeds.compact import CompactSeedsResult
+from seeds.handout import SeedUsersHandout
+from seeds.schema.metadata import SeedsMetadata
+from seeds.schema.result import SeedsResult, SeedUserResult
+from tools.config.seeds import SeedsDumpFormat
 from tools.logger import get_logger
 
 logger = get_logger("SEEDS_DUMPS")
 
+# Размер блока, которым чекпоинт читается с конца при поиске последней целой строки
+CHECKPOINT_READ_CHUNK_SIZE = 64 * 1024
+
+# Заголовок бинарного дампа: сигнатура и количество пользователей.
+# За ним идут count + 1 смещений записей (uint64, little-endian) и сами записи — JSON пользователей
+BINARY_DUMP_MAGIC = b"SEEDSBIN"
+BINARY_DUMP_HEADER = struct.Struct("<8sQ")
+BINARY_DUMP_OFFSET = struct.Struct("<Q")
+
+
+def get_seeds_result_path(scenario: str, dump_format: SeedsDumpFormat | None = None) -> str:
+    """
+    Возвращает путь к файлу дампа сидинга для сценария.
+
+    :param scenario: Название сценария нагрузки.
+    :param dump_format: Формат дампа; по умолчанию берётся из настроек SEEDS.DUMP_FORMAT.
+    :return: Путь вида ./dumps/{scenario}_seeds.{json,jsonl,bin}
+    """
+    return f"./dumps/{scenario}_seeds.{dump_format or settings.seeds.dump_format}"
+
+
+def get_seeds_metadata_path(scenario: str) -> str:
+    """
+    Возвращает путь к файлу метаданных дампа сидинга для сценария.
+
+    :param scenario: Название сценария нагрузки.
+    :return: Путь вида ./dumps/{scenario}_seeds.meta.json
+    """
+    return f"./dumps/{scenario}_seeds.meta.json"
+
+
+def get_seeds_checkpoint_path(scenario: str, fingerprint: str) -> str:
+    """
+    Возвращает путь к файлу чекпоинта сидинга.
+    В имя входит отпечаток плана, поэтому чекпоинт другого плана никогда не будет подхвачен.
+
+    :param scenario: Название сценария нагрузки.
+    :param fingerprint: Отпечаток плана сидинга.
+    :return: Путь вида ./dumps/{scenario}_seeds.{fingerprint}.checkpoint.jsonl
+    """
+    return f"./dumps/{scenario}_seeds.{fingerprint[:16]}.checkpoint.jsonl"
+
+
+class LazySeedUsers(Sequence[SeedUserResult]):
+    """
+    Последовательность пользователей из JSONL-дампа.
+
+    При открытии файл только сканируется, и в памяти остаются лишь смещения строк (8 байт на пользователя).
+    Пользователь читается с диска и валидируется только в момент обращения к нему,
+    поэтому потребление памяти и время старта не растут вместе с размером дампа.
+    """
+
+    def __init__(self, file_path: str, offsets: array | None = None, parent: 'LazySeedUsers | None' = None):
+        """
+        :param file_path: Путь к JSONL-дампу.
+        :param offsets: Готовые смещения строк; если не переданы, файл сканируется целиком.
+        :param parent: Последовательность, чей открытый файл (и блокировку) переиспользует часть воркера.
+        """
+        self.file_path = file_path
+        self.file = parent.file if parent is not None else open(file_path, 'rb')
+        self.lock = parent.lock if parent is not None else threading.Lock()
+        self.offsets = offsets
+
+        if self.offsets is None:
+            self.offsets = array('Q')
+            offset = 0
+            for line in self.file:
+                if line.strip():
+                    self.offsets.append(offset)
+                offset += len(line)
+
+    def shard(self, index: int, count: int) -> 'LazySeedUsers':
+        """
+        Возвращает часть пользователей для одного из count воркеров (каждого count-го, начиная с index).
+        Дамп повторно не сканируется и не открывается — копируются только смещения.
+
+        :param index: Номер воркера, начиная с 0.
+        :param count: Общее количество воркеров.
+        """
+        return LazySeedUsers(self.file_path, offsets=self.offsets[index::count], parent=self)
+
+    def close(self) -> None:
+        """
+        Закрывает файл дампа. Части, полученные через shard(), после этого тоже недоступны.
+        """
+        self.file.close()
+
+    def __enter__(self) -> 'LazySeedUsers':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def __getitem__(self, index: int | slice) -> SeedUserResult | list[SeedUserResult]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        # seek + readline должны выполняться атомарно, если дамп читают несколько потоков
+        with self.lock:
+            self.file.seek(self.offsets[index])
+            line = self.file.readline()
+        return SeedUserResult.model_validate_json(line)
+
+
+class MappedSeedUsers(Sequence[SeedUserResult]):
+    """
+    Последовательность пользователей из бинарного дампа, открытого через mmap.
+
+    Индекс смещений хранится в самом файле, поэтому при открытии ничего не сканируется,
+    а чтение одного пользователя — это срез страниц файла и валидация одной записи.
+    Страницы отображённого файла берутся из page cache, поэтому все процессы Locust на одном хосте
+    используют одну общую копию дампа. Блокировки не нужны: срез mmap не меняет позицию файла.
+    """
+
+    def __init__(self, file_path: str, positions: range | None = None, parent: 'MappedSeedUsers | None' = None):
+        """
+        :param file_path: Путь к бинарному дампу.
+        :param positions: Номера записей, входящих в последовательность; по умолчанию — все записи.
+        :param parent: Последовательность, чьё отображение файла переиспользует часть воркера.
+        """
+        self.file_path = file_path
+        if parent is not None:
+            self.mapping = parent.mapping
+        else:
+            with open(file_path, 'rb') as file:
+                self.mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, count = BINARY_DUMP_HEADER.unpack_from(self.mapping, 0)
+        if magic != BINARY_DUMP_MAGIC:
+            self.mapping.close()
+            raise ValueError(f"File {file_path} is not a binary seeding dump")
+
+        self.positions = range(count) if positions is None else positions
+
+    def shard(self, index: int, count: int) -> 'MappedSeedUsers':
+        """
+        Возвращает часть пользователей для одного из count воркеров (каждого count-го, начиная с index).
+        Файл повторно не отображается — часть использует то же отображение.
+
+        :param index: Номер воркера, начиная с 0.
+        :param count: Общее количество воркеров.
+        """
+        return MappedSeedUsers(self.file_path, positions=self.positions[index::count], parent=self)
+
+    def close(self) -> None:
+        """
+        Снимает отображение дампа. Части, полученные через shard(), после этого тоже недоступны.
+        """
+        self.mapping.close()
+
+    def __enter__(self) -> 'MappedSeedUsers':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def read_record(self, position: int) -> bytes:
+        """
+        Возвращает сырую запись пользователя по её номеру в дампе.
+
+        :param position: Номер записи в дампе.
+        """
+        offset = BINARY_DUMP_HEADER.size + position * BINARY_DUMP_OFFSET.size
+        start, = BINARY_DUMP_OFFSET.unpack_from(self.mapping, offset)
+        end, = BINARY_DUMP_OFFSET.unpack_from(self.mapping, offset + BINARY_DUMP_OFFSET.size)
+        return self.mapping[start:end]
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def __getitem__(self, index: int | slice) -> SeedUserResult | list[SeedUserResult]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        return SeedUserResult.model_validate_json(self.read_record(self.positions[index]))
+
+
+class LazySeedsResult:
+    """
+    Аналог SeedsResult поверх JSONL- или бинарного дампа: те же методы выдачи пользователей,
+    но пользователи валидируются только при выдаче.
+
+    Attributes:
+        users (LazySeedUsers | MappedSeedUsers): Ленивая последовательность пользователей.
+        handout (SeedUsersHandout): Раздача пользователей виртуальным пользователям Locust.
+    """
+
+    def __init__(self, users: LazySeedUsers | MappedSeedUsers):
+        self.users = users
+        self.handout = SeedUsersHandout(
+            users=users,
+            policy=settings.seeds.exhaustion_policy,
+            timeout=settings.seeds.exhaustion_timeout
+        )
+
+    def get_next_user(self) -> SeedUserResult:
+        """
+        Возвращает следующего пользователя согласно SEEDS.EXHAUSTION_POLICY.
+
+        Returns:
+            SeedUserResult: Следующий пользователь из дампа.
+        """
+        return self.handout.get_next_user()
+
+    def get_random_user(self) -> SeedUserResult:
+        """
+        Возвращает случайного пользователя из дампа.
+
+        Returns:
+            SeedUserResult: Случайный пользователь.
+        """
+        return self.handout.get_random_user()
+
+    def shard(self, index: int, count: int) -> 'LazySeedsResult':
+        """
+        Возвращает часть пользователей, предназначенную воркеру index из count.
+
+        :param index: Номер воркера, начиная с 0.
+        :param count: Общее количество воркеров.
+        """
+        return LazySeedsResult(users=self.users.shard(index, count))
+
+    def release_user(self, user: SeedUserResult):
+        """
+        Возвращает ранее выданного пользователя в пул.
+
+        :param user: Пользователь, полученный через get_next_user.
+        """
+        self.handout.release_user(user)
+
+    def close(self) -> None:
+        """
+        Закрывает файл дампа, из которого читаются пользователи.
+        """
+        self.users.close()
+
+    def __enter__(self) -> 'LazySeedsResult':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+def write_seeds_users(users: Iterable[SeedUserResult], file_path: str) -> int:
+    """
+    Потоково пишет пользователей в JSONL-файл: один пользователь на строку.
+    Пользователи сериализуются по одному, поэтому весь дамп целиком в памяти не собирается.
+
+    :param users: Пользователи для записи.
+    :param file_path: Путь к файлу.
+    :return: Количество записанных пользователей.
+    """
+    count = 0
+    with open(file_path, 'w+', encoding="utf-8") as file:
+        for user in users:
+            file.write(user.model_dump_json() + "\n")
+            count += 1
+
+    return count
+
+
+def write_seeds_json(users: Iterable[SeedUserResult], file_path: str) -> int:
+    """
+    Потоково пишет пользователей в JSON-дамп в формате SeedsResult ({"users": [...]}).
+
+    :param users: Пользователи для записи.
+    :param file_path: Путь к файлу.
+    :return: Количество записанных пользователей.
+    """
+    count = 0
+    with open(file_path, 'w+', encoding="utf-8") as file:
+        file.write('{"users":[')
+        for user in users:
+            file.write(("," if count else "") + user.model_dump_json())
+            count += 1
+        file.write("]}")
+
+    return count
+
+
+def write_seeds_binary(users: Iterable[SeedUserResult], file_path: str) -> int:
+    """
+    Пишет пользователей в бинарный дамп: заголовок, индекс смещений и записи.
+
+    Количество пользователей заранее неизвестно, поэтому записи сначала потоково пишутся
+    во временный файл, а в памяти копятся только их смещения (8 байт на пользователя).
+    Затем в дамп пишутся заголовок и индекс, и следом копируются записи.
 
-def save_seeds_result(result: SeedsResult, scenario: str):
+    :param users: Пользователи для записи.
+    :param file_path: Путь к файлу.
+    :return: Количество записанных пользователей.
     """
-    Сохраняет результат сидинга (SeedsResult) в JSON-файл.
+    records_path = f"{file_path}.records"
+    sizes = array('Q')
+    try:
+        with open(records_path, 'wb') as records:
+            for user in users:
+                record = user.model_dump_json().encode("utf-8")
+                records.write(record)
+                sizes.append(len(record))
+
+        index_size = (len(sizes) + 1) * BINARY_DUMP_OFFSET.size
+        offsets = array('Q', [BINARY_DUMP_HEADER.size + index_size])
+        for size in sizes:
+            offsets.append(offsets[-1] + size)
+
+        with open(file_path, 'wb') as file, open(records_path, 'rb') as records:
+            file.write(BINARY_DUMP_HEADER.pack(BINARY_DUMP_MAGIC, len(sizes)))
+            file.write(b"".join(BINARY_DUMP_OFFSET.pack(offset) for offset in offsets))
+            shutil.copyfileobj(records, file)
+    finally:
+        if os.path.exists(records_path):
+            os.remove(records_path)
 
-    :param result: Результат сидинга, сгенерированный билдером.
+    return len(sizes)
+
+
+def save_seeds_result(users: Iterable[SeedUserResult], scenario: str) -> int:
+    """
+    Потоково сохраняет пользователей сидинга в файл в формате из настроек SEEDS.DUMP_FORMAT.
+    Пользователи могут приходить итератором (например, из чекпоинта) — целиком в памяти они не собираются.
+
+    :param users: Пользователи, созданные билдером.
     :param scenario: Название сценария нагрузки, для которого создаются данные.
                      Используется для генерации имени файла (например, "credit_card_test").
+    :return: Количество сохранённых пользователей.
     """
     # Убедимся, что папка dumps существует
     if not os.path.exists("dumps"):
         os.mkdir("dumps")
 
-    file_path = f"./dumps/{scenario}_seeds.json"
-    # Сохраняем результат сидинга в файл с именем {scenario}_seeds.json
-    with open(file_path, 'w+', encoding="utf-8") as file:
-        file.write(result.model_dump_json())
+    file_path = get_seeds_result_path(scenario)
+    # Сохраняем результат сидинга во временный файл и атомарно подменяем им дамп,
+    # чтобы прерванная запись не оставила наполовину записанный дамп
+    if settings.seeds.dump_format == SeedsDumpFormat.JSONL:
+        count = write_seeds_users(users, f"{file_path}.tmp")
+    elif settings.seeds.dump_format == SeedsDumpFormat.BINARY:
+        count = write_seeds_binary(users, f"{file_path}.tmp")
+    else:
+        count = write_seeds_json(users, f"{file_path}.tmp")
+    os.replace(f"{file_path}.tmp", file_path)
     logger.debug(f"Seeding result saved to file: {file_path}")
+    return count
+
+
+def read_seeds_users(file_path: str, dump_format: SeedsDumpFormat) -> Iterator[dict]:
+    """
+    Читает пользователей из дампа в виде словарей, без валидации pydantic.
+    JSONL- и бинарный дампы читаются по одной записи, поэтому в памяти одновременно находится
+    только один пользователь.
+
+    :param file_path: Путь к дампу.
+    :param dump_format: Формат дампа.
+    :return: Итератор словарей в формате SeedUserResult.
+    """
+    if dump_format == SeedsDumpFormat.BINARY:
+        with MappedSeedUsers(file_path) as users:
+            for position in users.positions:
+                yield json.loads(users.read_record(position))
+        return
+
+    with open(file_path, 'r', encoding="utf-8") as file:
+        if dump_format == SeedsDumpFormat.JSONL:
+            for line in file:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            yield from json.load(file)["users"]
+
+
+def convert_seeds_result(scenario: str) -> bool:
+    """
+    Переписывает дамп сидинга, сохранённый в другом формате, в формат из настроек SEEDS.DUMP_FORMAT.
+    Формат дампа не входит в отпечаток плана, поэтому после смены формата те же пользователи
+    переносятся в новый дамп, а не создаются заново. Метаданные дампа при этом не меняются.
+
+    :param scenario: Название сценария нагрузки.
+    :return: True, если дамп был сконвертирован.
+    """
+    if os.path.exists(get_seeds_result_path(scenario)) or not os.path.exists(get_seeds_metadata_path(scenario)):
+        return False
+
+    for dump_format in SeedsDumpFormat:
+        file_path = get_seeds_result_path(scenario, dump_format)
+        if not os.path.exists(file_path):
+            continue
 
+        users = (SeedUserResult.model_validate(data) for data in read_seeds_users(file_path, dump_format))
+        save_seeds_result(users=users, scenario=scenario)
+        os.remove(file_path)
+        logger.debug(f"Seeding result converted from file: {file_path}")
+        return True
 
-def load_seeds_result(scenario: str) -> SeedsResult:
+    return False
+
+
+def load_seeds_result(
+        scenario: str,
+        compact: bool | None = None
+) -> SeedsResult | LazySeedsResult | CompactSeedsResult:
     """
-    Загружает результат сидинга из JSON-файла.
+    Загружает результат сидинга из файла.
+
+    - С compact (по умолчанию SEEDS.COMPACT) возвращается CompactSeedsResult.
+    - Для формата JSON весь дамп валидируется сразу в SeedsResult.
+    - Для JSONL возвращается LazySeedsResult, который читает пользователей по требованию.
+    - Для бинарного дампа возвращается LazySeedsResult поверх mmap без сканирования файла.
 
     :param scenario: Название сценария нагрузки, данные которого нужно загрузить.
-    :return: Объект SeedsResult, восстановленный из файла.
+    :param compact: Загрузить дамп в компактное хранилище.
+    :return: Объект SeedsResult, LazySeedsResult или CompactSeedsResult.
     """
-    file_path = f"./dumps/{scenario}_seeds.json"
+    file_path = get_seeds_result_path(scenario)
+    if settings.seeds.compact if compact is None else compact:
+        result = CompactSeedsResult.from_dicts(read_seeds_users(file_path, settings.seeds.dump_format))
+        logger.debug(f"Seeding result loaded into compact store from file: {file_path}")
+        return result
+
+    if settings.seeds.dump_format == SeedsDumpFormat.JSONL:
+        logger.debug(f"Seeding result opened lazily from file: {file_path}")
+        return LazySeedsResult(users=LazySeedUsers(file_path))
+
+    if settings.seeds.dump_format == SeedsDumpFormat.BINARY:
+        logger.debug(f"Seeding result mapped into memory from file: {file_path}")
+        return LazySeedsResult(users=MappedSeedUsers(file_path))
+
     # Открываем файл и валидируем его как объект SeedsResult
     with open(file_path, 'r', encoding="utf-8") as file:
-        return SeedsResult.model_validate_json(file.read())
+        result = SeedsResult.model_validate_json(file.read())
     logger.debug(f"Seeding result loaded from file: {file_path}")
+    return result
+
+
+def save_seeds_metadata(metadata: SeedsMetadata, scenario: str):
+    """
+    Сохраняет метаданные дампа сидинга (отпечаток плана) в JSON-файл рядом с дампом.
+    Вызывается после сохранения самого дампа, поэтому наличие метаданных означает, что дамп записан целиком.
+
+    :param metadata: Метаданные дампа.
+    :param scenario: Название сценария нагрузки.
+    """
+    if not os.path.exists("dumps"):
+        os.mkdir("dumps")
+
+    file_path = get_seeds_metadata_path(scenario)
+    with open(file_path, 'w+', encoding="utf-8") as file:
+        file.write(metadata.model_dump_json())
+    logger.debug(f"Seeding metadata saved to file: {file_path}")
+
+
+def load_seeds_metadata(scenario: str) -> SeedsMetadata | None:
+    """
+    Загружает метаданные дампа сидинга.
+
+    :param scenario: Название сценария нагрузки.
+    :return: Объект SeedsMetadata или None, если дампа или метаданных нет.
+    """
+    file_path = get_seeds_metadata_path(scenario)
+    if not (os.path.exists(file_path) and os.path.exists(get_seeds_result_path(scenario))):
+        return None
+
+    with open(file_path, 'r', encoding="utf-8") as file:
+        return SeedsMetadata.model_validate_json(file.read())
+
+
+def remove_seeds_result(scenario: str):
+    """
+    Удаляет дамп сидинга, его метаданные и чекпоинты, чтобы при следующем запуске данные были созданы заново.
+
+    :param scenario: Название сценария нагрузки.
+    """
+    # Сначала удаляем метаданные: без них дамп в любом случае считается невалидным
+    dumps_paths = [get_seeds_result_path(scenario, dump_format) for dump_format in SeedsDumpFormat]
+    for file_path in (get_seeds_metadata_path(scenario), *dumps_paths):
+        if os.path.exists(file_path):
+            os.remove(file_path)
+            logger.debug(f"Seeding file removed: {file_path}")
+
+    remove_seeds_checkpoints(scenario)
+
+
+class SeedsCheckpointWriter:
+    """
+    Потоково дописывает созданных пользователей в чекпоинт (JSONL, один пользователь на строку).
+
+    Каждая строка сбрасывается на диск сразу после записи, поэтому при падении сидинга
+    теряется не больше одного пользователя. Запись строки не переключает greenlet'ы,
+    поэтому писатель можно безопасно вызывать из пула сидера.
+    """
+
+    def __init__(self, scenario: str, fingerprint: str):
+        """
+        :param scenario: Название сценария нагрузки.
+        :param fingerprint: Отпечаток плана сидинга.
+        """
+        self.file_path = get_seeds_checkpoint_path(scenario, fingerprint)
+        self.file = None
+
+    def __enter__(self) -> "SeedsCheckpointWriter":
+        if not os.path.exists("dumps"):
+            os.mkdir("dumps")
+
+        self.truncate_torn_line()
+        self.file = open(self.file_path, 'a', encoding="utf-8")
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.file.close()
+
+    def truncate_torn_line(self) -> None:
+        """
+        Обрезает чекпоинт до последнего перевода строки.
+        Если прошлый сидинг упал посреди записи, без этого следующий пользователь дописался бы
+        в конец недописанной строки, и при чтении пропустились бы оба.
+        """
+        if not os.path.exists(self.file_path):
+            return
+
+        with open(self.file_path, 'rb+') as file:
+            end = file.seek(0, os.SEEK_END)
+            # Ищем последний перевод строки с конца файла, читая его блоками
+            position = end
+            while position > 0:
+                start = max(0, position - CHECKPOINT_READ_CHUNK_SIZE)
+                file.seek(start)
+                index = file.read(position - start).rfind(b"\n")
+                if index != -1:
+                    position = start + index + 1
+                    break
+                position = start
+
+            if position != end:
+                file.truncate(position)
+                logger.warning(f"Truncated torn last line of checkpoint file: {self.file_path}")
+
+    def write(self, user: SeedUserResult) -> None:
+        """
+        Дописывает пользователя в чекпоинт.
+
+        :param user: Полностью созданный пользователь.
+        """
+        self.file.write(user.model_dump_json() + "\n")
+        self.file.flush()
+
+
+def load_seeds_checkpoint(scenario: str, fingerprint: str) -> Iterator[SeedUserResult]:
+    """
+    Потоково читает пользователей из чекпоинта незавершённого сидинга.
+    Последняя строка может быть записана не до конца (падение во время записи) — такие строки пропускаются.
+
+    :param scenario: Название сценария нагрузки.
+    :param fingerprint: Отпечаток плана сидинга.
+    :return: Итератор уже созданных пользователей (пустой, если чекпоинта нет).
+    """
+    file_path = get_seeds_checkpoint_path(scenario, fingerprint)
+    if not os.path.exists(file_path):
+        return
+
+    count = 0
+    with open(file_path, 'r', encoding="utf-8") as file:
+        for line in file:
+            try:
+                user = SeedUserResult.model_validate_json(line)
+            except ValidationError:
+                logger.warning(f"Skipping corrupted checkpoint line in file: {file_path}")
+                continue
+
+            count += 1
+            yield user
+
+    logger.debug(f"Seeding checkpoint read from file: {file_path}, users: {count}")
+
+
+def read_seeds_checkpoint_user_ids(scenario: str, fingerprint: str) -> Iterator[str]:
+    """
+    Потоково читает идентификаторы пользователей из чекпоинта, без валидации pydantic.
+    Недописанные строки пропускаются.
+
+    :param scenario: Название сценария нагрузки.
+    :param fingerprint: Отпечаток плана сидинга.
+    :return: Итератор идентификаторов (пустой, если чекпоинта нет).
+    """
+    file_path = get_seeds_checkpoint_path(scenario, fingerprint)
+    if not os.path.exists(file_path):
+        return
+
+    with open(file_path, 'r', encoding="utf-8") as file:
+        for line in file:
+            try:
+                yield json.loads(line)["user_id"]
+            except (json.JSONDecodeError, KeyError):
+                continue
+
+
+def remove_seeds_checkpoints(scenario: str):
+    """
+    Удаляет все чекпоинты сценария (для любых планов).
+
+    :param scenario: Название сценария нагрузки.
+    """
+    for file_path in glob.glob(f"./dumps/{scenario}_seeds.*.checkpoint.jsonl"):
+        os.remove(file_path)
+        logger.debug(f"Seeding checkpoint removed: {file_path}")
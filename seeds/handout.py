@@ -0,0 +1,116 @@
+import random
+import threading
+from collections import deque
+from typing import Sequence, TYPE_CHECKING
+
+from tools.config.seeds import SeedsExhaustionPolicy
+
+if TYPE_CHECKING:
+    from seeds.schema.result import SeedUserResult
+
+
+class SeedsExhaustedError(IndexError):
+    """
+    Пул сидинговых пользователей исчерпан.
+
+    Наследуется от IndexError, чтобы сохранить совместимость с прежним поведением list.pop(0).
+    """
+
+
+class SeedUsersHandout:
+    """
+    Раздаёт пользователей из сидинга виртуальным пользователям Locust.
+
+    Вместо list.pop(0) (O(n) на каждый вызов) используется курсор по исходной последовательности
+    и очередь возвращённых пользователей, поэтому выдача выполняется за O(1).
+    Все операции защищены threading.Condition, который под gevent-патчем Locust
+    становится кооперативным, поэтому раздача безопасна и для потоков, и для гринлетов.
+
+    Attributes:
+        users (Sequence[SeedUserResult]): Исходная последовательность пользователей.
+        policy (SeedsExhaustionPolicy): Поведение при исчерпании пула.
+        timeout (float | None): Максимальное время ожидания пользователя для политики BLOCK.
+    """
+
+    def __init__(
+            self,
+            users: Sequence['SeedUserResult'],
+            policy: SeedsExhaustionPolicy = SeedsExhaustionPolicy.FAIL,
+            timeout: float | None = None
+    ):
+        self.users = users
+        self.policy = policy
+        self.timeout = timeout
+
+        self.cursor = 0
+        self.released: deque['SeedUserResult'] = deque()
+        self.condition = threading.Condition()
+
+    def get_next_user(self) -> 'SeedUserResult':
+        """
+        Возвращает следующего пользователя согласно политике исчерпания.
+
+        Сначала выдаются пользователи, возвращённые через release_user, затем — ещё не выданные.
+        Когда пул исчерпан: WRAP начинает выдачу сначала, BLOCK ждёт возврата пользователя,
+        FAIL сразу выбрасывает SeedsExhaustedError.
+
+        Returns:
+            SeedUserResult: Следующий пользователь.
+        """
+        with self.condition:
+            while True:
+                if self.released:
+                    return self.released.popleft()
+
+                if self.cursor < len(self.users):
+                    index = self.cursor
+                    self.cursor += 1
+                    break
+
+                if self.policy == SeedsExhaustionPolicy.WRAP and len(self.users) > 0:
+                    self.cursor = 0
+                    continue
+
+                if self.policy == SeedsExhaustionPolicy.BLOCK:
+                    if self.condition.wait(timeout=self.timeout):
+                        continue
+                    raise SeedsExhaustedError(
+                        f"No seeded user was released within {self.timeout}s, "
+                        f"all {len(self.users)} users are in use"
+                    )
+
+                raise SeedsExhaustedError(
+                    f"All {len(self.users)} seeded users have already been handed out, "
+                    f"seed more users or change SEEDS.EXHAUSTION_POLICY"
+                )
+
+        # Чтение пользователя вынесено из-под блокировки: для ленивого дампа это обращение к диску
+        return self.users[index]
+
+    def get_random_user(self) -> 'SeedUserResult':
+        """
+        Возвращает случайного пользователя без изъятия его из пула.
+
+        Returns:
+            SeedUserResult: Случайный пользователь.
+        """
+        if len(self.users) == 0:
+            raise SeedsExhaustedError("Seeding result contains no users")
+
+        return self.users[random.randrange(len(self.users))]
+
+    def release_user(self, user: 'SeedUserResult'):
+        """
+        Возвращает пользователя в пул, чтобы его мог получить другой виртуальный пользователь.
+
+        При политике WRAP пользователь не возвращается: выдача и так идёт по кругу, и возврат
+        выдал бы его повторно раньше очереди, а очередь возвращённых росла бы без ограничения.
+
+        :param user: Ранее выданный пользователь.
+        """
+        if self.policy == SeedsExhaustionPolicy.WRAP:
+            return
+
+        with self.condition:
+            self.released.append(user)
+            self.condition.notify()
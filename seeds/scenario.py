@@ -1,14 +1,65 @@
+import hashlib
 from abc import ABC, abstractmethod
+from typing import Iterable, Iterator
 
-from seeds.builder import build_grpc_seeds_builder
-from seeds.dumps import save_seeds_result, load_seeds_result
+from gevent.event import AsyncResult
+from locust.env import Environment
+from locust.runners import MasterRunner, WorkerRunner, STATE_SPAWNING, STATE_RUNNING
+
+from config import settings
+from seeds.async_runner import run_async_seeding
+from seeds.builder import build_grpc_seeds_builder, build_grpc_async_seeds_builder
+from seeds.dumps import (
+    get_seeds_result_path,
+    read_seeds_users,
+    save_seeds_result,
+    load_seeds_result,
+    save_seeds_metadata,
+    load_seeds_metadata,
+    remove_seeds_result,
+    load_seeds_checkpoint,
+    convert_seeds_result,
+    read_seeds_checkpoint_user_ids,
+    remove_seeds_checkpoints,
+    SeedsCheckpointWriter,
+    LazySeedsResult
+)
+from seeds.compact import CompactSeedsResult, dump_seed_user
+from seeds.schema.metadata import SeedsMetadata
 from seeds.schema.plan import SeedsPlan
-from seeds.schema.result import SeedsResult
+from seeds.schema.result import SeedsResult, SeedUserResult
 from tools.logger import get_logger
 
 # Инициализируем логгер с именем SEEDS_SCENARIO
 logger = get_logger("SEEDS_SCENARIO")
 
+# Тип сообщения, которым мастер Locust сообщает воркеру его часть пользователей
+SEEDS_SHARD_MESSAGE = "seeds_shard"
+# Тип сообщения, которым воркер запрашивает у мастера свою часть пользователей
+SEEDS_SHARD_REQUEST_MESSAGE = "seeds_shard_request"
+
+
+class PendingSeedsResult:
+    """
+    Данные сидинга воркера, пока мастер не прислал его часть пользователей.
+
+    Воркер, подключившийся к уже идущему тесту, получает команду spawn раньше своей части,
+    поэтому обращение к атрибутам результата ждёт её, а не падает в on_start виртуального пользователя.
+    """
+
+    def __init__(self):
+        self.result = AsyncResult()
+
+    def resolve(self, seeds: SeedsResult | LazySeedsResult | CompactSeedsResult) -> None:
+        """
+        Передаёт полученную часть пользователей всем, кто её ждёт.
+        """
+        if not self.result.ready():
+            self.result.set(seeds)
+
+    def __getattr__(self, name: str):
+        return getattr(self.result.get(), name)
+
 
 class SeedsScenario(ABC):
     """
@@ -41,21 +92,59 @@ class SeedsScenario(ABC):
         """
         ...
 
-    def save(self, result: SeedsResult) -> None:
+    @property
+    def fingerprint(self) -> str:
+        """
+        Отпечаток плана сидинга и адреса стенда.
+
+        Количество пользователей в отпечаток не входит: при его увеличении существующий дамп
+        не пересоздаётся, а дополняется недостающими пользователями.
+        """
+        shape = self.plan.model_copy(deep=True)
+        shape.users.count = 0
+        payload = f"{shape.model_dump_json()}|{settings.gateway_grpc_client.client_url}"
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def is_actual(self) -> bool:
+        """
+        Проверяет, есть ли в ./dumps валидный дамп, созданный для текущего плана и стенда,
+        в котором достаточно пользователей.
+        :return: True, если дамп можно переиспользовать без повторного сидинга.
         """
-        Сохраняет результат сидинга в файл.
-        :param result: Объект SeedsResult, содержащий сгенерированные данные.
+        metadata = load_seeds_metadata(scenario=self.scenario)
+        return (
+                metadata is not None
+                and metadata.fingerprint == self.fingerprint
+                and metadata.users_count >= self.plan.users.count
+        )
+
+    def invalidate(self) -> None:
+        """
+        Явно инвалидирует дамп: при следующем вызове build() данные будут созданы заново.
+        """
+        logger.info(f"[{self.scenario}] Invalidating seeding result.")
+        remove_seeds_result(scenario=self.scenario)
+
+    def save(self, users: Iterable[SeedUserResult]) -> None:
+        """
+        Потоково сохраняет пользователей сидинга в файл.
+        :param users: Созданные пользователи (список или итератор).
         """
         # Логируем начало сохранения
         logger.info(f"[{self.scenario}] Saving seeding result to file.")
-        save_seeds_result(result=result, scenario=self.scenario)
+        users_count = save_seeds_result(users=users, scenario=self.scenario)
+        # Метаданные пишем последними — по ним определяется, что дамп записан полностью
+        save_seeds_metadata(
+            metadata=SeedsMetadata(fingerprint=self.fingerprint, users_count=users_count),
+            scenario=self.scenario
+        )
         # Логируем успешное завершение
         logger.info(f"[{self.scenario}] Seeding result saved successfully.")
 
-    def load(self) -> SeedsResult:
+    def load(self) -> SeedsResult | LazySeedsResult | CompactSeedsResult:
         """
         Загружает результаты сидинга из файла.
-        :return: Объект SeedsResult, содержащий данные, загруженные из файла.
+        :return: Объект SeedsResult (LazySeedsResult для JSONL-дампа, CompactSeedsResult при SEEDS.COMPACT).
         """
         # Логируем начало загрузки
         logger.info(f"[{self.scenario}] Loading seeding result from file.")
@@ -64,17 +153,246 @@ class SeedsScenario(ABC):
         logger.info(f"[{self.scenario}] Seeding result loaded successfully.")
         return result
 
-    def build(self) -> None:
+    async def build_async(
+            self,
+            count: int,
+            checkpoint: SeedsCheckpointWriter | None = None
+    ) -> list[SeedUserResult]:
+        """
+        Генерирует пользователей асинхронным сидером на grpc.aio.
+        Сидер создаётся внутри event loop'а, так как aio-каналы к нему привязаны.
+
+        Вызывается в отдельном процессе без monkey patching gevent (seeds.async_runner):
+        в процессе, пропатченном gevent'ом, grpc.aio под asyncio.run зависает.
+
+        :param count: Количество пользователей, которое нужно создать.
+        :param checkpoint: Писатель чекпоинта, в который сохраняется каждый созданный пользователь.
+        :return: Список созданных пользователей.
+        """
+        builder = build_grpc_async_seeds_builder()
+        try:
+            return await builder.build_users(
+                plan=self.plan.users,
+                count=count,
+                on_user_built=checkpoint.write if checkpoint else None
+            )
+        finally:
+            await builder.close()
+
+    def load_metadata(self) -> SeedsMetadata | None:
+        """
+        Загружает метаданные дампа текущего плана и стенда.
+        Дамп, созданный для другого плана или стенда, инвалидируется.
+        :return: Объект SeedsMetadata или None, если подходящего дампа нет.
+        """
+        metadata = load_seeds_metadata(scenario=self.scenario)
+        if metadata is not None and metadata.fingerprint != self.fingerprint:
+            # План или стенд изменились — старый дамп и чекпоинты больше не подходят
+            self.invalidate()
+            return None
+
+        return metadata
+
+    def count_existing_users(self) -> int:
+        """
+        Считает уже созданных пользователей, не загружая их: в дампе — по метаданным,
+        в чекпоинте прерванного сидинга — по идентификаторам без валидации pydantic.
+        Дамп читается, только если чекпоинт есть: пользователи, попавшие и туда, и туда, считаются один раз.
+        :return: Количество пользователей, которых не нужно создавать заново.
+        """
+        metadata = self.load_metadata()
+        checkpoint_user_ids = set(read_seeds_checkpoint_user_ids(scenario=self.scenario, fingerprint=self.fingerprint))
+        if metadata is None:
+            return len(checkpoint_user_ids)
+
+        if checkpoint_user_ids:
+            file_path = get_seeds_result_path(self.scenario)
+            for data in read_seeds_users(file_path, settings.seeds.dump_format):
+                checkpoint_user_ids.discard(data["user_id"])
+
+        return metadata.users_count + len(checkpoint_user_ids)
+
+    def iter_existing_users(self) -> Iterator[SeedUserResult]:
+        """
+        Потоково отдаёт уже созданных пользователей: из дампа того же плана (если нужно лишь дополнить его)
+        и из чекпоинта прерванного сидинга. Пользователи, попавшие и в дамп, и в чекпоинт, не дублируются.
+        В памяти при этом держатся только идентификаторы пользователей.
+        :return: Итератор пользователей, которых не нужно создавать заново.
+        """
+        metadata = self.load_metadata()
+        known_user_ids: set[str] = set()
+        if metadata is not None:
+            # Для дозаписи дампа нужны pydantic-модели, поэтому компактное хранилище здесь не используется
+            file_path = get_seeds_result_path(self.scenario)
+            for data in read_seeds_users(file_path, settings.seeds.dump_format):
+                known_user_ids.add(data["user_id"])
+                yield SeedUserResult.model_validate(data)
+
+        for user in load_seeds_checkpoint(scenario=self.scenario, fingerprint=self.fingerprint):
+            if user.user_id not in known_user_ids:
+                yield user
+
+    def build(self, force: bool = False) -> None:
         """
         Генерирует данные с помощью билдера, используя план сидинга, и сохраняет результат.
+
+        - Если в ./dumps уже есть дамп для того же плана и стенда, генерация пропускается.
+        - Если в дампе меньше пользователей, чем в плане, создаются только недостающие.
+        - Каждый созданный пользователь сразу пишется в чекпоинт, поэтому упавший сидинг
+          при следующем запуске продолжается с места остановки.
+        - Формат дампа в отпечаток не входит: после смены SEEDS.DUMP_FORMAT существующий дамп
+          конвертируется в новый формат, а пользователи заново не создаются.
+
+        Пересоздать данные можно через force=True, настройку SEEDS.FORCE_REBUILD или invalidate().
+        :param force: Принудительно пересоздать данные, даже если дамп актуален.
+        """
+        if force or settings.seeds.force_rebuild:
+            self.invalidate()
+        else:
+            if convert_seeds_result(scenario=self.scenario):
+                logger.info(f"[{self.scenario}] Seeding result converted to {settings.seeds.dump_format} format.")
+            if self.is_actual():
+                logger.info(f"[{self.scenario}] Seeding result is up to date, skipping data generation.")
+                return
+
+        existing_count = self.count_existing_users()
+        count = self.plan.users.count - existing_count
+
+        if count > 0:
+            # Преобразуем план сидинга в JSON для логов (без значений по умолчанию)
+            plan_json = self.plan.model_dump_json(indent=2, exclude_defaults=True)
+            # Логируем начало генерации
+            logger.info(
+                f"[{self.scenario}] Starting seeding data generation for plan: {plan_json}. "
+                f"Already created users: {existing_count}, users to create: {count}"
+            )
+            # Запускаем генерацию (асинхронным или блокирующим сидером — в зависимости от настроек)
+            if settings.seeds.use_async:
+                # Асинхронный сидер работает в отдельном процессе без monkey patching gevent
+                # и пишет пользователей в чекпоинт, откуда они и забираются
+                run_async_seeding(scenario_class=type(self), count=count)
+            else:
+                with SeedsCheckpointWriter(scenario=self.scenario, fingerprint=self.fingerprint) as checkpoint:
+                    # Пользователи пишутся в чекпоинт по мере создания, а в памяти не копятся
+                    for _ in self.builder.build_users(
+                            plan=self.plan.users,
+                            count=count,
+                            on_user_built=checkpoint.write
+                    ):
+                        pass
+            # Логируем завершение генерации
+            logger.info(f"[{self.scenario}] Seeding data generation completed.")
+
+        # Потоково переносим старый дамп и чекпоинт в новый дамп и удаляем чекпоинт — он уже вошёл в дамп
+        self.save(self.iter_existing_users())
+        remove_seeds_checkpoints(scenario=self.scenario)
+
+    def setup(self, environment: Environment) -> None:
         """
-        # Преобразуем план сидинга в JSON для логов (без значений по умолчанию)
-        plan_json = self.plan.model_dump_json(indent=2, exclude_defaults=True)
-        # Логируем начало генерации
-        logger.info(f"[{self.scenario}] Starting seeding data generation for plan: {plan_json}")
-        # Запускаем генерацию
-        result = self.builder.build(self.plan)
-        # Логируем завершение генерации
-        logger.info(f"[{self.scenario}] Seeding data generation completed.")
-        # Сохраняем результат
-        self.save(result)
+        Готовит данные сидинга для процесса Locust и сохраняет их в environment.seeds.
+
+        - При локальном запуске данные создаются (если нужно) и загружаются целиком.
+        - При распределённом запуске данные создаёт только мастер: воркеры, сидящие одновременно,
+          состязались бы за чекпоинт и файл дампа. В начале теста мастер сообщает каждому воркеру
+          его номер и общее количество воркеров — это и есть сигнал, что дамп готов. Воркер загружает дамп
+          и оставляет себе только свою часть пользователей, поэтому воркеры не используют одних и тех же.
+        - С SEEDS.BUILD_ON_MASTER мастер рассылает воркерам самих пользователей,
+          так что воркерам не нужен доступ к дампу мастера.
+        - Воркер, подключившийся к уже идущему тесту, запрашивает свою часть сам и получает одну из частей,
+          отложенных мастером через SEEDS.SPARE_WORKERS. Части уже работающих воркеров никому не передаются
+          повторно; если отложенных частей не осталось, воркер получает пустую часть. Пока часть не пришла,
+          виртуальные пользователи воркера ждут её при первом обращении к environment.seeds.
+
+        С SEEDS.USE_ASYNC асинхронный сидер запускается отдельным процессом, поэтому gevent hub
+        процесса Locust он не блокирует.
+
+        :param environment: Окружение Locust из хука events.init.
+        """
+        runner = environment.runner
+
+        if isinstance(runner, MasterRunner):
+            self.build()
+            seeds = self.load() if settings.seeds.build_on_master else None
+
+            # Номер части пользователей, выданной каждому воркеру в текущем тесте
+            shards: dict[str, int] = {}
+            shards_count = 0
+
+            def send_seeds_shard(worker_id: str, index: int) -> None:
+                data = {"index": index, "count": shards_count}
+                if seeds is not None:
+                    shard = seeds.shard(index, shards_count)
+                    data["users"] = [dump_seed_user(user) for user in shard.users]
+                shards[worker_id] = index
+                runner.send_message(SEEDS_SHARD_MESSAGE, data, client_id=worker_id)
+
+            # Сообщения уходят воркерам раньше команды spawn, поэтому виртуальные пользователи
+            # стартуют уже со своей частью данных
+            @environment.events.test_start.add_listener
+            def send_seeds_shards(**kwargs):
+                nonlocal shards_count
+                workers = runner.clients.ready + runner.clients.spawning + runner.clients.running
+                # Части для воркеров, которые подключатся уже во время теста, откладываются заранее
+                shards_count = len(workers) + settings.seeds.spare_workers
+                shards.clear()
+                for index, worker in enumerate(workers):
+                    send_seeds_shard(worker.id, index)
+
+                logger.info(
+                    f"[{self.scenario}] Seeding result is split between {len(workers)} workers, "
+                    f"{settings.seeds.spare_workers} shards are reserved for late workers."
+                )
+
+            def receive_seeds_shard_request(environment: Environment, msg, **kwargs):
+                # Запросы воркеров, подключившихся до начала теста, покрывает рассылка в test_start
+                if runner.state not in (STATE_SPAWNING, STATE_RUNNING) or msg.node_id in shards:
+                    return
+
+                index = len(shards)
+                if index < shards_count:
+                    send_seeds_shard(msg.node_id, index)
+                    logger.info(
+                        f"[{self.scenario}] Late worker {msg.node_id} got reserved shard {index + 1}/{shards_count}."
+                    )
+                    return
+
+                # Чужих пользователей не отдаём, но и не оставляем воркер ждать часть вечно
+                logger.warning(
+                    f"[{self.scenario}] No reserved seeding shards left for late worker {msg.node_id}, "
+                    f"it gets no users. Increase SEEDS.SPARE_WORKERS to reserve more shards."
+                )
+                # -1 — воркер уже получил пустую часть и повторно её не получит
+                shards[msg.node_id] = -1
+                runner.send_message(SEEDS_SHARD_MESSAGE, {"users": []}, client_id=msg.node_id)
+
+            runner.register_message(SEEDS_SHARD_REQUEST_MESSAGE, receive_seeds_shard_request)
+            return
+
+        if isinstance(runner, WorkerRunner):
+            seeds = None
+            pending = PendingSeedsResult()
+
+            def receive_seeds_shard(environment: Environment, msg, **kwargs):
+                nonlocal seeds
+                if "users" in msg.data and settings.seeds.compact:
+                    environment.seeds = CompactSeedsResult.from_dicts(msg.data["users"])
+                elif "users" in msg.data:
+                    environment.seeds = SeedsResult.model_validate({"users": msg.data["users"]})
+                else:
+                    # Дамп загружается один раз, а делится всегда полный результат:
+                    # при перезапуске теста число воркеров могло измениться
+                    if seeds is None:
+                        seeds = self.load()
+                    environment.seeds = seeds.shard(msg.data["index"], msg.data["count"])
+
+                pending.resolve(environment.seeds)
+                logger.info(f"[{self.scenario}] Worker got seeding shard with {len(environment.seeds.users)} users.")
+
+            environment.seeds = pending
+            runner.register_message(SEEDS_SHARD_MESSAGE, receive_seeds_shard)
+            # Воркер мог подключиться уже после рассылки в test_start
+            runner.send_message(SEEDS_SHARD_REQUEST_MESSAGE)
+            return
+
+        self.build()
+        environment.seeds = self.load()
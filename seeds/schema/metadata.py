@@ -0,0 +1,13 @@
+from pydantic import BaseModel
+
+
+class SeedsMetadata(BaseModel):
+    """
+    Метаданные дампа сидинга, сохраняемые рядом с самим дампом.
+
+    Attributes:
+        fingerprint (str): Отпечаток плана сидинга (без количества пользователей) и адреса стенда.
+        users_count (int): Количество пользователей в дампе.
+    """
+    fingerprint: str
+    users_count: int = 0
@@ -1,6 +1,7 @@
-import random
+from pydantic import BaseModel, Field, PrivateAttr
 
-from pydantic import BaseModel, Field
+from config import settings
+from seeds.handout import SeedUsersHandout
 
 
 class SeedCardResult(BaseModel):
@@ -73,17 +74,27 @@ class SeedsResult(BaseModel):
 
     users: list[SeedUserResult] = Field(default_factory=list)
 
+    _handout: SeedUsersHandout = PrivateAttr()
+
+    def model_post_init(self, context):
+        self._handout = SeedUsersHandout(
+            users=self.users,
+            policy=settings.seeds.exhaustion_policy,
+            timeout=settings.seeds.exhaustion_timeout
+        )
+
     def get_next_user(self) -> SeedUserResult:
         """
-        Возвращает и удаляет первого пользователя из списка.
+        Возвращает следующего ещё не выданного пользователя, не изменяя список users.
 
         Используется в случае, когда на каждый виртуальный юзер нужен новый тестовый пользователь.
         Удобно при строго последовательной раздаче пользователей в тестовых сценариях.
+        Поведение при исчерпании пула задаётся настройкой SEEDS.EXHAUSTION_POLICY.
 
         Returns:
             SeedUserResult: Следующий пользователь из списка.
         """
-        return self.users.pop(0)
+        return self._handout.get_next_user()
 
     def get_random_user(self) -> SeedUserResult:
         """
@@ -94,4 +105,29 @@ class SeedsResult(BaseModel):
         Returns:
             SeedUserResult: Случайный пользователь.
         """
-        return random.choice(self.users)
+        return self._handout.get_random_user()
+
+    def shard(self, index: int, count: int) -> 'SeedsResult':
+        """
+        Возвращает часть пользователей, предназначенную воркеру index из count.
+
+        Пользователи распределяются через одного (index, index + count, ...),
+        поэтому воркеры получают непересекающиеся наборы примерно одинакового размера.
+
+        Args:
+            index (int): Номер воркера, начиная с 0.
+            count (int): Общее количество воркеров.
+
+        Returns:
+            SeedsResult: Результат сидинга только с пользователями этого воркера.
+        """
+        return SeedsResult(users=self.users[index::count])
+
+    def release_user(self, user: SeedUserResult):
+        """
+        Возвращает ранее выданного пользователя в пул, чтобы его получил другой виртуальный юзер.
+
+        Args:
+            user (SeedUserResult): Пользователь, полученный через get_next_user.
+        """
+        self._handout.release_user(user)
@@ -1,6 +1,15 @@
+from enum import StrEnum
+
 from pydantic import BaseModel
 
 
+class GRPCCompression(StrEnum):
+    # Без сжатия сообщений
+    NONE = "none"
+    GZIP = "gzip"
+    DEFLATE = "deflate"
+
+
 class GRPCClientConfig(BaseModel):
     # Порт gRPC-сервиса, к которому подключаемся (например, 9003)
     port: int
@@ -8,6 +17,38 @@ class GRPCClientConfig(BaseModel):
     # Хост (например, localhost или grpc-gateway.internal)
     host: str
 
+    # Количество каналов (HTTP/2-соединений) в общем для процесса пуле, по которым распределяются
+    # виртуальные пользователи нагрузочных сценариев. 0 — у каждого виртуального пользователя свой канал
+    channel_pool_size: int = 0
+
+    # Период keepalive-пингов (grpc.keepalive_time_ms) и сколько ждать ответа на пинг,
+    # прежде чем считать соединение разорванным (grpc.keepalive_timeout_ms).
+    # Не задано или пустое значение (GATEWAY_GRPC_CLIENT.KEEPALIVE_TIME_MS=) — значения gRPC по умолчанию
+    keepalive_time_ms: int | None = None
+    keepalive_timeout_ms: int | None = None
+
+    # Максимальный размер отправляемого и принимаемого сообщения в байтах
+    # (grpc.max_send_message_length / grpc.max_receive_message_length).
+    # Не задано или пустое значение — значения gRPC по умолчанию
+    max_send_message_length: int | None = None
+    max_receive_message_length: int | None = None
+
+    # Сжатие сообщений, отправляемых по каналу
+    compression: GRPCCompression = GRPCCompression.NONE
+
+    # Политика балансировки между адресами, в которые разрешился host (например, round_robin).
+    # Не задано или пустое значение — pick_first, все вызовы канала идут на один бэкенд
+    lb_policy_name: str | None = None
+
+    # Локальный пул подканалов: каналы с одинаковыми адресом и параметрами не делят соединение
+    # из глобального пула gRPC. Каналы общего пула (CHANNEL_POOL_SIZE) включают его всегда
+    use_local_subchannel_pool: bool = False
+
+    # Дедлайн в секундах для вызовов, у которых timeout не задан явно: общий и по полным именам методов,
+    # например {"/contracts.services.gateway.users.UsersGatewayService/GetUser": 1.5}
+    timeout: float | None = None
+    method_timeouts: dict[str, float] = {}
+
     @property
     def client_url(self) -> str:
         """
@@ -15,3 +56,18 @@ class GRPCClientConfig(BaseModel):
         который требуется для создания gRPC-канала через insecure_channel().
         """
         return f"{self.host}:{self.port}"
+
+    @property
+    def channel_options(self) -> list[tuple[str, int | str]]:
+        """
+        Возвращает параметры канала (options для insecure_channel()) из заданных настроек.
+        """
+        options: dict[str, int | str | None] = {
+            "grpc.keepalive_time_ms": self.keepalive_time_ms,
+            "grpc.keepalive_timeout_ms": self.keepalive_timeout_ms,
+            "grpc.max_send_message_length": self.max_send_message_length,
+            "grpc.max_receive_message_length": self.max_receive_message_length,
+            "grpc.lb_policy_name": self.lb_policy_name,
+            "grpc.use_local_subchannel_pool": 1 if self.use_local_subchannel_pool else None,
+        }
+        return [(name, value) for name, value in options.items() if value is not None]
@@ -1,6 +1,34 @@
+from enum import StrEnum
+
 from pydantic import BaseModel, HttpUrl
 
 
+class HTTPClientPoolScope(StrEnum):
+    # Каждый API-клиент создаёт собственный httpx.Client со своим пулом соединений
+    CLIENT = "client"
+    # Все API-клиенты одного виртуального пользователя используют один httpx.Client
+    USER = "user"
+    # Все API-клиенты всех виртуальных пользователей процесса используют один httpx.Client
+    PROCESS = "process"
+
+
+class HTTPResponseParsingMode(StrEnum):
+    # Полная валидация ответа pydantic-схемой
+    FULL = "full"
+    # Без валидации: разбор JSON в словари и чтение только тех полей, к которым обращается сценарий
+    LAZY = "lazy"
+    # Тело не разбирается и метод возвращает None, но только в вызовах с discard=True, результат которых
+    # сценарий не использует; остальные ответы разбираются полностью
+    NONE = "none"
+
+
+class HTTPSerializer(StrEnum):
+    # Модуль json для тел запросов, pydantic-core для разбора ответов
+    PYDANTIC = "pydantic"
+    # orjson для тел запросов и разбора ответов
+    ORJSON = "orjson"
+
+
 class HTTPClientConfig(BaseModel):
     # URL сервиса, к которому будем подключаться через httpx
     url: HttpUrl
@@ -8,6 +36,49 @@ class HTTPClientConfig(BaseModel):
     # Таймаут для запросов в секундах (по умолчанию 100)
     timeout: float = 100.0
 
+    # Кто делит между собой один httpx.Client (и его пул соединений) в нагрузочных сценариях
+    pool_scope: HTTPClientPoolScope = HTTPClientPoolScope.USER
+
+    # Лимиты пула соединений httpx.Limits.
+    # Пустое значение (GATEWAY_HTTP_CLIENT.MAX_CONNECTIONS=) — без ограничения
+    max_connections: int | None = 100
+    max_keepalive_connections: int | None = 20
+
+    # Сколько секунд простаивающее keep-alive соединение остаётся в пуле (пустое значение — без ограничения)
+    keepalive_expiry: float | None = 5.0
+
+    # Использовать HTTP/2: для http:// — h2c с prior knowledge, для https:// — через TLS ALPN
+    # (с откатом на HTTP/1.1, если сервер не поддерживает HTTP/2)
+    http2: bool = False
+
+    # Режим разбора ответов в высокоуровневых методах API-клиентов нагрузочных сценариев (get_user, get_operations и др.)
+    # Клиенты сидинга, прогрева и проверки данных всегда разбирают ответы полностью
+    parsing_mode: HTTPResponseParsingMode = HTTPResponseParsingMode.FULL
+
+    # Бэкенд, которым API-клиенты кодируют тела запросов и разбирают ответы
+    serializer: HTTPSerializer = HTTPSerializer.PYDANTIC
+
+    # Кешировать ответы GET-запросов (TTL + LRU, перепроверка по ETag) в клиентах без хуков Locust:
+    # ускоряет сидинг, прогрев и проверку данных. На клиенты нагрузочных сценариев не влияет
+    response_cache: bool = False
+
+    # Время в секундах, в течение которого закешированный ответ отдаётся без запроса к серверу
+    response_cache_ttl: float = 30.0
+
+    # Максимальное количество закешированных ответов на процесс
+    response_cache_max_size: int = 1024
+
+    # Отправлять в Locust разбивку времени ответа по фазам (ожидание пула, соединение, TLS, отправка,
+    # ожидание первого байта, загрузка тела) отдельными записями статистики с типом "<тип запроса> phase"
+    phase_timings: bool = False
+
+    # Собирать тела запросов на создание операций из заранее отрендеренных JSON-шаблонов
+    # вместо создания pydantic-схемы, генерации фейковых данных и model_dump на каждый запрос
+    request_templates: bool = False
+
+    # Количество заранее сгенерированных вариантов тела на каждую схему (фейковые суммы, статусы, категории)
+    request_templates_pool_size: int = 1024
+
     @property
     def client_url(self) -> str:
         """
@@ -20,4 +91,11 @@ class HTTPClientConfig(BaseModel):
         """
         return str(self.url)
 
+    @property
+    def is_tls(self) -> bool:
+        """
+        Возвращает True, если сервис доступен по https.
+        """
+        return self.url.scheme == "https"
+
 
@@ -7,3 +7,10 @@ class LocustUserConfig(BaseModel):
 
     # Максимальное время ожидания между задачами (в секундах)
     wait_time_max: float = 3
+
+    # Накапливать метрики успешных запросов в буфере процесса и периодически сбрасывать их в статистику Locust
+    # вместо события events.request на каждый запрос (ошибки по-прежнему отправляются событием)
+    buffered_metrics: bool = False
+
+    # Период сброса буфера метрик в статистику Locust (в секундах)
+    metrics_flush_interval: float = 1.0
@@ -0,0 +1,64 @@
+from enum import StrEnum
+
+from pydantic import BaseModel
+
+
+class SeedsDumpFormat(StrEnum):
+    # Один JSON-документ на весь результат — читается и валидируется целиком
+    JSON = "json"
+    # Один пользователь на строку — пишется потоково, читается лениво по требованию
+    JSONL = "jsonl"
+    # Бинарный дамп с индексом смещений — открывается через mmap и читается по одному пользователю
+    BINARY = "bin"
+
+
+class SeedsExhaustionPolicy(StrEnum):
+    # Начинать выдачу пользователей сначала
+    WRAP = "wrap"
+    # Ждать, пока какой-нибудь виртуальный пользователь вернёт своего сидингового пользователя
+    BLOCK = "block"
+    # Сразу падать с понятной ошибкой
+    FAIL = "fail"
+
+
+class SeedsConfig(BaseModel):
+    # Количество пользователей, которые сидятся параллельно (1 — строго последовательно)
+    concurrency: int = 1
+
+    # Использовать асинхронный сидер (grpc.aio / httpx.AsyncClient) вместо блокирующего.
+    # Он запускается отдельным процессом без monkey patching gevent (seeds.async_runner)
+    use_async: bool = False
+
+    # Количество пользователей, которые одновременно сидятся асинхронным сидером
+    async_concurrency: int = 100
+
+    # Пересоздавать данные даже при наличии актуального дампа в ./dumps
+    force_rebuild: bool = False
+
+    # Формат дампа сидинга в ./dumps. В отпечаток плана он не входит: при смене формата существующий дамп
+    # конвертируется в новый, а пользователи заново не создаются
+    dump_format: SeedsDumpFormat = SeedsDumpFormat.JSON
+
+    # Поведение get_next_user, когда все пользователи из дампа уже выданы
+    exhaustion_policy: SeedsExhaustionPolicy = SeedsExhaustionPolicy.FAIL
+
+    # Максимальное время ожидания пользователя в секундах для политики block.
+    # Пустое значение (SEEDS.EXHAUSTION_TIMEOUT=) — ждать бесконечно
+    exhaustion_timeout: float | None = 30.0
+
+    # В распределённом запуске данные всегда создаёт мастер. С этой настройкой он ещё и рассылает воркерам
+    # их части по сети. Иначе воркер, получив от мастера сигнал, сам загружает дамп (./dumps должен быть общим
+    # с мастером) и оставляет себе только свою часть пользователей
+    build_on_master: bool = False
+
+    # Сколько частей пользователей мастер откладывает в начале теста для воркеров, которые подключатся
+    # во время теста. Каждая отложенная часть размером с часть обычного воркера; воркер, которому её
+    # не хватило, получает пустую часть
+    spare_workers: int = 0
+
+    # Загружать дамп в компактное хранилище (__slots__-записи и кортежи идентификаторов вместо pydantic-моделей)
+    compact: bool = False
+
+    # Размер пачки пользователей для пакетного сидинга: запросы одного вида по всей пачке выполняются
+    # параллельными волнами (не более concurrency одновременно). 0 — каждый пользователь создаётся целиком
+    batch_size: int = 0
@@ -0,0 +1,99 @@
+import asyncio
+from functools import cache, partial
+from typing import Any, Awaitable, Callable, TypeVar
+
+import gevent
+from gevent.event import AsyncResult
+from gevent.monkey import get_original
+
+T = TypeVar("T")
+
+
+class LocustSelectorEventLoop(asyncio.SelectorEventLoop):
+    """
+    SelectorEventLoop, который резолвит адреса без пула потоков.
+
+    Стандартный getaddrinfo уходит в ThreadPoolExecutor, а его потоки под gevent-патчем —
+    это гринлеты, которые в потоке loop'а никогда не запустятся. Поэтому резолвинг выполняется
+    синхронно оригинальным socket.getaddrinfo: пул соединений httpx переиспользует соединения,
+    так что резолвинг нужен редко.
+    """
+
+    async def getaddrinfo(self, host, port, *, family=0, type=0, proto=0, flags=0):
+        return get_original("socket", "getaddrinfo")(host, port, family, type, proto, flags)
+
+
+class LocustEventLoop:
+    """
+    asyncio event loop, работающий в отдельном системном потоке процесса Locust.
+
+    Locust патчит сокеты и потоки gevent'ом, поэтому поток loop'а запускается через оригинальный
+    _thread.start_new_thread (пропатченный threading.Thread запустил бы гринлет, а не поток),
+    а loop использует оригинальный selectors.DefaultSelector. Гринлеты виртуальных
+    пользователей отправляют в loop корутины и ждут результат, не блокируя gevent hub,
+    а все запросы в полёте обслуживаются одним loop'ом, а не отдельным гринлетом на каждый запрос.
+
+    Attributes:
+        hub: gevent hub основного потока, в который возвращаются результаты и события метрик.
+        loop: asyncio event loop, работающий в отдельном потоке.
+    """
+
+    def __init__(self):
+        self.hub = gevent.get_hub()
+
+        selector_class = get_original("selectors", "DefaultSelector")
+        self.loop = LocustSelectorEventLoop(selector_class())
+
+        start_new_thread = get_original("_thread", "start_new_thread")
+        start_new_thread(self.loop.run_forever, ())
+
+    def run(self, coroutine: Awaitable[T]) -> T:
+        """
+        Выполняет корутину в event loop'е и возвращает её результат.
+
+        Блокируется только вызывающий гринлет: он ждёт gevent AsyncResult, который заполняется
+        по сигналу async-watcher'а hub'а. Watcher же держит hub активным, пока корутина выполняется
+        в другом потоке (иначе gevent посчитал бы ожидание вечным и выбросил LoopExit).
+
+        :param coroutine: Корутина, которую нужно выполнить.
+        :return: Результат корутины; исключение корутины пробрасывается вызывающему.
+        """
+        result = AsyncResult()
+        watcher = self.hub.loop.async_()
+        future = asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+
+        watcher.start(self.set_result, result, future)
+        future.add_done_callback(lambda _: watcher.send())
+        try:
+            return result.get()
+        finally:
+            watcher.close()
+
+    def call_in_hub(self, function: Callable[..., Any], *args, **kwargs) -> None:
+        """
+        Планирует вызов функции в потоке gevent hub.
+
+        Нужен для всего, что трогает состояние Locust (например, environment.events.request.fire):
+        оно не потокобезопасно и должно меняться только из гринлетов основного потока.
+
+        :param function: Функция для вызова.
+        """
+        self.hub.loop.run_callback_threadsafe(partial(function, *args, **kwargs))
+
+    @staticmethod
+    def set_result(result: AsyncResult, future) -> None:
+        exception = future.exception()
+        if exception is not None:
+            result.set_exception(exception)
+        else:
+            result.set(future.result())
+
+
+@cache
+def get_locust_event_loop() -> LocustEventLoop:
+    """
+    Возвращает event loop процесса Locust, создавая его при первом вызове.
+
+    :return: Единственный на процесс экземпляр LocustEventLoop.
+    """
+    return LocustEventLoop()
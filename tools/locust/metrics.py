@@ -0,0 +1,203 @@
+import time
+from collections import Counter, deque
+from functools import cache
+
+import gevent
+from locust import events
+from locust.env import Environment
+from locust.stats import StatsEntry
+
+from config import settings
+
+
+def round_response_time(response_time: float) -> int:
+    """
+    Округляет время ответа так же, как StatsEntry Locust при построении распределения:
+    147 → 147, 3432 → 3400, 58760 → 59000.
+    """
+    if response_time < 100:
+        return round(response_time)
+    if response_time < 1000:
+        return round(response_time, -1)
+    if response_time < 10000:
+        return round(response_time, -2)
+    return round(response_time, -3)
+
+
+def log_breakdown(environment: Environment, request_type: str, name: str, response_time: float, content_length: int) -> None:
+    """
+    Записывает составную часть запроса (фазу HTTP-запроса, сообщение gRPC-потока) в отдельную
+    запись статистики Locust, не затрагивая stats.total.
+
+    Событие events.request здесь не подходит: Locust добавляет каждое такое событие в общую
+    статистику, и один запрос считался бы в Aggregated несколько раз. Записи разбивки видны
+    в таблице и CSV отдельными строками, а на мастер уходят в отчёте воркера вместе с остальными
+    записями. Вызывается только из потока gevent hub'а.
+    """
+    environment.stats.get(name, request_type).log(response_time, content_length)
+
+
+class MetricAccumulator:
+    """
+    Накопитель успешных запросов одного имени между сбросами в статистику Locust.
+
+    На каждый запрос только добавляет время ответа в список и увеличивает счётчики —
+    округление, min/max и распределение считаются пачкой при сбросе.
+    """
+    __slots__ = ("request_type", "name", "response_times", "total_content_length", "num_reqs_per_sec", "last_timestamp")
+
+    def __init__(self, request_type: str, name: str):
+        self.request_type = request_type
+        self.name = name
+        self.response_times: list[float] = []
+        self.total_content_length = 0
+        self.num_reqs_per_sec: dict[int, int] = {}
+        self.last_timestamp = 0.0
+
+    def add(self, response_time: float, content_length: int, timestamp: float | None = None) -> None:
+        now = timestamp or time.time()
+        second = int(now)
+        self.response_times.append(response_time)
+        self.total_content_length += content_length
+        self.num_reqs_per_sec[second] = self.num_reqs_per_sec.get(second, 0) + 1
+        # Запросы из других потоков попадают в накопитель позже своих соседей по времени
+        if now > self.last_timestamp:
+            self.last_timestamp = now
+
+    def drain(self) -> StatsEntry | None:
+        """
+        Переносит накопленные запросы в новый StatsEntry и очищает накопитель.
+
+        :return: StatsEntry с накопленными данными или None, если запросов не было.
+        """
+        if not self.response_times:
+            return None
+
+        response_times, self.response_times = self.response_times, []
+        num_reqs_per_sec, self.num_reqs_per_sec = self.num_reqs_per_sec, {}
+
+        entry = StatsEntry(None, self.name, self.request_type)
+        entry.num_requests = len(response_times)
+        entry.total_response_time = sum(response_times)
+        entry.min_response_time = min(response_times)
+        entry.max_response_time = max(response_times)
+        entry.response_times.update(Counter(map(round_response_time, response_times)))
+        entry.num_reqs_per_sec.update(num_reqs_per_sec)
+        entry.total_content_length, self.total_content_length = self.total_content_length, 0
+        entry.last_request_timestamp = self.last_timestamp
+
+        return entry
+
+
+class MetricsBuffer:
+    """
+    Буфер метрик успешных запросов, который периодически сбрасывается в статистику Locust.
+
+    Вместо environment.events.request.fire на каждый запрос (вызов всех слушателей, передача ответа,
+    построение имени) запрос записывается в заранее созданный накопитель по ключу. Накопители раз
+    в flush_interval секунд (а также перед отправкой отчёта воркера мастеру и при остановке теста)
+    объединяются с environment.stats тем же StatsEntry.extend, которым мастер объединяет отчёты воркеров.
+
+    Ошибки через буфер не проходят: они редки и должны попадать ко всем слушателям
+    events.request, поэтому отправляются обычным событием.
+
+    record вызывается только из потока gevent hub'а. Другие потоки (event loop асинхронных клиентов,
+    см. tools.locust.loop) пишут через record_threadsafe в потокобезопасную очередь, которую hub
+    разбирает пачкой при каждом сбросе, — без межпоточного вызова на каждый запрос.
+
+    Буфер создаётся в events.init (см. init ниже) и сбрасывается ещё и перед отчётом воркера мастеру.
+
+    :param environment: Объект окружения Locust.
+    :param flush_interval: Период сброса накопителей в секундах.
+    """
+
+    def __init__(self, environment: Environment, flush_interval: float):
+        self.environment = environment
+        self.flush_interval = flush_interval
+        self.accumulators: dict[tuple[str, ...], MetricAccumulator] = {}
+        # Запросы из других потоков: (ключ, время ответа, размер ответа, момент записи)
+        self.pending: deque[tuple[tuple[str, ...], float, int, float]] = deque()
+
+        # Слушатель Locust, сериализующий статистику для мастера, зарегистрирован раньше, при создании раннера,
+        # поэтому этот сброс выполняется уже после сериализации. Запросы при этом не теряются: сериализация
+        # обнуляет записи статистики (StatsEntry.get_stripped_report), а сброшенные после неё накопители
+        # уходят мастеру со следующим отчётом. Финальный отчёт воркер отправляет после test_stop,
+        # в котором буфер тоже сбрасывается
+        environment.events.report_to_master.add_listener(self.on_report_to_master)
+        environment.events.test_stop.add_listener(lambda **kwargs: self.flush())
+        gevent.spawn(self.run)
+
+    def on_report_to_master(self, **kwargs) -> None:
+        self.flush()
+
+    def record(
+            self,
+            key: tuple[str, ...],
+            response_time: float,
+            content_length: int,
+            timestamp: float | None = None
+    ) -> None:
+        """
+        Записывает успешный запрос.
+
+        :param key: Тип запроса и части имени, например ("HTTP", "GET", "/api/v1/users/{user_id}").
+            Имя ("GET /api/v1/users/{user_id}") строится один раз при создании накопителя.
+        :param response_time: Время ответа в миллисекундах.
+        :param content_length: Размер ответа в байтах.
+        :param timestamp: Момент запроса (time.time()), если он записан раньше, чем попал в буфер.
+        """
+        accumulator = self.accumulators.get(key)
+        if accumulator is None:
+            accumulator = self.accumulators[key] = MetricAccumulator(key[0], " ".join(key[1:]))
+
+        accumulator.add(response_time, content_length, timestamp)
+
+    def record_threadsafe(self, key: tuple[str, ...], response_time: float, content_length: int) -> None:
+        """
+        Записывает успешный запрос из потока, отличного от gevent hub'а. Параметры — как у record.
+        """
+        self.pending.append((key, response_time, content_length, time.time()))
+
+    def flush(self) -> None:
+        """
+        Переносит все накопленные запросы в environment.stats.
+        """
+        # Забираем запросы, записанные другими потоками, поштучно: deque.popleft потокобезопасен
+        pending = self.pending
+        while pending:
+            self.record(*pending.popleft())
+
+        stats = self.environment.stats
+        for accumulator in list(self.accumulators.values()):
+            entry = accumulator.drain()
+            if entry is None:
+                continue
+
+            stats.get(accumulator.name, accumulator.request_type).extend(entry)
+            stats.total.extend(entry)
+
+    def run(self) -> None:
+        while True:
+            gevent.sleep(self.flush_interval)
+            self.flush()
+
+
+@cache
+def get_metrics_buffer(environment: Environment) -> MetricsBuffer | None:
+    """
+    Возвращает буфер метрик окружения Locust (один на процесс) или None, если буферизация
+    выключена настройкой LOCUST_USER.BUFFERED_METRICS.
+
+    :param environment: Объект окружения Locust.
+    :return: Экземпляр MetricsBuffer или None.
+    """
+    if not settings.locust_user.buffered_metrics:
+        return None
+
+    return MetricsBuffer(environment, settings.locust_user.metrics_flush_interval)
+
+
+@events.init.add_listener
+def init(environment: Environment, **kwargs):
+    # Буфер создаётся до старта теста, чтобы его сброс был зарегистрирован раньше первого отчёта мастеру
+    get_metrics_buffer(environment)
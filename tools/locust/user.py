@@ -1,6 +1,12 @@
+from typing import Awaitable, TypeVar
+
 from locust import User, between
 
 from config import settings  # ← импорт глобального объекта настроек
+from tools.locust.loop import LocustEventLoop, get_locust_event_loop
+
+T = TypeVar("T")
+
 
 class LocustBaseUser(User):
     """
@@ -12,4 +18,30 @@ class LocustBaseUser(User):
     wait_time = between(
         min_wait=settings.locust_user.wait_time_min,
         max_wait=settings.locust_user.wait_time_max
-    )
\ No newline at end of file
+    )
+
+
+class AsyncLocustBaseUser(LocustBaseUser):
+    """
+    Базовый виртуальный пользователь для асинхронных сценариев.
+
+    Запросы пользователя выполняются в общем для процесса event loop'е (LocustEventLoop),
+    а гринлет пользователя только ждёт их результат.
+
+    run_coroutine блокирует гринлет пользователя до завершения корутины: пока задача не выполнена,
+    следующая задача этого пользователя не начнётся (другие пользователи при этом работают).
+    Поэтому запросы одного пользователя выполняются одновременно только внутри одной задачи —
+    через asyncio.gather и подобные средства asyncio.
+    """
+    abstract = True
+
+    @property
+    def loop(self) -> LocustEventLoop:
+        return get_locust_event_loop()
+
+    def run_coroutine(self, coroutine: Awaitable[T]) -> T:
+        """
+        Выполняет корутину в event loop'е процесса и возвращает её результат.
+        Гринлет пользователя ждёт завершения корутины.
+        """
+        return self.loop.run(coroutine)